@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 Script pour ajouter un job de scraping à la queue
-Usage: python add_job.py fichier.json [--priority 1-10]
+Usage: python add_job.py fichier.json [--priority 1-10] [--stop-policies contact_and_social,no_new_results]
 """
 
 import json
@@ -10,8 +10,10 @@ import sys
 from datetime import datetime
 import argparse
 
+from stop_policies import parse_stop_policies
 
-def add_job(json_file: str, priority: int = 5, user: str = "default"):
+
+def add_job(json_file: str, priority: int = 5, user: str = "default", stop_policies=None):
     """
     Ajoute un job à la queue
     
@@ -19,6 +21,10 @@ def add_job(json_file: str, priority: int = 5, user: str = "default"):
         json_file: Chemin vers le fichier JSON
         priority: Priorité (1=haute, 10=basse)
         user: Nom de l'utilisateur
+        stop_policies: Politiques d'arrêt anticipé des sites (None = config, [] = exploration complète)
+    
+    Returns:
+        True si le job a été ajouté, False si le fichier ou les politiques d'arrêt sont invalides
     """
     # Vérifier que le fichier existe
     if not os.path.exists(json_file):
@@ -30,6 +36,14 @@ def add_job(json_file: str, priority: int = 5, user: str = "default"):
         print(f"Erreur: Le fichier doit être un JSON (.json)")
         return False
     
+    # Vérifier les politiques d'arrêt maintenant plutôt qu'au lancement du job par le worker
+    if stop_policies is not None:
+        try:
+            stop_policies = parse_stop_policies(stop_policies)
+        except ValueError as e:
+            print(f"Erreur: {e}")
+            return False
+    
     # Créer l'ID du job (timestamp)
     job_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
     
@@ -40,6 +54,7 @@ def add_job(json_file: str, priority: int = 5, user: str = "default"):
         "json_file": os.path.abspath(json_file),
         "status": "pending",
         "priority": priority,
+        "stop_policies": stop_policies,
         "created_at": datetime.now().isoformat(),
         "started_at": None,
         "completed_at": None,
@@ -61,6 +76,8 @@ def add_job(json_file: str, priority: int = 5, user: str = "default"):
     print(f"Fichier: {json_file}")
     print(f"Priorite: {priority}")
     print(f"User: {user}")
+    if stop_policies is not None:
+        print(f"Arret anticipe: {stop_policies or 'aucun (exploration complete)'}")
     print(f"{'='*80}")
     print(f"\nLe worker traitera ce job automatiquement.")
     print(f"Verifiez l'etat avec: python monitor.py")
@@ -75,8 +92,17 @@ if __name__ == '__main__':
     parser.add_argument('--priority', type=int, default=5, choices=range(1, 11),
                         help='Priorité du job (1=haute, 10=basse), défaut=5')
     parser.add_argument('--user', default='default', help='Nom de l\'utilisateur')
+    parser.add_argument('--stop-policies', default=None,
+                        help='Politiques d\'arrêt anticipé séparées par des virgules '
+                             '(contact_and_social, no_new_results) ; par défaut SITE_STOP_POLICIES '
+                             '(aucune : exploration complète)')
     
     args = parser.parse_args()
     
-    add_job(args.json_file, args.priority, args.user)
+    stop_policies = None
+    if args.stop_policies is not None:
+        stop_policies = [name.strip() for name in args.stop_policies.split(',') if name.strip()]
+    
+    if not add_job(args.json_file, args.priority, args.user, stop_policies):
+        sys.exit(1)
 
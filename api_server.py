@@ -16,6 +16,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from add_job import add_job as add_job_func
+from stop_policies import STOP_POLICY_NAMES, parse_stop_policies
 
 app = Flask(__name__)
 CORS(app)  # Permettre les requêtes cross-origin
@@ -72,13 +73,21 @@ def create_job():
     json_file = data.get('json_file')
     priority = data.get('priority', 5)
     user = data.get('user', 'API')
+    stop_policies = data.get('stop_policies')
     
     if not json_file:
         return jsonify({'error': 'json_file requis'}), 400
     
+    # Politiques d'arrêt vérifiées dès la soumission (pas au lancement du job)
+    if stop_policies is not None:
+        try:
+            stop_policies = parse_stop_policies(stop_policies)
+        except ValueError as e:
+            return jsonify({'error': str(e), 'valid_stop_policies': STOP_POLICY_NAMES}), 400
+    
     # Ajouter le job
     try:
-        success = add_job_func(json_file, priority, user)
+        success = add_job_func(json_file, priority, user, stop_policies)
         
         if success:
             return jsonify({
@@ -86,7 +95,8 @@ def create_job():
                 'message': 'Job ajouté à la queue',
                 'json_file': json_file,
                 'priority': priority,
-                'user': user
+                'user': user,
+                'stop_policies': stop_policies
             })
         else:
             return jsonify({'error': 'Erreur lors de l\'ajout du job'}), 500
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks de l'extraction (pages/seconde)
+Usage: python benchmark.py [parsers|emails|domains] [fichier.html]
+"""
+
+import re
+import sys
+import time
+from urllib.parse import urljoin
+
+from extractors import EmailExtractor, SocialMediaExtractor
+from parsing import ParsedPage, available_parsers
+from config import HTML_SECTIONS
+from utils import clean_email, is_valid_email, is_same_domain, TLD_EXTRACTOR, _domain_of_host
+
+DEFAULT_HTML_FILE = 'test_site.html'
+DEFAULT_URL = 'https://retravailler-np.org/'
+
+
+def measure_rate(func, min_duration: float = 2.0, min_runs: int = 3) -> float:
+    """
+    Mesure le nombre d'exécutions par seconde d'une fonction
+
+    Args:
+        func: Fonction à mesurer (sans argument)
+        min_duration: Durée minimale de mesure en secondes
+        min_runs: Nombre minimal d'exécutions
+
+    Returns:
+        Exécutions par seconde
+    """
+    runs = 0
+    start = time.perf_counter()
+    while runs < min_runs or time.perf_counter() - start < min_duration:
+        func()
+        runs += 1
+    return runs / (time.perf_counter() - start)
+
+
+def extract_all(html: str, url: str, parser: str):
+    """Parse une page puis lance les deux extracteurs (comme scrape_site)"""
+    page = ParsedPage(html, url, parser=parser)
+    emails = EmailExtractor(url).extract_emails_from_html(page, url)
+    social = SocialMediaExtractor().extract_social_media(page, url)
+    return emails, social
+
+
+def bench_parsers(html_file: str, url: str = DEFAULT_URL):
+    """
+    Compare les moteurs de parsing installés sur une page
+
+    Args:
+        html_file: Fichier HTML de test
+        url: URL attribuée à la page (domaine pour le filtrage des emails)
+    """
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    # Référence : html.parser (toujours disponible, moteur historique)
+    reference = extract_all(html, url, 'html.parser')
+
+    print(f"\n{'='*80}")
+    print(f"MOTEURS DE PARSING - {html_file} ({len(html)} caractères)")
+    print(f"{'='*80}")
+
+    for parser in available_parsers():
+        parse_rate = measure_rate(lambda: ParsedPage(html, url, parser=parser))
+        full_rate = measure_rate(lambda: extract_all(html, url, parser))
+        identical = extract_all(html, url, parser) == reference
+
+        print(f"{parser:<12} parsing: {parse_rate:7.1f} pages/s   "
+              f"parsing + extraction: {full_rate:6.1f} pages/s   "
+              f"résultats: {'identiques' if identical else 'DIFFÉRENTS'}")
+
+    print(f"{'='*80}\n")
+
+
+def legacy_email_scan(text: str):
+    """Ancienne recherche : un re.finditer par pattern de EMAIL_PATTERNS"""
+    return [
+        match.group(0)
+        for pattern in EmailExtractor.EMAIL_PATTERNS
+        for match in re.finditer(pattern, text, re.IGNORECASE)
+    ]
+
+
+def unified_email_scan(text: str):
+    """Recherche actuelle : scanner unique avec préfiltre"""
+    return [raw_email for raw_email, _, _ in EmailExtractor.scan(text)]
+
+
+def valid_emails(raw_emails) -> set:
+    """Emails valides (après nettoyage) parmi les correspondances brutes"""
+    return {email for email in map(clean_email, raw_emails) if is_valid_email(email)}
+
+
+def bench_emails(html_file: str, url: str = DEFAULT_URL):
+    """
+    Compare l'ancienne recherche d'emails (4 passes) au scanner unique
+
+    Les textes scannés sont ceux d'une extraction : texte visible, sections,
+    attributs et HTML brut.
+
+    Args:
+        html_file: Fichier HTML de test
+        url: URL attribuée à la page (domaine pour le filtrage des emails)
+    """
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    page = ParsedPage(html, url)
+    sections = [
+        element.get_text()
+        for selectors in HTML_SECTIONS.values()
+        for selector in selectors
+        for element in page.soup.select(selector)
+    ]
+    attributes = [value for _, _, value in page.attributes if '@' in value]
+    texts = [page.text, html] + sections + attributes
+
+    legacy_rate = measure_rate(lambda: [legacy_email_scan(text) for text in texts])
+    unified_rate = measure_rate(lambda: [unified_email_scan(text) for text in texts])
+    full_rate = measure_rate(lambda: EmailExtractor(url).extract_emails_from_html(page, url))
+
+    legacy_found = valid_emails(email for text in texts for email in legacy_email_scan(text))
+    unified_found = valid_emails(email for text in texts for email in unified_email_scan(text))
+
+    print(f"\n{'='*80}")
+    print(f"RECHERCHE D'EMAILS - {html_file} ({len(texts)} textes, {sum(map(len, texts))} caractères)")
+    print(f"{'='*80}")
+    print(f"4 passes (EMAIL_PATTERNS): {legacy_rate:8.1f} pages/s")
+    print(f"Scanner unique:            {unified_rate:8.1f} pages/s   (x{unified_rate / legacy_rate:.1f})")
+    print(f"Extraction complète:       {full_rate:8.1f} pages/s (page déjà parsée)")
+    print(f"Emails valides: {len(unified_found)} "
+          f"({'identiques' if unified_found == legacy_found else f'DIFFÉRENTS : {sorted(unified_found ^ legacy_found)}'})")
+    print(f"{'='*80}\n")
+
+
+def bench_domains(html_file: str, url: str = DEFAULT_URL):
+    """
+    Mesure is_same_domain sur les liens d'une page (comme find_important_links)
+
+    Args:
+        html_file: Fichier HTML de test
+        url: URL attribuée à la page (base des liens relatifs)
+    """
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    page = ParsedPage(html, url)
+    links = [urljoin(url, link['href']) for link in page.anchors]
+
+    def uncached():
+        # Un calcul de suffixe public par appel, comme avant la mémoïsation
+        for link in links:
+            TLD_EXTRACTOR(link) == TLD_EXTRACTOR(url)
+
+    def cached():
+        for link in links:
+            is_same_domain(link, url)
+
+    _domain_of_host.cache_clear()
+    cold_start = time.perf_counter()
+    cached()
+    cold_rate = len(links) / (time.perf_counter() - cold_start)
+
+    uncached_rate = measure_rate(uncached) * len(links)
+    cached_rate = measure_rate(cached) * len(links)
+
+    print(f"\n{'='*80}")
+    print(f"DOMAINES - {html_file} ({len(links)} liens, {_domain_of_host.cache_info().currsize} hôtes)")
+    print(f"{'='*80}")
+    print(f"Premier passage:  {cold_rate:10.0f} liens/s (chargement des suffixes publics, cache vide)")
+    print(f"Sans cache:       {uncached_rate:10.0f} liens/s")
+    print(f"Avec cache:       {cached_rate:10.0f} liens/s   (x{cached_rate / uncached_rate:.1f})")
+    print(f"{'='*80}\n")
+
+
+BENCHMARKS = {
+    'parsers': bench_parsers,
+    'emails': bench_emails,
+    'domains': bench_domains,
+}
+
+
+if __name__ == '__main__':
+    names = [arg for arg in sys.argv[1:] if arg in BENCHMARKS] or list(BENCHMARKS)
+    files = [arg for arg in sys.argv[1:] if arg not in BENCHMARKS] or [DEFAULT_HTML_FILE]
+
+    for name in names:
+        for html_file in files:
+            BENCHMARKS[name](html_file)
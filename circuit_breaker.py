@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Coupe-circuit par hôte : détection des sites morts et cache négatif du job
+
+Un site dont le DNS n'existe pas ou qui refuse les connexions ne répondra
+sur aucune de ses pages : inutile d'épuiser les URLs candidates, les retries
+et le timeout global du site. Le premier échec fatal ouvre le circuit de
+l'hôte, et les autres sites du job sur le même hôte sont ignorés aussitôt.
+
+Les circuits sont tenus par origine (schéma + hôte + port) : un échec TLS en
+https ne condamne pas le même hôte en http.
+"""
+
+import logging
+import socket
+import ssl
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from config import CIRCUIT_TIMEOUT_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Échecs qui ouvrent le circuit dès la première occurrence
+FATAL_FAILURES = {'nxdomain', 'refused', 'tls'}
+
+# Codes getaddrinfo d'un nom inexistant (EAI_AGAIN = panne DNS passagère, traitée comme un délai)
+NXDOMAIN_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+
+def circuit_key(url: str) -> str:
+    """Origine d'une URL (clé du circuit), ex: 'https://www.example.fr'"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}"
+
+
+def classify_failure(error: BaseException) -> str:
+    """
+    Classe l'erreur d'une requête HTTP
+    
+    La cause réelle (socket.gaierror, ConnectionRefusedError, ssl.SSLError)
+    est cherchée dans la chaîne des exceptions httpx/httpcore.
+    
+    Args:
+        error: Exception levée par la requête
+    
+    Returns:
+        'nxdomain', 'refused', 'tls', 'timeout' (connexion ou DNS), 'read_timeout'
+        (réponse trop lente), 'reset' (connexion coupée, réponse invalide) ou 'other'
+    """
+    if isinstance(error, httpx.ConnectTimeout):
+        return 'timeout'
+    
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, socket.gaierror):
+            return 'nxdomain' if current.errno in NXDOMAIN_ERRORS else 'timeout'
+        if isinstance(current, ConnectionRefusedError):
+            return 'refused'
+        if isinstance(current, (ssl.SSLError, ssl.CertificateError)):
+            return 'tls'
+        current = current.__cause__ or current.__context__
+    
+    if isinstance(error, httpx.TimeoutException):
+        return 'read_timeout'
+    if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+        return 'reset'
+    return 'other'
+
+
+class CircuitBreaker:
+    """Circuits des hôtes d'un job (ouvert = hôte considéré comme mort)"""
+    
+    def __init__(self, timeout_threshold: int = CIRCUIT_TIMEOUT_THRESHOLD):
+        """
+        Initialise le coupe-circuit (tous les circuits fermés)
+        
+        Args:
+            timeout_threshold: Délais de connexion dépassés consécutifs avant d'ouvrir le circuit
+        """
+        self.timeout_threshold = timeout_threshold
+        # Cache négatif du job : origine -> raison de l'ouverture du circuit
+        self.dead_hosts: Dict[str, str] = {}
+        self._timeouts: Dict[str, int] = {}
+    
+    def dead_reason(self, url: str) -> Optional[str]:
+        """Raison pour laquelle l'hôte de l'URL est mort, None si son circuit est fermé"""
+        return self.dead_hosts.get(circuit_key(url))
+    
+    def record_failure(self, url: str, error: BaseException) -> str:
+        """
+        Enregistre l'échec d'une requête
+        
+        Args:
+            url: URL de la requête
+            error: Exception levée
+        
+        Returns:
+            Type d'échec (voir classify_failure)
+        """
+        host = circuit_key(url)
+        failure = classify_failure(error)
+        
+        if failure == 'timeout':
+            self._timeouts[host] = self._timeouts.get(host, 0) + 1
+            if self._timeouts[host] < self.timeout_threshold:
+                return failure
+        elif failure not in FATAL_FAILURES:
+            return failure
+        
+        if host not in self.dead_hosts:
+            self.dead_hosts[host] = failure
+            logger.warning(f"Hôte injoignable ({failure}), circuit ouvert: {host}")
+        return failure
+    
+    def record_success(self, url: str):
+        """Remet à zéro les délais dépassés de l'hôte d'une URL qui a répondu (et referme son circuit)"""
+        host = circuit_key(url)
+        self._timeouts.pop(host, None)
+        # Hôte seulement lent (passe de reprise) : il n'est plus considéré comme mort
+        if self.dead_hosts.get(host) == 'timeout':
+            del self.dead_hosts[host]
+            logger.info(f"Hôte de nouveau joignable, circuit refermé: {host}")
@@ -45,17 +45,75 @@ EMAIL_PROVIDERS = [
 # Timeouts et délais (OPTIMISÉ POUR VITESSE)
 TIMEOUT = 10  # secondes (réduit de 15 à 10)
 DELAY_BETWEEN_REQUESTS = 0.1  # secondes entre chaque requête (RÉDUIT à 0.1 pour vitesse)
-MAX_RETRIES = 2  # réduit de 3 à 2
-BACKOFF_FACTOR = 2  # facteur multiplicateur pour retry
+MAX_RETRIES = 2  # nouveaux essais d'une page en échec passager (passe de reprise)
 
 # Limites de crawling (OPTIMISÉ)
 MAX_PAGES_PER_SITE = 7  # 7 pages pour qualité optimale
 MAX_DEPTH = 2
 MAX_CONCURRENT_SITES = 15  # 15 sites en parallèle (gain 50% vitesse)
+PAGES_IN_FLIGHT_PER_SITE = 3  # pages d'un même site récupérées en parallèle (1 = séquentiel)
+WORKER_PROCESSES = 1  # processus de scraping par job, MAX_CONCURRENT_SITES chacun (ex: os.cpu_count())
+
+# Arrêt anticipé du crawl d'un site (politique par défaut, modifiable par job) :
+# 'contact_and_social' = un email de contact du site + au moins un réseau social,
+# 'no_new_results' = SITE_STOP_IDLE_PAGES pages consécutives sans nouvel email ni réseau.
+# [] = exploration complète (seuls MAX_PAGES_PER_SITE et SITE_TIMEOUT arrêtent le site) :
+# valeur par défaut, les jobs activent les politiques voulues (ex: --stop-policies contact_and_social)
+SITE_STOP_POLICIES = []
+SITE_STOP_IDLE_PAGES = 2  # pages consécutives sans nouveauté avant arrêt ('no_new_results')
+CONTACT_EMAIL_TYPES = ['contact_general', 'service_client', 'commercial']  # types comptant comme email de contact
 
 # Timeout global par site
 SITE_TIMEOUT = 30  # secondes
 
+# Pool de connexions HTTP (client unique partagé par tous les sites)
+MAX_CONNECTIONS = 100  # connexions simultanées max, tous hôtes confondus
+MAX_KEEPALIVE_CONNECTIONS = 50  # connexions inactives gardées pour réutilisation
+KEEPALIVE_EXPIRY = 15  # secondes avant fermeture d'une connexion inactive
+MAX_CONNECTIONS_PER_HOST = 4  # requêtes simultanées max vers un même hôte
+
+# Cache DNS partagé par les sites et les jobs du processus, et préchargement des sites suivants
+DNS_CACHE_TTL = 300  # secondes de validité d'une résolution
+DNS_NEGATIVE_TTL = 60  # secondes de validité d'un nom inexistant
+DNS_CACHE_MAX_ENTRIES = 10000  # au-delà, les entrées expirées sont purgées
+HAPPY_EYEBALLS_DELAY = 0.25  # secondes avant d'essayer en parallèle l'adresse suivante d'un hôte (IPv6/IPv4)
+PREFETCH_SITES = 5  # sites suivants de la file résolus (et préconnectés) à l'avance (0 = désactivé)
+PRECONNECT = True  # ouvre aussi la connexion (HEAD sur l'accueil, gardée dans le pool keep-alive)
+
+# Coupe-circuit par hôte : un échec fatal (DNS inexistant, connexion refusée, TLS) abandonne
+# le site aussitôt, et l'hôte est ignoré pour le reste du job
+CIRCUIT_TIMEOUT_THRESHOLD = 2  # délais de connexion dépassés consécutifs avant de déclarer l'hôte mort
+
+# Limiteur de débit partagé : seaux à jetons par hôte (débit 1 / DELAY_BETWEEN_REQUESTS) et par
+# adresse IP (sites sur un même serveur, limitée seulement après un 429/503). Un 429/503 divise
+# le débit de l'hôte et le bloque pendant le Retry-After, chaque réponse normale le fait remonter
+THROTTLE_STATUSES = [429, 503]  # réponses signalant une limitation de débit
+RATE_LIMIT_HOST_BURST = 1  # requêtes d'affilée vers un hôte
+RATE_LIMIT_IP_RATE = 20  # requêtes par seconde vers une IP qui a répondu 429/503 (plafond, sans limite avant)
+RATE_LIMIT_IP_BURST = 5  # requêtes d'affilée vers une IP limitée
+RATE_LIMIT_MIN_RATE = 0.2  # débit plancher après ralentissements (requêtes par seconde)
+RATE_LIMIT_DECREASE = 0.5  # facteur appliqué au débit à chaque 429/503
+RATE_LIMIT_RECOVERY = 0.1  # part du débit nominal regagnée à chaque réponse normale
+RATE_LIMIT_DEFER_WAIT = 1  # secondes d'attente d'un jeton au plus : au-delà, la page est reportée à la reprise
+RATE_LIMIT_MAX_WAIT = 10  # secondes de blocage de l'hôte : au-delà, le site est abandonné et cède sa place
+
+# Passe de reprise : les pages en échec passager (délai dépassé, connexion coupée, 5xx, 429/503)
+# sont réessayées une fois la passe principale lancée, sans retenir l'emplacement de leur site
+RETRY_CONCURRENCY = 5  # pages réessayées en parallèle
+RETRY_TIMEOUT = 20  # secondes par requête (plus long que TIMEOUT)
+RETRY_MAX_WAIT = 60  # secondes de Retry-After attendues au plus avant de réessayer une page (au-delà, échec)
+
+# Sondes des pages devinées (HEAD si l'hôte le gère, sinon GET en streaming)
+HEAD_UNRELIABLE_STATUSES = [405, 501]  # réponses HEAD (méthode non gérée) => hôte passé en GET
+PROBE_DRAIN_BYTES = 16384  # corps d'erreur lus (connexion réutilisable) en dessous de cette taille
+
+# Téléchargement des pages (streaming)
+MAX_PAGE_BYTES = 2 * 1024 * 1024  # au-delà, la page est tronquée (mémoire et bande passante bornées)
+HTML_CONTENT_TYPES = ['text/html', 'application/xhtml+xml']  # autres types ignorés avant lecture du corps
+CHARSET_SNIFF_BYTES = 4096  # octets inspectés pour trouver un <meta charset>
+FALLBACK_ENCODINGS = ['windows-1252', 'iso-8859-15']  # essayés si ni charset déclaré ni UTF-8 valide
+SCAN_RAW_BYTES = True  # recherches regex dans le HTML brut faites sur les octets (sans re-décodage)
+
 # Pages à chercher (ordre de priorité)
 PAGES_TO_SCRAPE = [
     '/',  # Page d'accueil
@@ -67,10 +125,79 @@ PAGES_TO_SCRAPE = [
     '/legal-notice',
 ]
 
+# Découverte des pages via robots.txt et sitemap.xml : les pages importantes listées
+# remplacent les sondes de PAGES_TO_SCRAPE (repli sur les sondes si le sitemap n'en donne pas)
+SITEMAP_DISCOVERY = False  # optionnel : une requête robots.txt et quelques sitemaps de plus par site
+SITEMAP_PATHS = ['/sitemap.xml']  # essayés si robots.txt ne déclare aucun sitemap
+SITEMAP_MAX_BYTES = 1024 * 1024  # octets lus au total par site (robots.txt + sitemaps décompressés)
+SITEMAP_MAX_FILES = 4  # fichiers sitemap lus au plus par site (index compris)
+SITEMAP_MAX_PAGES = 5  # pages importantes retenues dans les sitemaps
+
+# Priorisation apprise des pages (rendement historique des chemins, voir path_stats.py)
+PATH_STATS_FILE = 'results/path_stats.json'  # statistiques persistées (None = pas d'apprentissage)
+PATH_STATS_SCOPES = ['cms', 'tld', 'global']  # portées consultées, de la plus spécifique à la plus générale
+PATH_STATS_MIN_TRIES = 20  # essais d'un chemin avant de se fier à son rendement
+PATH_STATS_PRUNE_BELOW = 0.02  # pages devinées (PAGES_TO_SCRAPE) abandonnées sous ce rendement
+PATH_STATS_EXPLORE_RATE = 0.05  # probabilité de tenter quand même une page devinée abandonnée
+PATH_STATS_MAX_TRIES = 1000  # au-delà, compteurs du chemin divisés par deux à la sauvegarde (oubli progressif)
+
+# Signatures des CMS dans le HTML de la page d'accueil (portée 'cms' des statistiques)
+CMS_SIGNATURES = {
+    'wordpress': ['/wp-content/', '/wp-includes/'],
+    'wix': ['static.wixstatic.com', 'wix.com'],
+    'shopify': ['cdn.shopify.com'],
+    'squarespace': ['squarespace.com'],
+    'webflow': ['webflow.com'],
+    'prestashop': ['prestashop'],
+    'joomla': ['/media/jui/', 'joomla'],
+    'drupal': ['/sites/default/files/', 'drupal'],
+}
+
 # Patterns pour détecter les liens importants
 IMPORTANT_LINK_PATTERNS = [
-    r'(?i)(contact|mention|legal|cgv|cgu|condition|privacy|privac|rgpd|about|propos|qui-sommes)',
+    r'(?i)(contact|joindre|mention|legal|cgv|cgu|condition|privacy|privac|rgpd|about|propos|qui-sommes)',
+]
+
+# Frontière de crawl : score des pages candidates (la mieux notée est visitée en premier)
+LINK_SCORE_URL = 2.0  # URL correspondant à IMPORTANT_LINK_PATTERNS
+LINK_SCORE_ANCHOR = 1.5  # texte du lien correspondant à IMPORTANT_LINK_PATTERNS
+LINK_SCORE_SECTIONS = {'footer': 1.0, 'contact': 1.0, 'header': 0.5}  # lien placé dans une de ces sections
+LINK_SCORE_KEYWORDS = [  # bonus du premier groupe de mots présent dans l'URL ou le texte du lien
+    (['contact', 'joindre', 'coordonnee'], 2.0),
+    (['mention', 'legal'], 1.0),
+    (['propos', 'about', 'qui-sommes'], 0.5),
 ]
+LINK_SCORE_DEPTH_PENALTY = 0.2  # par niveau de chemin au-delà du premier ('/blog/2021/...')
+SPECULATIVE_SCORE_PENALTY = 1.0  # pages devinées (PAGES_TO_SCRAPE), qui n'existent souvent pas
+PATH_YIELD_WEIGHT = 3.0  # bonus = rendement historique du chemin (0 à 1, voir path_stats.py) x ce poids
+
+# Pages en double et fausses 404 (réponses 200 qui sont l'accueil ou un gabarit « page introuvable ») :
+# ni extraites, ni comptées dans MAX_PAGES_PER_SITE
+NEAR_DUPLICATE_THRESHOLD = 0.95  # similarité estimée (Jaccard) à partir de laquelle une page est un doublon
+FINGERPRINT_SHINGLE_WORDS = 4  # mots par fragment de texte comparé
+FINGERPRINT_SKETCH_SIZE = 128  # empreintes de fragments gardées par page (MinHash bottom-k)
+# Phrases d'erreur cherchées dans le titre ou le premier <h1> (un « 404 » seul ne compte que s'il est tout le titre :
+# 'Garage Peugeot 404 – Contact' est une vraie page)
+SOFT_404_MARKERS = [
+    'erreur 404', 'error 404', '404 error', '404 not found', 'page introuvable', 'page non trouvée',
+    'page not found', "page n'existe pas", "page n'existe plus", 'page inexistante'
+]
+
+# Extraction dans un pool de processus (0 = extraction dans la boucle asyncio)
+EXTRACTION_WORKERS = 0  # ex: os.cpu_count() pour utiliser tous les cœurs
+EXTRACTION_BATCH_SIZE = 4  # pages envoyées ensemble à un processus
+EXTRACTION_BATCH_DELAY = 0.005  # secondes d'attente max pour compléter un lot
+EXTRACTION_MIN_CHARS = 50000  # pages plus petites extraites dans la boucle (IPC plus coûteux)
+
+# Moteur de parsing HTML : 'auto' (le plus rapide installé), 'lxml' ou 'html.parser'
+HTML_PARSER = 'auto'
+
+# Extraction d'emails : 'fast' (méthodes par coût croissant, arrêt dès qu'un email
+# du domaine du site est trouvé) ou 'thorough' (toutes les méthodes, pour les audits)
+EMAIL_EXTRACTION_MODE = 'fast'
+
+# Cache des domaines principaux (noms d'hôte mémorisés, suffixes publics hors ligne)
+DOMAIN_CACHE_SIZE = 10000
 
 # Sections HTML prioritaires
 HTML_SECTIONS = {
@@ -111,6 +238,13 @@ SOCIAL_NETWORKS = {
     ],
 }
 
+# Domaines des réseaux sociaux (préfiltre rapide : doit couvrir ceux de SOCIAL_NETWORKS)
+SOCIAL_HOSTS = [
+    'facebook.com', 'fb.com', 'fb.me', 'instagram.com', 'twitter.com', 'x.com',
+    'linkedin.com', 'youtube.com', 'tiktok.com', 'wa.me', 'api.whatsapp.com',
+    't.me', 'telegram.me',
+]
+
 # Headers HTTP
 HTTP_HEADERS = {
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
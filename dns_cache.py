@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+"""
+Cache DNS asynchrone partagé par tous les sites et tous les jobs d'un processus
+
+Sans cache, chaque nouveau site paie sa résolution DNS avant la connexion.
+Les adresses sont gardées DNS_CACHE_TTL secondes (les noms inexistants
+DNS_NEGATIVE_TTL secondes), et les résolutions simultanées d'un même nom ne
+font qu'une seule requête. Le cache est branché sur le client httpx par un
+transport dont le pool httpcore utilise un backend réseau qui résout les noms
+via le cache (connexion TCP vers l'adresse résolue, SNI inchangé).
+"""
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+import socket
+import ssl
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import httpcore
+import httpx
+
+from config import DNS_CACHE_TTL, DNS_NEGATIVE_TTL, DNS_CACHE_MAX_ENTRIES, HAPPY_EYEBALLS_DELAY
+
+logger = logging.getLogger(__name__)
+
+# Codes getaddrinfo d'un nom inexistant, mis en cache négatif (EAI_AGAIN = panne passagère, non gardée)
+NEGATIVE_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+
+def _is_ip_address(host: str) -> bool:
+    """Vérifie si l'hôte est déjà une adresse IP (rien à résoudre)"""
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+        return True
+    except ValueError:
+        return False
+
+
+def _interleave_families(addresses: List[str]) -> List[str]:
+    """Alterne IPv6 et IPv4 en gardant l'ordre de getaddrinfo (la première famille commence)"""
+    first_v6 = ':' in addresses[0]
+    first = [address for address in addresses if (':' in address) == first_v6]
+    second = [address for address in addresses if (':' in address) != first_v6]
+    ordered = []
+    for index in range(max(len(first), len(second))):
+        ordered.extend(family[index] for family in (first, second) if index < len(family))
+    return ordered
+
+
+async def _cancel_attempts(attempts: Iterable[asyncio.Task]):
+    """Annule les tentatives de connexion restantes (et ferme celles qui ont abouti entre-temps)"""
+    attempts = list(attempts)
+    for task in attempts:
+        task.cancel()
+    for result in await asyncio.gather(*attempts, return_exceptions=True):
+        if isinstance(result, httpcore.AsyncNetworkStream):
+            await result.aclose()
+
+
+class DNSCache:
+    """Résolutions DNS avec durée de vie, partagées par toutes les requêtes du processus"""
+    
+    def __init__(self, ttl: float = DNS_CACHE_TTL, negative_ttl: float = DNS_NEGATIVE_TTL,
+                 max_entries: int = DNS_CACHE_MAX_ENTRIES):
+        """
+        Initialise un cache vide
+        
+        Args:
+            ttl: Durée de vie d'une résolution réussie (secondes)
+            negative_ttl: Durée de vie d'un nom inexistant (secondes)
+            max_entries: Taille au-delà de laquelle les entrées expirées sont purgées
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        # hôte -> (expiration, adresses ou (errno, message) d'un nom inexistant)
+        self._entries: Dict[str, Tuple[float, Union[List[str], Tuple[int, str]]]] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+        self.stats = {'hits': 0, 'misses': 0}
+    
+    async def resolve(self, host: str, port: int = 443) -> List[str]:
+        """
+        Résout un nom d'hôte (cache, résolution en cours, ou nouvelle requête)
+        
+        Args:
+            host: Nom d'hôte
+            port: Port de la connexion
+        
+        Returns:
+            Adresses IP, dans l'ordre de getaddrinfo
+        
+        Raises:
+            socket.gaierror: Nom inexistant ou résolution impossible
+        """
+        if _is_ip_address(host):
+            return [host.strip('[]')]
+        
+        key = host.lower()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.stats['hits'] += 1
+            if isinstance(entry[1], tuple):
+                raise socket.gaierror(*entry[1])
+            return entry[1]
+        
+        pending = self._pending.get(key)
+        if pending is None:
+            self.stats['misses'] += 1
+            pending = asyncio.create_task(self._lookup(key, port))
+            # Erreur lue même si toutes les requêtes qui attendaient ont été annulées
+            pending.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._pending[key] = pending
+        else:
+            self.stats['hits'] += 1
+        # shield : une requête annulée n'annule pas la résolution partagée
+        return await asyncio.shield(pending)
+    
+    async def _lookup(self, host: str, port: int) -> List[str]:
+        """Résout un nom avec getaddrinfo (hors boucle) et range le résultat dans le cache"""
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            if e.errno in NEGATIVE_ERRORS:
+                self._store(host, (e.errno, e.strerror), self.negative_ttl)
+            raise
+        finally:
+            self._pending.pop(host, None)
+        
+        addresses = []
+        for info in infos:
+            address = info[4][0]
+            if address not in addresses:
+                addresses.append(address)
+        self._store(host, addresses, self.ttl)
+        return addresses
+    
+    def _store(self, host: str, value: Union[List[str], Tuple[int, str]], ttl: float):
+        """Ajoute une entrée (purge les entrées expirées si le cache est plein)"""
+        now = time.monotonic()
+        if len(self._entries) >= self.max_entries:
+            self._entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+        self._entries[host] = (now + ttl, value)
+    
+    def get_stats(self) -> Dict:
+        """
+        Retourne les statistiques du cache
+        
+        Returns:
+            Dictionnaire {hits, misses, entries}
+        """
+        return {**self.stats, 'entries': len(self._entries)}
+
+
+class CachedResolverBackend(httpcore.AsyncNetworkBackend):
+    """Backend réseau httpcore qui résout les noms via le DNSCache"""
+    
+    def __init__(self, cache: DNSCache, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        """
+        Args:
+            cache: Cache DNS partagé
+            backend: Backend qui ouvre les connexions (défaut : AnyIO, celui de httpcore sous asyncio)
+        """
+        self.cache = cache
+        self.backend = backend or httpcore.AnyIOBackend()
+    
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None,
+                          local_address: Optional[str] = None,
+                          socket_options: Optional[Iterable] = None) -> httpcore.AsyncNetworkStream:
+        """
+        Ouvre une connexion TCP vers la première adresse joignable de l'hôte
+        
+        Les adresses sont essayées en « happy eyeballs » (RFC 8305) : IPv6 et
+        IPv4 alternées, une nouvelle tentative toutes les HAPPY_EYEBALLS_DELAY
+        secondes (ou dès l'échec de la précédente), la première connexion
+        établie gagne. Une adresse IPv6 muette ne fait donc pas expirer un
+        hôte joignable en IPv4. `timeout` couvre l'ensemble (résolution comprise).
+        
+        Les erreurs sont celles de httpcore (ConnectError, ConnectTimeout),
+        avec l'erreur d'origine (socket.gaierror...) en cause.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        try:
+            addresses = await asyncio.wait_for(self.cache.resolve(host, port), timeout)
+        except asyncio.TimeoutError as e:
+            raise httpcore.ConnectTimeout(f"Résolution DNS trop longue: {host}") from e
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+        if not addresses:
+            raise httpcore.ConnectError(f"Aucune adresse pour {host}")
+        
+        def attempt(address: str) -> asyncio.Task:
+            remaining = max(deadline - loop.time(), 0.0) if deadline is not None else None
+            return asyncio.create_task(self.backend.connect_tcp(
+                address, port, timeout=remaining,
+                local_address=local_address, socket_options=socket_options
+            ))
+        
+        to_try = _interleave_families(addresses)
+        attempts = set()
+        errors: List[BaseException] = []
+        try:
+            while to_try or attempts:
+                if to_try:
+                    attempts.add(attempt(to_try.pop(0)))
+                done, attempts = await asyncio.wait(
+                    attempts, timeout=HAPPY_EYEBALLS_DELAY if to_try else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                streams = []
+                for task in done:
+                    if task.exception() is None:
+                        streams.append(task.result())
+                    else:
+                        errors.append(task.exception())
+                if streams:
+                    for extra in streams[1:]:
+                        await extra.aclose()
+                    return streams[0]
+        finally:
+            await _cancel_attempts(attempts)
+        
+        # Un refus (l'hôte répond) est plus parlant qu'un délai dépassé
+        refused = [error for error in errors if isinstance(error, httpcore.ConnectError)]
+        raise (refused or errors)[-1]
+    
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None,
+                                  socket_options: Optional[Iterable] = None) -> httpcore.AsyncNetworkStream:
+        """Socket Unix : pas de résolution, délégué au backend"""
+        return await self.backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+    
+    async def sleep(self, seconds: float):
+        """Délégué au backend"""
+        await self.backend.sleep(seconds)
+
+
+@contextlib.contextmanager
+def _httpx_errors():
+    """Convertit une exception httpcore en l'exception httpx de même nom (la plus précise)"""
+    try:
+        yield
+    except Exception as e:
+        for cls in type(e).__mro__:
+            mapped = getattr(httpx, cls.__name__, None) if cls.__module__.startswith('httpcore') else None
+            if isinstance(mapped, type) and issubclass(mapped, httpx.TransportError):
+                raise mapped(str(e)) from e
+        raise
+    
+
+class _ResponseStream(httpx.AsyncByteStream):
+    """Corps de réponse httpcore exposé à httpx (erreurs de lecture converties)"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    async def __aiter__(self):
+        with _httpx_errors():
+            async for chunk in self._stream:
+                yield chunk
+    
+    async def aclose(self):
+        await self._stream.aclose()
+
+
+class CachedDNSTransport(httpx.AsyncBaseTransport):
+    """
+    Transport httpx propriétaire de son pool httpcore, qui résout les noms via le DNSCache
+    
+    httpx 0.25 ne permet pas de choisir le backend réseau de son transport :
+    celui-ci construit le pool (mêmes réglages que httpx.AsyncHTTPTransport)
+    avec un CachedResolverBackend et lui transmet les requêtes.
+    """
+    
+    def __init__(self, cache: DNSCache, verify: Union[str, bool, ssl.SSLContext] = True,
+                 cert=None, http1: bool = True, http2: bool = False,
+                 limits: httpx.Limits = httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                 trust_env: bool = True, local_address: Optional[str] = None,
+                 retries: int = 0, socket_options: Optional[Iterable] = None):
+        """
+        Crée le pool de connexions
+        
+        Args:
+            cache: Cache DNS partagé
+            verify, cert, trust_env: Contexte SSL (voir httpx.create_ssl_context)
+            http1, http2: Protocoles acceptés
+            limits: Limites du pool de connexions
+            local_address, retries, socket_options: Réglages de connexion httpcore
+        """
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=http1,
+            http2=http2,
+            local_address=local_address,
+            retries=retries,
+            socket_options=socket_options,
+            network_backend=CachedResolverBackend(cache),
+        )
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Transmet la requête au pool httpcore et convertit la réponse (et les erreurs) pour httpx"""
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(core_request)
+        
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+    
+    async def aclose(self):
+        """Ferme les connexions du pool"""
+        await self._pool.aclose()
+
+
+# Cache unique du processus : un worker garde ses résolutions d'un job à l'autre
+DNS_CACHE = DNSCache()
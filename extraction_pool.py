@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Extraction (parsing + extracteurs) dans un pool de processus
+
+Le parsing BeautifulSoup et les regex sont purement CPU : exécutés dans la
+boucle asyncio, ils bloquent tous les sites en cours pendant l'analyse d'une
+grosse page. Ce module les déporte dans des processus séparés.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from config import EXTRACTION_WORKERS, EXTRACTION_BATCH_SIZE, EXTRACTION_BATCH_DELAY
+from extractors import EmailExtractor, SocialMediaExtractor, LinkExtractor
+from parsing import ParsedPage
+
+logger = logging.getLogger(__name__)
+
+
+def extract_page(html: str, url: str, site_url: str, raw_html: Optional[bytes] = None,
+                 base_url: Optional[str] = None) -> Dict:
+    """
+    Parse une page et lance tous les extracteurs (exécutable dans un autre processus)
+    
+    Args:
+        html: Contenu HTML décodé
+        url: URL de la page
+        site_url: URL du site (domaine utilisé pour filtrer les emails)
+        raw_html: Corps brut de la page (octets), optionnel
+        base_url: URL de base du site : si fournie, cherche aussi les liens importants
+    
+    Returns:
+        Dictionnaire {emails, social_media, important_links (tuples (URL, score))}
+    """
+    page = ParsedPage(html, url, raw_html)
+    
+    return {
+        'emails': EmailExtractor(site_url).extract_emails_from_html(page, url),
+        'social_media': SocialMediaExtractor().extract_social_media(page, url),
+        'important_links': LinkExtractor().score_important_links(page, base_url) if base_url else [],
+    }
+
+
+def extract_batch(jobs: List[Dict]) -> List[Tuple[bool, object]]:
+    """
+    Traite un lot de pages dans un processus du pool
+    
+    Args:
+        jobs: Liste de paramètres pour extract_page
+    
+    Returns:
+        Liste de tuples (succès, résultat ou message d'erreur), dans l'ordre des jobs
+    """
+    results = []
+    for job in jobs:
+        try:
+            results.append((True, extract_page(**job)))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class ExtractionPool:
+    """Pool de processus d'extraction, avec envoi des pages par lots"""
+    
+    def __init__(self, workers: int = EXTRACTION_WORKERS, batch_size: int = EXTRACTION_BATCH_SIZE,
+                 batch_delay: float = EXTRACTION_BATCH_DELAY):
+        """
+        Initialise le pool
+        
+        Args:
+            workers: Nombre de processus
+            batch_size: Nombre de pages envoyées ensemble à un processus
+            batch_delay: Attente maximale (secondes) pour compléter un lot
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        
+        # 'spawn' : les processus ne copient pas la boucle asyncio ni le client HTTP
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+        )
+        self._batch: List[Tuple[Dict, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+    
+    async def extract(self, job: Dict) -> Dict:
+        """
+        Extrait une page dans le pool (regroupée avec d'autres pages)
+        
+        Args:
+            job: Paramètres pour extract_page
+        
+        Returns:
+            Résultat de extract_page
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((job, future))
+        
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Envoie le lot en attente à un processus du pool"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        
+        loop = asyncio.get_running_loop()
+        jobs = [job for job, _ in batch]
+        executor_future = loop.run_in_executor(self.executor, extract_batch, jobs)
+        executor_future.add_done_callback(lambda done: self._dispatch(done, batch))
+    
+    def _dispatch(self, executor_future: asyncio.Future, batch: List[Tuple[Dict, asyncio.Future]]):
+        """Transmet les résultats d'un lot aux pages qui les attendent"""
+        if executor_future.cancelled():
+            for _, future in batch:
+                future.cancel()
+            return
+        
+        error = executor_future.exception()
+        if error is not None:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        
+        for (_, future), (ok, payload) in zip(batch, executor_future.result()):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+    
+    def shutdown(self):
+        """Arrête les processus du pool"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -4,20 +4,40 @@ Extracteurs pour emails et réseaux sociaux
 """
 
 import re
-from bs4 import BeautifulSoup
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional, Union, Iterable, Iterator, Tuple
 import logging
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urldefrag, urljoin, urlparse
 
-from config import SOCIAL_NETWORKS, HTML_SECTIONS, EMAIL_PROVIDERS
+from config import (
+    SOCIAL_NETWORKS, SOCIAL_HOSTS, HTML_SECTIONS, EMAIL_PROVIDERS, IMPORTANT_LINK_PATTERNS,
+    EMAIL_EXTRACTION_MODE, LINK_SCORE_URL, LINK_SCORE_ANCHOR, LINK_SCORE_SECTIONS,
+    LINK_SCORE_KEYWORDS, LINK_SCORE_DEPTH_PENALTY
+)
+from parsing import ParsedPage
 from utils import (
     clean_email, is_valid_email, email_belongs_to_domain,
-    get_context_around_email, classify_email_type, extract_domain
+    get_context_at, classify_email_type, extract_domain,
+    normalize_url, is_same_domain, is_site_email
 )
 
 logger = logging.getLogger(__name__)
 
 
+def site_email_found(extractor: 'EmailExtractor', emails: List[Dict]) -> bool:
+    """
+    Politique d'arrêt par défaut : un email du domaine du site (ou d'un
+    sous-domaine) a été trouvé
+    
+    Args:
+        extractor: Extracteur en cours (domaine du site)
+        emails: Emails trouvés jusqu'ici (non dédupliqués)
+    
+    Returns:
+        True si l'extraction de la page peut s'arrêter
+    """
+    return any(is_site_email(email_data['email'], extractor.site_domain) for email_data in emails)
+
+
 class EmailExtractor:
     """Extracteur d'adresses email"""
     
@@ -33,99 +53,195 @@ class EmailExtractor:
         r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\s*\.\s*[A-Z|a-z]{2,}\b',
     ]
     
-    def __init__(self, site_url: str):
+    # Scanner unique : les patterns ci-dessus réunis en une alternative, une seule
+    # passe par texte (à chaque position, les formes sont essayées dans l'ordre)
+    EMAIL_SCANNER = re.compile('|'.join(f'(?:{pattern})' for pattern in EMAIL_PATTERNS), re.IGNORECASE)
+    
+    # Version octets (patterns ASCII uniquement) pour scanner le HTML brut sans le décoder
+    EMAIL_SCANNER_BYTES = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in EMAIL_PATTERNS if pattern.isascii()).encode('ascii'),
+        re.IGNORECASE
+    )
+    
+    # Préfiltre : le scanner ne tourne qu'autour des '@' et [at]/(at). Chaque ancre
+    # donne une fenêtre : partie locale à gauche, domaine (et [dot]) à droite
+    EMAIL_ANCHOR = re.compile(r'@|[\[\(]at[\]\)]', re.IGNORECASE)
+    EMAIL_ANCHOR_BYTES = re.compile(rb'@|[\[\(]at[\]\)]', re.IGNORECASE)
+    LOCAL_CHAR = re.compile(r'[A-Za-zÀ-ÿ0-9._%+-]', re.IGNORECASE)
+    LOCAL_CHAR_BYTES = re.compile(rb'[A-Za-z0-9._%+-]', re.IGNORECASE)
+    DOMAIN_EXTENT = re.compile(
+        r'\s*[A-Za-zÀ-ÿ0-9.|-]*(?:\s*(?:\.|[\[\(]dot[\]\)])?\s*[A-Za-z|]+)?', re.IGNORECASE
+    )
+    DOMAIN_EXTENT_BYTES = re.compile(
+        rb'\s*[A-Za-z0-9.|-]*(?:\s*(?:\.|[\[\(]dot[\]\)])?\s*[A-Za-z|]+)?', re.IGNORECASE
+    )
+    
+    def __init__(self, site_url: str, thorough: Optional[bool] = None,
+                 stop_policy: Optional[Callable[['EmailExtractor', List[Dict]], bool]] = None):
         """
         Initialise l'extracteur
         
         Args:
             site_url: URL du site à scraper
+            thorough: True = toutes les méthodes dans l'ordre historique (audits),
+                False = méthodes par coût croissant avec arrêt anticipé
+                (défaut : EMAIL_EXTRACTION_MODE)
+            stop_policy: Décide après chaque méthode si les emails trouvés
+                suffisent (défaut : site_email_found)
         """
         self.site_url = site_url
         self.site_domain = extract_domain(site_url)
         self.known_providers = set(EMAIL_PROVIDERS)
+        self.thorough = EMAIL_EXTRACTION_MODE == 'thorough' if thorough is None else thorough
+        self.stop_policy = stop_policy or site_email_found
         
-    def extract_emails_from_html(self, html: str, page_url: str) -> List[Dict]:
+    def extract_emails_from_html(self, html: Union[str, ParsedPage], page_url: str,
+                                 raw_html: Optional[bytes] = None) -> List[Dict]:
         """
         Extrait les emails d'un contenu HTML
         
         Args:
-            html: Contenu HTML
+            html: Contenu HTML, ou page déjà parsée (ParsedPage)
             page_url: URL de la page
+            raw_html: Corps brut de la page (octets) : si fourni, la recherche
+                dans le HTML brut se fait directement dessus
             
         Returns:
             Liste de dictionnaires avec les emails et leur contexte
         """
         emails_found = []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        page = ParsedPage.from_html(html, page_url, raw_html)
         
-        # 1. Chercher dans TOUS les attributs HTML (href, data-*, onclick, etc.)
-        emails_from_attributes = self._extract_from_all_attributes(soup, page_url)
-        emails_found.extend(emails_from_attributes)
+        strategies = self._strategies(page, page_url)
+        if not self.thorough:
+            # Les moins coûteuses d'abord (tri stable : ordre historique à coût égal)
+            strategies = sorted(strategies, key=lambda strategy: strategy[1])
         
-        # 2. Chercher dans le texte visible
-        text = soup.get_text()
-        emails_from_text = self._extract_from_text(text, page_url, 'body')
-        emails_found.extend(emails_from_text)
+        for name, _, extract in strategies:
+            emails_found.extend(extract())
         
-        # 3. Chercher dans les attributs href (mailto:)
-        emails_from_mailto = self._extract_from_mailto(soup, page_url)
-        emails_found.extend(emails_from_mailto)
+            # Arrêt anticipé : une méthode n'est jamais interrompue en cours
+            if not self.thorough and self.stop_policy(self, emails_found):
+                logger.debug(f"Extraction d'emails arrêtée après '{name}' ({page_url})")
+                break
         
-        # 4. Chercher dans les sections prioritaires
-        emails_from_sections = self._extract_from_sections(soup, page_url)
-        emails_found.extend(emails_from_sections)
+        # Dédupliquer et filtrer
+        return self._deduplicate_and_filter(emails_found)
+    
+    def _strategies(self, page: ParsedPage, page_url: str) -> List[Tuple[str, int, Callable[[], List[Dict]]]]:
+        """
+        Méthodes d'extraction d'une page, dans l'ordre historique
         
-        # 5. Chercher dans les scripts JSON-LD (données structurées)
-        emails_from_jsonld = self._extract_from_jsonld(soup, page_url)
-        emails_found.extend(emails_from_jsonld)
+        Returns:
+            Liste de tuples (nom, coût relatif, fonction d'extraction)
+        """
+        return [
+            # 1. Chercher dans TOUS les attributs HTML (href, data-*, onclick, etc.)
+            ('attributes', 2, lambda: self._extract_from_all_attributes(page, page_url)),
+            # 2. Chercher dans le texte visible (chaque email prend la section de son texte)
+            ('text', 3, lambda: self._extract_from_text(page.text, page_url, 'body', page.sections.section_at)),
+            # 3. Chercher dans les attributs href (mailto:)
+            ('mailto', 1, lambda: self._extract_from_mailto(page, page_url)),
+            # 4. Relire les sections prioritaires coupées par une correspondance du texte
+            ('sections', 4, lambda: self._extract_from_sections(page, page_url)),
+            # 5. Chercher dans les scripts JSON-LD (données structurées)
+            ('jsonld', 1, lambda: self._extract_from_jsonld(page, page_url)),
+            # 6. Chercher dans les balises meta
+            ('meta', 1, lambda: self._extract_from_meta(page, page_url)),
+            # 7. Chercher dans le HTML brut (emails encodés)
+            ('raw_html', 5, lambda: self._extract_from_raw_html(page.raw, page_url)),
+        ]
+    
+    @classmethod
+    def scan(cls, text: Union[str, bytes]) -> Iterator[Tuple[str, int, int]]:
+        """
+        Cherche les emails (standard, accentués, obfusqués) en une seule passe
         
-        # 6. Chercher dans les balises meta
-        emails_from_meta = self._extract_from_meta(soup, page_url)
-        emails_found.extend(emails_from_meta)
+        Args:
+            text: Texte ou HTML brut (octets : formes ASCII uniquement)
         
-        # 7. Chercher dans le HTML brut (emails encodés)
-        emails_from_raw = self._extract_from_raw_html(html, page_url)
-        emails_found.extend(emails_from_raw)
+        Returns:
+            Itérateur de tuples (email trouvé, début, fin) dans l'ordre du texte
+        """
+        if isinstance(text, bytes):
+            scanner, anchors = cls.EMAIL_SCANNER_BYTES, cls.EMAIL_ANCHOR_BYTES
+            local_char, domain_extent = cls.LOCAL_CHAR_BYTES, cls.DOMAIN_EXTENT_BYTES
+        else:
+            scanner, anchors = cls.EMAIL_SCANNER, cls.EMAIL_ANCHOR
+            local_char, domain_extent = cls.LOCAL_CHAR, cls.DOMAIN_EXTENT
+        
+        window_start = window_end = None
+        windows = []
+        
+        for anchor in anchors.finditer(text):
+            # Début possible le plus à gauche : espaces puis partie locale avant l'ancre
+            start = anchor.start()
+            while start > 0 and text[start - 1:start].isspace():
+                start -= 1
+            while start > 0 and local_char.match(text, start - 1):
+                start -= 1
+            # Fin : domaine après l'ancre, + 1 caractère pour que \b voie la suite du texte
+            end = min(len(text), domain_extent.match(text, anchor.end()).end() + 1)
+            
+            if window_end is not None and start <= window_end:
+                window_end = max(window_end, end)
+            else:
+                if window_end is not None:
+                    windows.append((window_start, window_end))
+                window_start, window_end = start, end
         
-        # Dédupliquer et filtrer
-        return self._deduplicate_and_filter(emails_found)
+        if window_end is not None:
+            windows.append((window_start, window_end))
+        
+        for start, end in windows:
+            for match in scanner.finditer(text, start, end):
+                raw_email = match.group(0)
+                if isinstance(raw_email, bytes):
+                    raw_email = raw_email.decode('ascii', errors='ignore')
+                yield raw_email, match.start(), match.end()
     
-    def _extract_from_text(self, text: str, page_url: str, section: str) -> List[Dict]:
-        """Extrait les emails du texte brut"""
+    def _extract_from_text(self, text: str, page_url: str, section: str,
+                           section_at: Optional[Callable[[int], str]] = None) -> List[Dict]:
+        """
+        Extrait les emails du texte brut
+        
+        Args:
+            text: Texte à analyser
+            page_url: URL de la page
+            section: Section attribuée aux emails trouvés
+            section_at: Section selon la position dans le texte (remplace section)
+        
+        Returns:
+            Liste de dictionnaires avec les emails et leur contexte
+        """
         emails = []
         
-        for pattern in self.EMAIL_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                raw_email = match.group(0)
+        for raw_email, start, end in self.scan(text):
+            # Désobfusquer si nécessaire
+            email = self._deobfuscate_email(raw_email)
+            email = clean_email(email)
                 
-                # Désobfusquer si nécessaire
-                email = self._deobfuscate_email(raw_email)
-                email = clean_email(email)
+            if is_valid_email(email):
+                context = get_context_at(text, start, end, 80)
+                email_type = classify_email_type(email, context)
                 
-                if is_valid_email(email):
-                    context = get_context_around_email(text, raw_email, 80)
-                    email_type = classify_email_type(email, context)
-                    
-                    emails.append({
-                        'email': email,
-                        'page': page_url,
-                        'section': section,
-                        'context': context,
-                        'type': email_type
-                    })
+                emails.append({
+                    'email': email,
+                    'page': page_url,
+                    'section': section_at(start) if section_at else section,
+                    'context': context,
+                    'type': email_type
+                })
         
         return emails
     
-    def _extract_from_mailto(self, soup: BeautifulSoup, page_url: str) -> List[Dict]:
+    def _extract_from_mailto(self, page: ParsedPage, page_url: str) -> List[Dict]:
         """Extrait les emails des liens mailto:"""
         emails = []
         
         # Chercher dans tous les liens (href contenant @)
-        all_links = soup.find_all('a', href=True)
-        
-        for link in all_links:
+        for link in page.anchors:
             href = link.get('href', '')
             
             # Mailto: classique
@@ -135,7 +251,7 @@ class EmailExtractor:
                     email = clean_email(email_match.group(1))
                     
                     if is_valid_email(email):
-                        section = self._find_parent_section(link)
+                        section = page.sections.section_of(link)
                         context = link.get_text(strip=True)
                         if link.parent:
                             context += ' ' + link.parent.get_text(strip=True)[:100]
@@ -157,7 +273,7 @@ class EmailExtractor:
                     email = clean_email(email_match.group(0))
                     
                     if is_valid_email(email):
-                        section = self._find_parent_section(link)
+                        section = page.sections.section_of(link)
                         context = link.get_text(strip=True)
                         email_type = classify_email_type(email, context)
                         
@@ -171,25 +287,35 @@ class EmailExtractor:
         
         return emails
     
-    def _extract_from_sections(self, soup: BeautifulSoup, page_url: str) -> List[Dict]:
-        """Extrait les emails des sections HTML prioritaires"""
+    def _extract_from_sections(self, page: ParsedPage, page_url: str) -> List[Dict]:
+        """
+        Extrait les emails des sections HTML prioritaires
+        
+        Le texte de la page a déjà été analysé en une passe (étape 2). Seules
+        les sections qu'une correspondance chevauche sont relues seules : leur
+        bord coupe le texte collé par get_text() (ex: 'contact@site.frSuite').
+        """
         emails = []
+        index = page.sections
+        text = index.text
         
-        for section_name, selectors in HTML_SECTIONS.items():
-            for selector in selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text()
-                    section_emails = self._extract_from_text(text, page_url, section_name)
-                    emails.extend(section_emails)
+        crossed = set()
+        for _, start, end in self.scan(text):
+            crossed.update(index.roots_crossed(start, end))
+        
+        # Ordre de priorité des sections, puis ordre du document
+        priority = list(HTML_SECTIONS)
+        for start, end, section_name in sorted(crossed, key=lambda root: (priority.index(root[2]), root[0])):
+            section_emails = self._extract_from_text(text[start:end], page_url, section_name)
+            emails.extend(section_emails)
         
         return emails
     
-    def _extract_from_jsonld(self, soup: BeautifulSoup, page_url: str) -> List[Dict]:
+    def _extract_from_jsonld(self, page: ParsedPage, page_url: str) -> List[Dict]:
         """Extrait les emails des données structurées JSON-LD"""
         emails = []
         
-        scripts = soup.find_all('script', type='application/ld+json')
+        scripts = [script for script in page.scripts if script.get('type') == 'application/ld+json']
         
         for script in scripts:
             try:
@@ -214,75 +340,68 @@ class EmailExtractor:
         
         return emails
     
-    def _extract_from_meta(self, soup: BeautifulSoup, page_url: str) -> List[Dict]:
+    def _extract_from_meta(self, page: ParsedPage, page_url: str) -> List[Dict]:
         """Extrait les emails des balises meta"""
         emails = []
         
-        meta_tags = soup.find_all('meta')
+        meta_tags = [tag for tag in page.tags if tag.name == 'meta']
         
         for meta in meta_tags:
             content = meta.get('content', '')
             if content and '@' in content:
                 # Chercher des emails dans le contenu
-                for pattern in self.EMAIL_PATTERNS:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        email = clean_email(match.group(0))
-                        if is_valid_email(email):
-                            emails.append({
-                                'email': email,
-                                'page': page_url,
-                                'section': 'meta',
-                                'context': f"Meta {meta.get('name', meta.get('property', ''))}",
-                                'type': classify_email_type(email, '')
-                            })
+                for raw_email, _, _ in self.scan(content):
+                    email = clean_email(raw_email)
+                    if is_valid_email(email):
+                        emails.append({
+                            'email': email,
+                            'page': page_url,
+                            'section': 'meta',
+                            'context': f"Meta {meta.get('name', meta.get('property', ''))}",
+                            'type': classify_email_type(email, '')
+                        })
         
         return emails
     
-    def _extract_from_all_attributes(self, soup: BeautifulSoup, page_url: str) -> List[Dict]:
+    def _extract_from_all_attributes(self, page: ParsedPage, page_url: str) -> List[Dict]:
         """Extrait les emails de TOUS les attributs HTML"""
         emails = []
         
         # Chercher dans tous les éléments et tous leurs attributs
-        for tag in soup.find_all(True):
-            for attr_name, attr_value in tag.attrs.items():
-                if isinstance(attr_value, str) and '@' in attr_value:
-                    # Chercher des emails
-                    for pattern in self.EMAIL_PATTERNS:
-                        matches = re.finditer(pattern, attr_value, re.IGNORECASE)
-                        for match in matches:
-                            email = clean_email(match.group(0))
-                            if is_valid_email(email):
-                                section = self._find_parent_section(tag)
-                                context = f"Attribut {attr_name}"
-                                
-                                emails.append({
-                                    'email': email,
-                                    'page': page_url,
-                                    'section': section,
-                                    'context': context,
-                                    'type': classify_email_type(email, '')
-                                })
+        for tag, attr_name, attr_value in page.attributes:
+            if '@' in attr_value:
+                # Chercher des emails
+                for raw_email, _, _ in self.scan(attr_value):
+                    email = clean_email(raw_email)
+                    if is_valid_email(email):
+                        section = page.sections.section_of(tag)
+                        context = f"Attribut {attr_name}"
+                            
+                        emails.append({
+                            'email': email,
+                            'page': page_url,
+                            'section': section,
+                            'context': context,
+                            'type': classify_email_type(email, '')
+                        })
         
         return emails
     
-    def _extract_from_raw_html(self, html: str, page_url: str) -> List[Dict]:
-        """Extrait les emails du HTML brut (pour emails encodés)"""
+    def _extract_from_raw_html(self, html: Union[str, bytes], page_url: str) -> List[Dict]:
+        """Extrait les emails du HTML brut (pour emails encodés), texte ou octets"""
         emails = []
         
         # Chercher dans le HTML brut
-        for pattern in self.EMAIL_PATTERNS:
-            matches = re.finditer(pattern, html, re.IGNORECASE)
-            for match in matches:
-                email = clean_email(match.group(0))
-                if is_valid_email(email):
-                    emails.append({
-                        'email': email,
-                        'page': page_url,
-                        'section': 'html_raw',
-                        'context': 'HTML source',
-                        'type': classify_email_type(email, '')
-                    })
+        for raw_email, _, _ in self.scan(html):
+            email = clean_email(raw_email)
+            if is_valid_email(email):
+                emails.append({
+                    'email': email,
+                    'page': page_url,
+                    'section': 'html_raw',
+                    'context': 'HTML source',
+                    'type': classify_email_type(email, '')
+                })
         
         return emails
     
@@ -303,19 +422,6 @@ class EmailExtractor:
         
         return emails
     
-    def _find_parent_section(self, element) -> str:
-        """Trouve la section parente d'un élément"""
-        # Chercher le parent footer, header, etc.
-        for section_name, selectors in HTML_SECTIONS.items():
-            for selector in selectors:
-                # Simplifier le sélecteur pour find_parent
-                tag = selector.lstrip('.#').split('[')[0]
-                parent = element.find_parent(tag)
-                if parent:
-                    return section_name
-        
-        return 'body'
-    
     def _deobfuscate_email(self, email: str) -> str:
         """Désobfusque un email (remplace [at], (at), etc.)"""
         email = re.sub(r'\s*[\[\(]at[\]\)]\s*', '@', email, flags=re.I)
@@ -353,112 +459,93 @@ class EmailExtractor:
 class SocialMediaExtractor:
     """Extracteur de réseaux sociaux"""
     
+    # Préfixe le plus long possible avant le domaine dans SOCIAL_NETWORKS
+    HOST_PREFIX_MAX = len('https://www.')
+    
+    # Classes CSS d'icônes sociales (cherchées comme sous-chaînes des classes)
+    ICON_CLASSES = {
+        'facebook': ['fa-facebook', 'facebook-icon', 'icon-facebook', 'fb-icon'],
+        'instagram': ['fa-instagram', 'instagram-icon', 'icon-instagram', 'insta-icon'],
+        'twitter': ['fa-twitter', 'twitter-icon', 'icon-twitter', 'x-icon'],
+        'linkedin': ['fa-linkedin', 'linkedin-icon', 'icon-linkedin'],
+        'youtube': ['fa-youtube', 'youtube-icon', 'icon-youtube'],
+    }
+    
     def __init__(self):
         """Initialise l'extracteur"""
         self.patterns = SOCIAL_NETWORKS
+        
+        # Tous les patterns dans une seule regex : un lookahead optionnel et nommé
+        # par pattern, pour obtenir en un appel les liens de tous les réseaux
+        # commençant à une position donnée
+        self.groups = [
+            (f'{platform}_{index}', platform)
+            for platform, patterns in SOCIAL_NETWORKS.items()
+            for index in range(len(patterns))
+        ]
+        combined = ''.join(
+            f'(?:(?=(?P<{platform}_{index}>{pattern})))?'
+            for platform, patterns in SOCIAL_NETWORKS.items()
+            for index, pattern in enumerate(patterns)
+        )
+        self.scanner = re.compile(combined, re.IGNORECASE)
+        
+        # Version octets pour scanner le HTML brut sans le décoder
+        self.byte_scanner = re.compile(combined.encode('ascii'), re.IGNORECASE)
+        self.byte_hosts = [host.encode('ascii') for host in SOCIAL_HOSTS]
     
-    def extract_social_media(self, html: str, page_url: str) -> Dict[str, List[str]]:
+    def extract_social_media(self, html: Union[str, ParsedPage], page_url: str,
+                             raw_html: Optional[bytes] = None) -> Dict[str, List[str]]:
         """
         Extrait les réseaux sociaux d'un contenu HTML
         
         Args:
-            html: Contenu HTML
+            html: Contenu HTML, ou page déjà parsée (ParsedPage)
             page_url: URL de la page
+            raw_html: Corps brut de la page (octets) : si fourni, la recherche
+                dans le HTML brut se fait directement dessus
             
         Returns:
             Dictionnaire {platform: [urls]}
         """
         social_media = {}
+        seen: Set[Tuple[str, str]] = set()
         
-        soup = BeautifulSoup(html, 'html.parser')
+        page = ParsedPage.from_html(html, page_url, raw_html)
         
         # 1. Chercher dans tous les attributs href
-        all_links = soup.find_all('a', href=True)
-        
-        for link in all_links:
+        for link in page.anchors:
             href = link.get('href', '')
             
             # Vérifier chaque réseau social
-            for platform, patterns in self.patterns.items():
-                for pattern in patterns:
-                    match = re.search(pattern, href, re.IGNORECASE)
-                    if match:
-                        url = self._normalize_social_url(match.group(0), platform)
-                        if url:
-                            if platform not in social_media:
-                                social_media[platform] = []
-                            if url not in social_media[platform]:
-                                social_media[platform].append(url)
+            for platform, raw_url in self._find_links(href, first_only=True):
+                self._add_link(social_media, seen, platform, raw_url)
         
         # 2. Chercher dans les attributs data-* (icônes sociales)
-        for tag in soup.find_all(True):
-            for attr, value in tag.attrs.items():
-                if isinstance(value, str):
-                    for platform, patterns in self.patterns.items():
-                        for pattern in patterns:
-                            match = re.search(pattern, value, re.IGNORECASE)
-                            if match:
-                                url = self._normalize_social_url(match.group(0), platform)
-                                if url:
-                                    if platform not in social_media:
-                                        social_media[platform] = []
-                                    if url not in social_media[platform]:
-                                        social_media[platform].append(url)
+        for tag, attr, value in page.attributes:
+            for platform, raw_url in self._find_links(value, first_only=True):
+                self._add_link(social_media, seen, platform, raw_url)
         
         # 3. Chercher dans le texte et scripts
         # Texte visible
-        text = soup.get_text()
-        for platform, patterns in self.patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    url = self._normalize_social_url(match.group(0), platform)
-                    if url:
-                        if platform not in social_media:
-                            social_media[platform] = []
-                        if url not in social_media[platform]:
-                            social_media[platform].append(url)
+        for platform, raw_url in self._find_links(page.text):
+            self._add_link(social_media, seen, platform, raw_url)
         
         # 4. Chercher dans les scripts JavaScript
-        scripts = soup.find_all('script')
-        for script in scripts:
+        for script in page.scripts:
             script_text = script.string if script.string else ''
-            for platform, patterns in self.patterns.items():
-                for pattern in patterns:
-                    matches = re.finditer(pattern, script_text, re.IGNORECASE)
-                    for match in matches:
-                        url = self._normalize_social_url(match.group(0), platform)
-                        if url:
-                            if platform not in social_media:
-                                social_media[platform] = []
-                            if url not in social_media[platform]:
-                                social_media[platform].append(url)
+            for platform, raw_url in self._find_links(script_text):
+                self._add_link(social_media, seen, platform, raw_url)
         
         # 5. Chercher dans HTML brut (cas où c'est encodé)
-        for platform, patterns in self.patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, html, re.IGNORECASE)
-                for match in matches:
-                    url = self._normalize_social_url(match.group(0), platform)
-                    if url:
-                        if platform not in social_media:
-                            social_media[platform] = []
-                        if url not in social_media[platform]:
-                            social_media[platform].append(url)
+        for platform, raw_url in self._find_links(page.raw):
+            self._add_link(social_media, seen, platform, raw_url)
         
         # 6. Détecter via classes CSS (icônes sociales)
-        social_classes = {
-            'facebook': ['fa-facebook', 'facebook-icon', 'icon-facebook', 'fb-icon'],
-            'instagram': ['fa-instagram', 'instagram-icon', 'icon-instagram', 'insta-icon'],
-            'twitter': ['fa-twitter', 'twitter-icon', 'icon-twitter', 'x-icon'],
-            'linkedin': ['fa-linkedin', 'linkedin-icon', 'icon-linkedin'],
-            'youtube': ['fa-youtube', 'youtube-icon', 'icon-youtube'],
-        }
-        
-        for platform, class_names in social_classes.items():
+        for platform, class_names in self.ICON_CLASSES.items():
             for class_name in class_names:
                 # Chercher les éléments avec cette classe
-                elements = soup.find_all(class_=re.compile(class_name, re.I))
+                elements = page.classes.find(class_name)
                 for element in elements:
                     # Chercher le lien parent ou enfant
                     parent_link = element.find_parent('a', href=True)
@@ -468,15 +555,75 @@ class SocialMediaExtractor:
                     if link:
                         href = link.get('href', '')
                         if href and platform.replace('x', 'twitter') in href.lower():
-                            url = self._normalize_social_url(href, platform)
-                            if url:
-                                if platform not in social_media:
-                                    social_media[platform] = []
-                                if url not in social_media[platform]:
-                                    social_media[platform].append(url)
+                            self._add_link(social_media, seen, platform, href)
         
         return social_media
     
+    def _candidate_starts(self, text: Union[str, bytes]) -> Iterable[int]:
+        """
+        Positions où un lien de réseau social peut commencer
+        
+        Préfiltre : un lien contient toujours un des SOCIAL_HOSTS, précédé d'au
+        plus HOST_PREFIX_MAX caractères ('https://www.').
+        """
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Minuscules de longueur différente (rare) : positions non comparables
+            return range(len(text))
+        
+        positions = set()
+        for host in (self.byte_hosts if isinstance(text, bytes) else SOCIAL_HOSTS):
+            index = lowered.find(host)
+            while index != -1:
+                positions.update(range(max(0, index - self.HOST_PREFIX_MAX), index + 1))
+                index = lowered.find(host, index + 1)
+        
+        return sorted(positions)
+    
+    def _find_links(self, text: Union[str, bytes], first_only: bool = False) -> Iterator[Tuple[str, str]]:
+        """
+        Cherche les liens de réseaux sociaux dans un texte
+        
+        Équivaut à un re.finditer (ou re.search si first_only) par pattern de
+        SOCIAL_NETWORKS, mais la regex combinée n'est appliquée qu'aux positions
+        retenues par le préfiltre.
+        
+        Args:
+            text: Texte ou HTML brut (octets)
+            first_only: Garder seulement le premier lien trouvé par pattern
+        
+        Returns:
+            Itérateur de tuples (plateforme, lien trouvé), dans l'ordre des patterns
+        """
+        if not text:
+            return
+        
+        is_bytes = isinstance(text, bytes)
+        scanner = self.byte_scanner if is_bytes else self.scanner
+        found: Dict[str, List] = {name: [] for name, _ in self.groups}
+        ends = dict.fromkeys(found, 0)
+        
+        for position in self._candidate_starts(text):
+            match = scanner.match(text, position)
+            for name, value in match.groupdict().items():
+                # Comme finditer : pas de chevauchement entre deux liens d'un même pattern
+                if value is None or position < ends[name] or (first_only and found[name]):
+                    continue
+                found[name].append(value)
+                ends[name] = position + len(value)
+        
+        for name, platform in self.groups:
+            for value in found[name]:
+                yield platform, value.decode('ascii', errors='ignore') if is_bytes else value
+    
+    def _add_link(self, social_media: Dict[str, List[str]], seen: Set[Tuple[str, str]],
+                  platform: str, raw_url: str):
+        """Normalise un lien et l'ajoute s'il n'a pas déjà été trouvé"""
+        url = self._normalize_social_url(raw_url, platform)
+        if url and (platform, url) not in seen:
+            seen.add((platform, url))
+            social_media.setdefault(platform, []).append(url)
+    
     def _normalize_social_url(self, url: str, platform: str) -> Optional[str]:
         """Normalise une URL de réseau social"""
         # Ajouter https:// si manquant
@@ -491,3 +638,92 @@ class SocialMediaExtractor:
         
         return url
 
+
+class LinkExtractor:
+    """Extracteur de liens internes importants (contact, mentions légales, etc.)"""
+    
+    # Compilés une seule fois (et non à chaque lien)
+    IMPORTANT_LINK_RES = [re.compile(pattern, re.I) for pattern in IMPORTANT_LINK_PATTERNS]
+    
+    @classmethod
+    def is_important(cls, text: str) -> bool:
+        """Vérifie si un texte (chemin d'URL, texte de lien) correspond à IMPORTANT_LINK_PATTERNS"""
+        return any(pattern.search(text) for pattern in cls.IMPORTANT_LINK_RES)
+    
+    @classmethod
+    def score_link(cls, url: str, text: str = '', section: str = 'body') -> float:
+        """
+        Score d'un lien interne pour la frontière de crawl
+        
+        Args:
+            url: URL absolue du lien
+            text: Texte du lien
+            section: Section de la page où se trouve le lien (voir SectionIndex)
+        
+        Returns:
+            Score (> 0), 0 si ni l'URL ni le texte ne désignent une page importante
+        """
+        parsed = urlparse(url)
+        # Le chemin seulement : un domaine 'contact-pro.fr' ne rend pas tous ses liens importants
+        target = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        url_match = cls.is_important(target)
+        text_match = bool(text) and cls.is_important(text)
+        if not url_match and not text_match:
+            return 0.0
+        
+        score = LINK_SCORE_URL * url_match + LINK_SCORE_ANCHOR * text_match
+        score += LINK_SCORE_SECTIONS.get(section, 0.0)
+        
+        words = f"{target} {text}".lower()
+        for keywords, bonus in LINK_SCORE_KEYWORDS:
+            if any(keyword in words for keyword in keywords):
+                score += bonus
+                break
+        
+        depth = len([part for part in parsed.path.split('/') if part])
+        score -= LINK_SCORE_DEPTH_PENALTY * max(depth - 1, 0)
+        return max(score, 0.1)
+    
+    def score_important_links(self, html: Union[str, ParsedPage], base_url: str) -> List[Tuple[str, float]]:
+        """
+        Trouve et note les liens importants d'une page
+        
+        Args:
+            html: Contenu HTML, ou page déjà parsée (ParsedPage)
+            base_url: URL de base du site (liens d'autres domaines ignorés)
+        
+        Returns:
+            Liste de tuples (URL sans fragment, score), du meilleur au moins bon
+        """
+        page = ParsedPage.from_html(html, base_url)
+        scores: Dict[str, float] = {}
+        
+        for link in page.anchors:
+            # Liens relatifs résolus par rapport à la page (pas seulement l'accueil)
+            full_url = urldefrag(normalize_url(link.get('href', ''), page.url))[0]
+            if not full_url.startswith(('http://', 'https://')):
+                continue
+            
+            # Vérifier si c'est du même domaine
+            if not is_same_domain(full_url, base_url):
+                continue
+            
+            score = self.score_link(full_url, link.get_text(), page.sections.section_of(link))
+            if score > scores.get(full_url, 0.0):
+                scores[full_url] = score
+        
+        return sorted(scores.items(), key=lambda item: -item[1])
+    
+    def find_important_links(self, html: Union[str, ParsedPage], base_url: str) -> List[str]:
+        """
+        Trouve les liens importants dans le HTML (contact, mentions légales, etc.)
+        
+        Args:
+            html: Contenu HTML, ou page déjà parsée (ParsedPage)
+            base_url: URL de base du site
+            
+        Returns:
+            Liste des URLs importantes trouvées, de la plus prometteuse à la moins prometteuse
+        """
+        return [url for url, _ in self.score_important_links(html, base_url)]
+        
\ No newline at end of file
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Empreintes de pages : doublons exacts, quasi-doublons et fausses 404
+
+Beaucoup de sites répondent 200 sur les chemins devinés avec la page
+d'accueil ou un gabarit « page introuvable ». L'empreinte est calculée sur le
+texte brut de la page (balises retirées par regex, sans parsing) : bien moins
+cher que l'extraction qu'elle permet d'éviter.
+"""
+
+import hashlib
+import html as html_lib
+import re
+import zlib
+from typing import List
+
+from config import FINGERPRINT_SHINGLE_WORDS, FINGERPRINT_SKETCH_SIZE, SOFT_404_MARKERS
+from extractors import EmailExtractor
+
+# Blocs sans texte visible, puis balises restantes
+INVISIBLE_RE = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>|<!--.*?-->', re.I | re.S)
+TAG_RE = re.compile(r'<[^>]*>')
+WORD_RE = re.compile(r'\w+')
+
+TITLE_RE = re.compile(r'<title\b[^>]*>(.*?)</title\s*>', re.I | re.S)
+H1_RE = re.compile(r'<h1\b[^>]*>(.*?)</h1\s*>', re.I | re.S)
+# Mots entiers seulement : 'erreur 404' mais pas 'erreur 4040'
+SOFT_404_RE = re.compile('|'.join(rf'\b{re.escape(marker)}\b' for marker in SOFT_404_MARKERS), re.I)
+# Titre réduit au code d'erreur
+BARE_404_RE = re.compile(r'^\W*404\W*$')
+
+
+def page_words(html: str) -> List[str]:
+    """Mots du texte de la page (minuscules, balises et scripts retirés)"""
+    text = TAG_RE.sub(' ', INVISIBLE_RE.sub(' ', html))
+    return WORD_RE.findall(html_lib.unescape(text).lower())
+
+
+class PageFingerprint:
+    """
+    Empreinte d'une page
+    
+    - exact : hachage du texte normalisé (identique = même page)
+    - sketch : MinHash bottom-k, les FINGERPRINT_SKETCH_SIZE plus petites
+      empreintes des fragments de FINGERPRINT_SHINGLE_WORDS mots ; deux
+      esquisses donnent une estimation de la similarité de Jaccard des pages
+    - emails : adresses présentes dans le HTML ; une page qui en montre une
+      nouvelle n'est jamais un quasi-doublon (petit bloc contact ajouté au
+      gabarit commun du site)
+    """
+    
+    def __init__(self, html: str, shingle_words: int = FINGERPRINT_SHINGLE_WORDS,
+                 sketch_size: int = FINGERPRINT_SKETCH_SIZE):
+        """
+        Calcule l'empreinte
+        
+        Args:
+            html: Contenu HTML décodé
+            shingle_words: Mots par fragment
+            sketch_size: Empreintes de fragments gardées
+        """
+        words = page_words(html)
+        text = ' '.join(words)
+        self.exact = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        
+        shingles = {
+            zlib.crc32(' '.join(words[i:i + shingle_words]).encode('utf-8'))
+            for i in range(max(len(words) - shingle_words + 1, 1))
+        }
+        self.sketch = sorted(shingles)[:sketch_size]
+        self.sketch_size = sketch_size
+        self.emails = frozenset(raw_email.lower() for raw_email, _, _ in EmailExtractor.scan(html))
+    
+    def is_duplicate_of(self, other: 'PageFingerprint', threshold: float) -> bool:
+        """
+        Vérifie si la page n'apporte rien par rapport à une page déjà vue
+        
+        Args:
+            other: Empreinte de la page déjà vue
+            threshold: Similarité à partir de laquelle les pages sont des quasi-doublons
+        
+        Returns:
+            True si texte identique, ou quasi identique sans nouvelle adresse email
+        """
+        if self.exact == other.exact:
+            return True
+        return self.emails <= other.emails and self.similarity(other) >= threshold
+    
+    def similarity(self, other: 'PageFingerprint') -> float:
+        """
+        Similarité estimée avec une autre page (0 = rien en commun, 1 = identiques)
+        
+        Args:
+            other: Empreinte de l'autre page
+        
+        Returns:
+            Estimation de la similarité de Jaccard des deux pages
+        """
+        if self.exact == other.exact:
+            return 1.0
+        
+        mine, theirs = set(self.sketch), set(other.sketch)
+        union = sorted(mine | theirs)[:self.sketch_size]
+        if not union:
+            return 1.0
+        return sum(1 for value in union if value in mine and value in theirs) / len(union)
+
+
+def is_soft_404(html: str, emails: frozenset = frozenset()) -> bool:
+    """
+    Détecte une page « introuvable » servie avec un code 200
+    
+    Une page qui montre une adresse email n'est jamais écartée : mieux vaut
+    extraire un gabarit d'erreur que perdre une vraie page de contact.
+    
+    Args:
+        html: Contenu HTML décodé
+        emails: Adresses présentes dans la page (PageFingerprint.emails)
+    
+    Returns:
+        True si le titre ou le premier <h1> contient un des SOFT_404_MARKERS
+        (ou se réduit à « 404 ») et que la page ne montre aucune adresse
+    """
+    if emails:
+        return False
+    for pattern in (TITLE_RE, H1_RE):
+        match = pattern.search(html)
+        if match:
+            heading = html_lib.unescape(TAG_RE.sub(' ', match.group(1))).replace('\u2019', "'")
+            if SOFT_404_RE.search(heading) or BARE_404_RE.match(heading):
+                return True
+    return False
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Frontière de crawl d'un site : pages à visiter, dédupliquées et ordonnées par score
+"""
+
+import heapq
+import itertools
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urldefrag
+
+
+def url_key(url: str) -> str:
+    """Clé de déduplication d'une URL (sans fragment ni / final)"""
+    return urldefrag(url)[0].rstrip('/')
+
+
+class CrawlFrontier:
+    """
+    Pages candidates d'un site, la mieux notée sortant en premier
+    
+    Chaque page est notée à son ajout (lien trouvé, sitemap, page devinée) ;
+    une page retrouvée avec un meilleur score est remontée. Un bonus externe
+    (rendement historique du chemin) s'ajoute au score et peut écarter une page.
+    """
+    
+    def __init__(self, bonus: Optional[Callable[[str], Optional[float]]] = None):
+        """
+        Initialise une frontière vide
+        
+        Args:
+            bonus: Fonction url -> bonus ajouté au score (None = page écartée)
+        """
+        self.bonus = bonus or (lambda url: 0.0)
+        self._scores: Dict[str, Tuple[float, str]] = {}  # clé -> (score de base, URL)
+        self._totals: Dict[str, float] = {}  # clé -> score total de l'entrée valide du tas
+        self._heap: List[Tuple[float, int, str]] = []  # (-score total, ordre d'ajout, clé)
+        self._taken: Set[str] = set()
+        self._order = itertools.count()
+    
+    def push(self, url: str, score: float) -> bool:
+        """
+        Ajoute une page (ou remonte son score)
+        
+        Args:
+            url: URL de la page
+            score: Score de base
+        
+        Returns:
+            True si la page est (re)placée dans la frontière
+        """
+        key = url_key(url)
+        if key in self._taken:
+            return False
+        
+        current = self._scores.get(key)
+        if current is not None and current[0] >= score:
+            return False
+        
+        self._scores[key] = (score, urldefrag(url)[0])
+        return self._enqueue(key)
+    
+    def _enqueue(self, key: str) -> bool:
+        """Place une page dans le tas avec son score total (False si le bonus l'écarte)"""
+        score, url = self._scores[key]
+        bonus = self.bonus(url)
+        if bonus is None:
+            self._totals.pop(key, None)
+            return False
+        self._totals[key] = score + bonus
+        heapq.heappush(self._heap, (-self._totals[key], next(self._order), key))
+        return True
+    
+    def pop(self) -> Optional[str]:
+        """
+        Retire la page la mieux notée
+        
+        Returns:
+            URL de la page, None si la frontière est vide
+        """
+        while self._heap:
+            neg_score, _, key = heapq.heappop(self._heap)
+            # Entrée périmée : page déjà sortie, remontée depuis ou écartée
+            if key in self._taken or self._totals.get(key) != -neg_score:
+                continue
+            self._taken.add(key)
+            return self._scores[key][1]
+        return None
+    
+    def rescore(self):
+        """Recalcule les scores totaux après un changement du bonus (ex: CMS détecté)"""
+        self._heap = []
+        self._totals = {}
+        for key in self._scores:
+            if key not in self._taken:
+                self._enqueue(key)
+    
+    def __len__(self) -> int:
+        """Nombre de pages en attente (entrées périmées comprises)"""
+        return len(self._heap)
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+Modèle de page HTML analysée une seule fois et partagée par tous les extracteurs
+"""
+
+from bisect import bisect_right
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+import logging
+from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
+from bs4.element import CData, NavigableString
+
+from config import HTML_PARSER, HTML_SECTIONS
+
+logger = logging.getLogger(__name__)
+
+# Moteurs de parsing BeautifulSoup, du plus rapide au plus lent
+# (lxml est optionnel : non installé sous Windows, voir requirements.txt)
+PARSER_BACKENDS = ['lxml', 'html.parser']
+
+
+def available_parsers() -> List[str]:
+    """
+    Liste les moteurs de parsing installés
+    
+    Returns:
+        Noms des moteurs disponibles, du plus rapide au plus lent
+    """
+    return [name for name in PARSER_BACKENDS if builder_registry.lookup(name) is not None]
+
+
+def select_parser(preferred: str = HTML_PARSER) -> str:
+    """
+    Choisit le moteur de parsing à utiliser
+    
+    Args:
+        preferred: Moteur demandé ('auto' = le plus rapide disponible)
+    
+    Returns:
+        Nom du moteur (repli sur html.parser, toujours disponible)
+    """
+    if preferred != 'auto':
+        if builder_registry.lookup(preferred) is not None:
+            return preferred
+        logger.warning(f"Moteur HTML '{preferred}' indisponible, sélection automatique")
+    
+    return available_parsers()[0]
+
+
+# Moteur choisi une fois pour toutes au démarrage
+PARSER = select_parser()
+logger.debug(f"Moteur de parsing HTML: {PARSER}")
+
+# Chaînes prises en compte par soup.get_text() (ni commentaires, ni scripts, ni styles)
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+
+def compile_section_selectors(sections: Dict[str, List[str]] = HTML_SECTIONS) -> List[Tuple]:
+    """
+    Prépare les sélecteurs de HTML_SECTIONS pour un test direct sur un élément
+    
+    Formes reconnues : 'balise', '.classe', '#id' et '[class*="texte"]'.
+    
+    Args:
+        sections: Dictionnaire {section: [sélecteurs CSS]}
+    
+    Returns:
+        Liste (section, balises, classes, ids, sous-chaînes de classe), dans l'ordre de priorité
+    """
+    compiled = []
+    for section_name, selectors in sections.items():
+        names, classes, ids, class_parts = set(), set(), set(), []
+        for selector in selectors:
+            if selector.startswith('.'):
+                classes.add(selector[1:])
+            elif selector.startswith('#'):
+                ids.add(selector[1:])
+            elif selector.startswith('[class*='):
+                class_parts.append(selector[len('[class*='):-1].strip('"\''))
+            elif selector.isalnum():
+                names.add(selector)
+            else:
+                raise ValueError(f"Sélecteur de section non géré: {selector}")
+        compiled.append((section_name, names, classes, ids, class_parts))
+    return compiled
+
+
+SECTION_SELECTORS = compile_section_selectors()
+
+
+def match_section(tag: Tag) -> Optional[str]:
+    """Section prioritaire désignée par l'élément lui-même (None si aucune)"""
+    classes = tag.get('class') or []
+    if isinstance(classes, str):
+        classes = classes.split()
+    class_attr = ' '.join(classes)
+    element_id = tag.get('id')
+    
+    for section_name, names, section_classes, ids, class_parts in SECTION_SELECTORS:
+        if (tag.name in names or element_id in ids
+                or any(name in section_classes for name in classes)
+                or any(part in class_attr for part in class_parts)):
+            return section_name
+    return None
+
+
+class SectionIndex:
+    """
+    Sections (footer, header, contact, legal, sidebar) de tous les éléments
+    d'une page, calculées en un seul parcours de l'arbre
+    
+    Un élément appartient à la section la plus prioritaire (ordre de
+    HTML_SECTIONS) désignée par lui-même ou par un de ses ancêtres, 'body' sinon.
+    Le parcours reconstruit aussi le texte de la page (identique à
+    soup.get_text()) en notant la section de chaque morceau et l'étendue du
+    texte de chaque élément de section.
+    """
+    
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Parcourt l'arbre une seule fois
+        
+        Args:
+            soup: Arbre BeautifulSoup de la page
+        """
+        self.tags: List[Tag] = []
+        self._labels: Dict[int, str] = {}
+        pieces: List[str] = []
+        self._piece_starts: List[int] = []
+        self._piece_sections: List[str] = []
+        # Éléments désignés par un sélecteur : (début, fin dans le texte, section)
+        self.roots: List[Tuple[int, int, str]] = []
+        
+        length = 0
+        priority = {section_name: rank for rank, (section_name, *_) in enumerate(SECTION_SELECTORS)}
+        priority['body'] = len(priority)
+        
+        # Pile de (nœud, section héritée) ; un élément est rempilé pour noter la fin de son texte
+        stack = [(child, 'body') for child in reversed(soup.contents)]
+        while stack:
+            node, inherited = stack.pop()
+            
+            if isinstance(node, tuple):
+                # Fin d'un élément de section
+                start, section_name = node
+                self.roots.append((start, length, section_name))
+                continue
+            
+            if isinstance(node, NavigableString):
+                if type(node) in TEXT_STRING_TYPES and node:
+                    pieces.append(node)
+                    self._piece_starts.append(length)
+                    self._piece_sections.append(inherited)
+                    length += len(node)
+                continue
+            
+            own = match_section(node)
+            section_name = inherited
+            if own is not None and priority[own] < priority[inherited]:
+                section_name = own
+            
+            self.tags.append(node)
+            self._labels[id(node)] = section_name
+            
+            if own is not None:
+                stack.append(((length, own), None))
+            stack.extend((child, section_name) for child in reversed(node.contents))
+        
+        self.text = ''.join(pieces)
+        
+        # Bornes des éléments de section, pour repérer les correspondances qui les chevauchent
+        self._boundaries = sorted({offset for start, end, _ in self.roots for offset in (start, end)})
+    
+    def section_of(self, tag: Tag) -> str:
+        """Section d'un élément de la page"""
+        return self._labels.get(id(tag), 'body')
+    
+    def section_at(self, offset: int) -> str:
+        """Section du texte à une position de self.text"""
+        index = bisect_right(self._piece_starts, offset) - 1
+        return self._piece_sections[index] if index >= 0 else 'body'
+    
+    def roots_crossed(self, start: int, end: int) -> List[Tuple[int, int, str]]:
+        """
+        Éléments de section dont une borne tombe à l'intérieur de [start, end)
+        
+        Une correspondance à cheval sur une borne colle du texte extérieur à la
+        section (ex: 'contact@site.frSuite') : la section seule doit être relue.
+        """
+        first = bisect_right(self._boundaries, start)
+        if first >= len(self._boundaries) or self._boundaries[first] >= end:
+            return []
+        return [
+            root for root in self.roots
+            if start < root[0] < end or start < root[1] < end
+        ]
+
+
+class ClassIndex:
+    """
+    Index des classes CSS d'une page : classe (en minuscules) -> éléments
+    
+    Construit en une passe sur les éléments ; une recherche ne parcourt plus
+    l'arbre mais seulement les classes distinctes de la page.
+    """
+    
+    def __init__(self, tags: List[Tag]):
+        """
+        Indexe les classes des éléments
+        
+        Args:
+            tags: Éléments de la page, dans l'ordre du document
+        """
+        self.tags = tags
+        self._positions: Dict[str, List[int]] = {}
+        
+        for position, tag in enumerate(tags):
+            classes = tag.get('class')
+            if not classes:
+                continue
+            if isinstance(classes, str):
+                classes = classes.split()
+            for token in classes:
+                self._positions.setdefault(token.lower(), []).append(position)
+    
+    def find(self, fragment: str) -> List[Tag]:
+        """
+        Éléments dont une classe contient un texte (insensible à la casse)
+        
+        Équivaut à soup.find_all(class_=re.compile(re.escape(fragment), re.I)).
+        
+        Args:
+            fragment: Texte cherché dans les classes (ex: 'fa-facebook')
+        
+        Returns:
+            Éléments trouvés, dans l'ordre du document
+        """
+        fragment = fragment.lower()
+        positions = set()
+        for token, token_positions in self._positions.items():
+            if fragment in token:
+                positions.update(token_positions)
+        return [self.tags[position] for position in sorted(positions)]
+
+
+class ParsedPage:
+    """
+    Page HTML parsée une seule fois
+    
+    L'arbre BeautifulSoup et ses vues dérivées (texte, liens, attributs...) sont
+    calculés à la demande puis mis en cache : les extracteurs d'emails, de
+    réseaux sociaux et la recherche de liens importants travaillent tous sur
+    le même objet au lieu de re-parser le HTML chacun de leur côté.
+    """
+    
+    def __init__(self, html: str, url: str, raw_html: Optional[bytes] = None,
+                 parser: Optional[str] = None):
+        """
+        Initialise la page (le parsing est fait immédiatement)
+        
+        Args:
+            html: Contenu HTML décodé
+            url: URL de la page
+            raw_html: Corps brut de la page (octets), pour les recherches dans le HTML brut
+            parser: Moteur de parsing (défaut : PARSER, choisi au démarrage)
+        """
+        self.html = html
+        self.url = url
+        self.raw_html = raw_html
+        self.parser = parser or PARSER
+        self.soup = BeautifulSoup(html, self.parser)
+    
+    @classmethod
+    def from_html(cls, html, url: str, raw_html: Optional[bytes] = None) -> 'ParsedPage':
+        """Retourne la page telle quelle si déjà parsée, sinon la parse"""
+        if isinstance(html, cls):
+            return html
+        return cls(html, url, raw_html)
+    
+    @property
+    def raw(self):
+        """HTML brut à scanner : octets si disponibles, sinon texte décodé"""
+        return self.raw_html if self.raw_html is not None else self.html
+    
+    @cached_property
+    def sections(self) -> SectionIndex:
+        """Index des sections (un seul parcours de l'arbre)"""
+        return SectionIndex(self.soup)
+    
+    @property
+    def text(self) -> str:
+        """Texte visible de la page (identique à soup.get_text())"""
+        return self.sections.text
+    
+    @property
+    def tags(self) -> List[Tag]:
+        """Tous les éléments de la page, dans l'ordre du document"""
+        return self.sections.tags
+    
+    @cached_property
+    def classes(self) -> ClassIndex:
+        """Index des classes CSS (icônes, etc.)"""
+        return ClassIndex(self.tags)
+    
+    @cached_property
+    def anchors(self) -> List[Tag]:
+        """Liens <a> ayant un attribut href"""
+        return self.soup.find_all('a', href=True)
+    
+    @cached_property
+    def scripts(self) -> List[Tag]:
+        """Balises <script>"""
+        return self.soup.find_all('script')
+    
+    @cached_property
+    def attributes(self) -> List[Tuple[Tag, str, str]]:
+        """Index des attributs texte : liste (élément, nom, valeur), ordre du document"""
+        return [
+            (tag, name, value)
+            for tag in self.tags
+            for name, value in tag.attrs.items()
+            if isinstance(value, str)
+        ]
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Rendement historique des chemins de pages (priorisation apprise)
+
+Chaque page tentée sur un site est comptée par chemin (ex: '/contact') dans
+plusieurs portées : 'global', 'tld:fr', 'cms:wordpress'. Une page est
+productive si elle a apporté au site un email ou un réseau social nouveau.
+Ces statistiques donnent un bonus de score aux pages candidates des sites
+suivants (du même job comme des jobs futurs) et abandonnent les pages
+devinées qui ne rapportent jamais rien. Une page abandonnée est tout de même
+tentée de temps en temps (PATH_STATS_EXPLORE_RATE) et les compteurs anciens
+perdent leur poids (PATH_STATS_MAX_TRIES) : un chemin peut revenir en grâce.
+
+Usage: python path_stats.py [portée] [--min-tries N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from config import (
+    PATH_STATS_FILE, PATH_STATS_SCOPES, PATH_STATS_MIN_TRIES, PATH_STATS_PRUNE_BELOW,
+    PATH_STATS_EXPLORE_RATE, PATH_STATS_MAX_TRIES, PATH_YIELD_WEIGHT
+)
+from utils import extract_domain
+
+logger = logging.getLogger(__name__)
+
+# Compteurs par chemin : pages tentées, pages obtenues (HTML), pages productives
+COUNTERS = ('tries', 'found', 'productive')
+
+
+def path_key(url: str) -> str:
+    """Chemin d'une URL tel que compté dans les statistiques (minuscules, sans / final)"""
+    return urlparse(url).path.lower().rstrip('/') or '/'
+
+
+def site_scopes(site_url: str, cms: Optional[str] = None,
+                scopes: List[str] = PATH_STATS_SCOPES) -> List[str]:
+    """
+    Portées des statistiques d'un site
+    
+    Args:
+        site_url: URL du site
+        cms: CMS détecté sur la page d'accueil (None si inconnu)
+        scopes: Types de portée consultés ('cms', 'tld', 'global'), par ordre de préférence
+    
+    Returns:
+        Clés des portées (ex: ['cms:wordpress', 'tld:fr', 'global'])
+    """
+    keys = []
+    for scope in scopes:
+        if scope == 'cms':
+            if cms:
+                keys.append(f'cms:{cms}')
+        elif scope == 'tld':
+            domain = extract_domain(site_url)
+            if domain and '.' in domain:
+                keys.append(f"tld:{domain.split('.', 1)[1]}")
+        elif scope == 'global':
+            keys.append('global')
+    return keys
+
+
+def _add_counts(target: Dict, source: Dict):
+    """Ajoute des statistiques {portée: {chemin: compteurs}} à d'autres (en place)"""
+    for scope, paths in source.items():
+        scope_stats = target.setdefault(scope, {})
+        for path, counts in paths.items():
+            path_stats = scope_stats.setdefault(path, dict.fromkeys(COUNTERS, 0))
+            for counter in COUNTERS:
+                path_stats[counter] += counts.get(counter, 0)
+
+
+def _decay_counts(stats: Dict, max_tries: int):
+    """Divise par deux (arrondi supérieur) les compteurs des chemins qui dépassent max_tries essais (en place)"""
+    for paths in stats.values():
+        for counts in paths.values():
+            if counts['tries'] > max_tries:
+                for counter in COUNTERS:
+                    counts[counter] = (counts[counter] + 1) // 2
+
+
+class PathStats:
+    """Statistiques de rendement des chemins, persistées dans un fichier JSON"""
+    
+    def __init__(self, stats_file: Optional[str] = PATH_STATS_FILE,
+                 min_tries: int = PATH_STATS_MIN_TRIES,
+                 prune_below: float = PATH_STATS_PRUNE_BELOW,
+                 explore_rate: float = PATH_STATS_EXPLORE_RATE,
+                 max_tries: int = PATH_STATS_MAX_TRIES):
+        """
+        Charge les statistiques existantes
+        
+        Args:
+            stats_file: Fichier JSON des statistiques (None = apprentissage en mémoire seulement)
+            min_tries: Essais d'un chemin avant de se fier à son rendement
+            prune_below: Rendement sous lequel une page devinée est abandonnée
+            explore_rate: Probabilité de tenter quand même une page abandonnée
+            max_tries: Essais au-delà desquels les compteurs d'un chemin sont divisés
+                par deux à la sauvegarde (les observations récentes pèsent plus)
+        """
+        self.stats_file = stats_file
+        self.min_tries = min_tries
+        self.prune_below = prune_below
+        self.explore_rate = explore_rate
+        self.max_tries = max_tries
+        
+        # {portée: {chemin: {tries, found, productive}}}
+        self.stats: Dict[str, Dict[str, Dict[str, int]]] = self._load()
+        # Observations pas encore enregistrées dans le fichier
+        self.delta: Dict[str, Dict[str, Dict[str, int]]] = {}
+    
+    def _load(self) -> Dict:
+        """Lit le fichier des statistiques (vide s'il n'existe pas ou est illisible)"""
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return {}
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Statistiques de chemins illisibles ({self.stats_file}): {e}")
+            return {}
+    
+    def record(self, url: str, scopes: List[str], found: bool, productive: bool):
+        """
+        Compte une page tentée
+        
+        Args:
+            url: URL de la page
+            scopes: Portées du site (voir site_scopes)
+            found: True si la page a été obtenue (HTML)
+            productive: True si elle a apporté un email ou un réseau social nouveau
+        """
+        counts = {path_key(url): {'tries': 1, 'found': int(found), 'productive': int(productive)}}
+        observation = {scope: counts for scope in scopes}
+        _add_counts(self.stats, observation)
+        _add_counts(self.delta, observation)
+    
+    def merge(self, delta: Dict):
+        """Ajoute les observations d'un autre scraper (processus de scraping)"""
+        _add_counts(self.stats, delta)
+        _add_counts(self.delta, delta)
+    
+    def rate(self, url: str, scopes: List[str]) -> Optional[float]:
+        """
+        Rendement d'une page : part des essais productifs dans la portée la plus
+        spécifique qui a assez d'essais
+        
+        Returns:
+            Rendement entre 0 et 1, None si le chemin n'a pas encore assez d'essais
+        """
+        path = path_key(url)
+        for scope in scopes:
+            counts = self.stats.get(scope, {}).get(path)
+            if counts and counts['tries'] >= self.min_tries:
+                return counts['productive'] / counts['tries']
+        return None
+    
+    def bonus(self, url: str, scopes: List[str], prunable: bool = False,
+              weight: float = PATH_YIELD_WEIGHT) -> Optional[float]:
+        """
+        Bonus de score d'une page candidate selon le rendement de son chemin
+        
+        Args:
+            url: URL de la page
+            scopes: Portées du site (voir site_scopes)
+            prunable: True pour une page devinée, abandonnée si son rendement
+                est inférieur à prune_below (sauf tirage d'exploration)
+            weight: Bonus d'un chemin productif à chaque essai
+        
+        Returns:
+            Bonus (0 sans historique suffisant), None si la page est abandonnée
+        """
+        rate = self.rate(url, scopes)
+        if rate is None:
+            return 0.0
+        if prunable and rate < self.prune_below:
+            if random.random() >= self.explore_rate:
+                logger.debug(f"Page devinée abandonnée (rendement {rate:.1%}): {url}")
+                return None
+            logger.debug(f"Page devinée abandonnée, tentée pour exploration (rendement {rate:.1%}): {url}")
+        return weight * rate
+    
+    def save(self):
+        """
+        Ajoute les observations au fichier des statistiques
+        
+        Le fichier est relu juste avant l'écriture : plusieurs workers peuvent
+        l'alimenter l'un après l'autre sans écraser les observations des autres.
+        """
+        if not self.stats_file or not self.delta:
+            return
+        
+        try:
+            stats = self._load()
+            _add_counts(stats, self.delta)
+            _decay_counts(stats, self.max_tries)
+            
+            directory = os.path.dirname(self.stats_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_file = f'{self.stats_file}.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(stats, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_file, self.stats_file)
+            
+            self.stats = stats
+            self.delta = {}
+            logger.info(f"Statistiques de chemins sauvegardées dans {self.stats_file}")
+        except OSError as e:
+            logger.error(f"Erreur lors de la sauvegarde des statistiques de chemins: {e}")
+
+
+def print_stats(stats: PathStats, scope: Optional[str] = None, min_tries: int = 1):
+    """
+    Affiche les statistiques (toutes les portées, ou le détail d'une portée)
+    
+    Args:
+        stats: Statistiques chargées
+        scope: Portée à détailler (ex: 'global', 'tld:fr', 'cms:wordpress')
+        min_tries: Chemins affichés à partir de ce nombre d'essais
+    """
+    scopes = [scope] if scope else sorted(stats.stats)
+    
+    for scope_name in scopes:
+        paths = stats.stats.get(scope_name, {})
+        rows = sorted(
+            ((path, counts) for path, counts in paths.items() if counts['tries'] >= min_tries),
+            key=lambda row: (-row[1]['productive'] / row[1]['tries'], -row[1]['tries'])
+        )
+        
+        print(f"\n{'='*80}")
+        print(f"PORTEE {scope_name} ({len(paths)} chemins)")
+        print(f"{'='*80}")
+        print(f"{'Chemin':<40} {'Essais':>8} {'Trouvees':>9} {'Rendement':>10}")
+        for path, counts in rows:
+            rate = counts['productive'] / counts['tries']
+            flag = '' if counts['tries'] < stats.min_tries else (
+                '  (abandonnee si devinee)' if rate < stats.prune_below else ''
+            )
+            print(f"{path[:40]:<40} {counts['tries']:>8} "
+                  f"{counts['found'] / counts['tries']:>9.0%} {rate:>10.1%}{flag}")
+    print()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Afficher le rendement historique des chemins de pages')
+    parser.add_argument('scope', nargs='?', help='Portée à détailler (ex: global, tld:fr, cms:wordpress)')
+    parser.add_argument('--min-tries', type=int, default=1, help='Nombre minimal d\'essais affichés')
+    parser.add_argument('--file', default=PATH_STATS_FILE, help='Fichier des statistiques')
+    
+    args = parser.parse_args()
+    
+    print_stats(PathStats(args.file), args.scope, args.min_tries)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Limiteur de débit partagé : seaux à jetons par hôte et par adresse IP
+
+Beaucoup de sites d'un job partagent un même serveur (Wix, hébergement
+mutualisé OVH, même CDN) : une IP n'est pas limitée tant qu'elle n'a pas
+répondu 429/503 ; ensuite, en plus du seau de son hôte, chaque requête prend
+un jeton dans le seau de l'IP de l'hôte (connue dès la première connexion).
+
+Le débit s'adapte aux réponses (AIMD) : un 429/503 divise le débit de l'hôte
+et le bloque pendant le Retry-After, chaque réponse normale le fait remonter
+vers le débit nominal. L'attente d'un jeton se fait avant de prendre un
+emplacement de connexion : une requête ralentie ne bloque pas les autres sites.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+
+from config import (
+    DELAY_BETWEEN_REQUESTS, RATE_LIMIT_HOST_BURST, RATE_LIMIT_IP_RATE, RATE_LIMIT_IP_BURST,
+    RATE_LIMIT_MIN_RATE, RATE_LIMIT_DECREASE, RATE_LIMIT_RECOVERY
+)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Lit un en-tête Retry-After (secondes ou date HTTP)
+    
+    Args:
+        value: Valeur de l'en-tête (None si absent)
+    
+    Returns:
+        Secondes à attendre, None si absent ou illisible
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """Seau à jetons : `burst` requêtes d'affilée, puis `rate` requêtes par seconde"""
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialise un seau plein
+        
+        Args:
+            rate: Débit nominal (requêtes par seconde)
+            burst: Capacité du seau
+        """
+        self.nominal_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+    
+    def _refill(self, now: float):
+        """Ajoute les jetons accumulés depuis la dernière mise à jour"""
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+    
+    def delay(self, now: float) -> float:
+        """Secondes avant qu'un jeton soit disponible (0 = tout de suite)"""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+    
+    def take(self, now: float):
+        """Consomme un jeton"""
+        self._refill(now)
+        self.tokens -= 1
+    
+    def slow_down(self, now: float, pause: Optional[float] = None, block: bool = True):
+        """
+        Réduit le débit (réponse 429/503)
+        
+        Args:
+            now: Instant de la réponse
+            pause: Durée du blocage en secondes (None = un intervalle du débit réduit)
+            block: False pour réduire le débit sans bloquer le seau
+        """
+        self.rate = max(RATE_LIMIT_MIN_RATE, self.rate * RATE_LIMIT_DECREASE)
+        if block:
+            # Un seul jeton à la fin du blocage, puis le débit réduit
+            pause = pause if pause is not None else 1 / self.rate
+            self.blocked_until = max(self.blocked_until, now + pause)
+            self.tokens = 1.0
+            self.updated = self.blocked_until
+    
+    def recover(self):
+        """Remonte le débit vers le débit nominal (réponse normale)"""
+        if self.rate < self.nominal_rate:
+            self.rate = min(self.nominal_rate, self.rate + self.nominal_rate * RATE_LIMIT_RECOVERY)
+
+
+class RateLimiter:
+    """Seaux à jetons des hôtes et des adresses IP d'un job"""
+    
+    def __init__(self, host_rate: Optional[float] = None, host_burst: int = RATE_LIMIT_HOST_BURST,
+                 ip_rate: float = RATE_LIMIT_IP_RATE, ip_burst: int = RATE_LIMIT_IP_BURST):
+        """
+        Initialise le limiteur (seaux créés au premier usage)
+        
+        Args:
+            host_rate: Débit nominal par hôte (défaut : 1 / DELAY_BETWEEN_REQUESTS)
+            host_burst: Requêtes d'affilée vers un hôte
+            ip_rate: Débit nominal par adresse IP (une fois l'IP limitée par un 429/503)
+            ip_burst: Requêtes d'affilée vers une adresse IP (une fois l'IP limitée)
+        """
+        self.host_rate = host_rate or 1 / max(DELAY_BETWEEN_REQUESTS, 0.001)
+        self.host_burst = host_burst
+        self.ip_rate = ip_rate
+        self.ip_burst = ip_burst
+        self._hosts: Dict[str, TokenBucket] = {}
+        self._ips: Dict[str, TokenBucket] = {}  # IP ayant déjà répondu 429/503 -> seau
+        self._addresses: Dict[str, str] = {}  # hôte -> adresse IP
+        self._queues: Dict[str, asyncio.Lock] = {}  # file d'attente par hôte
+    
+    def set_address(self, host: str, ip: str):
+        """Associe un hôte à l'adresse IP de sa connexion"""
+        self._addresses[host] = ip
+    
+    def _host_bucket(self, host: str) -> TokenBucket:
+        """Seau de l'hôte (créé au premier usage)"""
+        if host not in self._hosts:
+            self._hosts[host] = TokenBucket(self.host_rate, self.host_burst)
+        return self._hosts[host]
+    
+    def _buckets(self, host: str) -> List[TokenBucket]:
+        """Seaux consultés pour une requête vers l'hôte (hôte, puis son IP si elle est limitée)"""
+        buckets = [self._host_bucket(host)]
+        ip = self._addresses.get(host)
+        if ip in self._ips:
+            buckets.append(self._ips[ip])
+        return buckets
+    
+    def delay(self, host: str) -> float:
+        """Secondes avant qu'une requête vers l'hôte soit permise"""
+        now = time.monotonic()
+        return max(bucket.delay(now) for bucket in self._buckets(host))
+    
+    async def acquire(self, host: str, max_wait: Optional[float] = None) -> bool:
+        """
+        Attend qu'une requête vers l'hôte soit permise, puis consomme ses jetons
+        
+        Les requêtes d'un même hôte passent dans leur ordre d'arrivée ; le délai
+        est recalculé à chaque réveil : un blocage (Retry-After) posé pendant
+        l'attente est respecté.
+        
+        Args:
+            host: Hôte de la requête
+            max_wait: Attente maximale en secondes (None = sans limite)
+        
+        Returns:
+            True si la requête peut partir, False si elle devait attendre plus de max_wait
+        """
+        if host not in self._queues:
+            self._queues[host] = asyncio.Lock()
+        
+        async with self._queues[host]:
+            while True:
+                now = time.monotonic()
+                buckets = self._buckets(host)
+                wait = max(bucket.delay(now) for bucket in buckets)
+                if wait <= 0:
+                    for bucket in buckets:
+                        bucket.take(now)
+                    return True
+                if max_wait is not None and wait > max_wait:
+                    return False
+                await asyncio.sleep(wait)
+    
+    def throttle(self, host: str, retry_after: Optional[float] = None) -> float:
+        """
+        Ralentit un hôte qui a répondu 429/503
+        
+        L'hôte est bloqué pendant Retry-After (à défaut, un intervalle de son
+        débit réduit) ; son IP, limitée dès son premier 429/503, est seulement
+        ralentie, sans blocage : les autres sites du même serveur continuent à
+        leur rythme réduit.
+        
+        Args:
+            host: Hôte limité
+            retry_after: Valeur de Retry-After en secondes (None si absent)
+        
+        Returns:
+            Secondes avant la prochaine requête permise vers l'hôte
+        """
+        now = time.monotonic()
+        ip = self._addresses.get(host)
+        if ip and ip not in self._ips:
+            self._ips[ip] = TokenBucket(self.ip_rate, self.ip_burst)
+        buckets = self._buckets(host)
+        buckets[0].slow_down(now, retry_after)
+        for bucket in buckets[1:]:
+            bucket.slow_down(now, block=False)
+        logger.debug(f"Débit réduit pour {host}: {buckets[0].rate:.2f} requêtes/s")
+        return self.delay(host)
+    
+    def success(self, host: str):
+        """Fait remonter le débit de l'hôte (et de son IP) après une réponse normale"""
+        for bucket in self._buckets(host):
+            bucket.recover()
@@ -58,7 +58,10 @@ async def scrape_from_csv(csv_file: str):
     
     # Créer et lancer le scraper
     scraper = WebScraper()
-    results = await scraper.scrape_multiple_sites(sites)
+    try:
+        results = await scraper.scrape_multiple_sites(sites)
+    finally:
+        await scraper.aclose()
     
     # Créer la version simplifiée
     simplified_results = []
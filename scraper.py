@@ -5,25 +5,48 @@ Scraper principal pour extraire emails et réseaux sociaux
 
 import asyncio
 import httpx
+import multiprocessing
+import queue
 import time
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
 import random
 from datetime import datetime
 import json
 import os
+import weakref
 
 from config import (
-    USER_AGENTS, HTTP_HEADERS, TIMEOUT, DELAY_BETWEEN_REQUESTS,
-    MAX_RETRIES, BACKOFF_FACTOR, MAX_PAGES_PER_SITE, MAX_CONCURRENT_SITES,
-    SITE_TIMEOUT, PAGES_TO_SCRAPE, IMPORTANT_LINK_PATTERNS, RESULTS_DIR
+    USER_AGENTS, HTTP_HEADERS, TIMEOUT,
+    MAX_RETRIES, MAX_PAGES_PER_SITE, MAX_CONCURRENT_SITES,
+    SITE_TIMEOUT, PAGES_TO_SCRAPE, RESULTS_DIR,
+    MAX_CONNECTIONS, MAX_KEEPALIVE_CONNECTIONS, KEEPALIVE_EXPIRY,
+    MAX_CONNECTIONS_PER_HOST, PAGES_IN_FLIGHT_PER_SITE,
+    HEAD_UNRELIABLE_STATUSES, PROBE_DRAIN_BYTES, MAX_PAGE_BYTES, HTML_CONTENT_TYPES,
+    SCAN_RAW_BYTES, EXTRACTION_WORKERS, EXTRACTION_MIN_CHARS, WORKER_PROCESSES,
+    SITE_STOP_IDLE_PAGES, CONTACT_EMAIL_TYPES,
+    SITEMAP_DISCOVERY, SITEMAP_PATHS, SITEMAP_MAX_BYTES, SITEMAP_MAX_FILES,
+    SPECULATIVE_SCORE_PENALTY, NEAR_DUPLICATE_THRESHOLD, THROTTLE_STATUSES, RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_DEFER_WAIT, RETRY_CONCURRENCY, RETRY_TIMEOUT, RETRY_MAX_WAIT, PREFETCH_SITES, PRECONNECT
 )
-from extractors import EmailExtractor, SocialMediaExtractor
+from circuit_breaker import FATAL_FAILURES, CircuitBreaker
+from dns_cache import DNS_CACHE, CachedDNSTransport
+from extractors import LinkExtractor
+from extraction_pool import ExtractionPool, extract_page
+from fingerprint import PageFingerprint, is_soft_404
+from frontier import CrawlFrontier
+from parsing import ParsedPage
+from path_stats import PathStats, site_scopes
+from rate_limiter import RateLimiter, parse_retry_after
+from sitemap import (
+    sitemaps_from_robots, decompress_sitemap, parse_sitemap, child_sitemap_priority,
+    select_important_urls
+)
+from stop_policies import parse_stop_policies
 from utils import (
-    extract_domain, get_base_url, is_valid_url, normalize_url,
-    is_same_domain, detect_page_type, sanitize_filename
+    extract_domain, get_base_url, is_valid_url,
+    detect_page_type, detect_cms, sanitize_filename, decode_html, is_site_email
 )
 
 # Configuration du logging
@@ -37,16 +60,178 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Échecs réseau passagers (voir classify_failure), réessayés dans la passe de reprise
+TRANSIENT_FAILURES = {'timeout', 'read_timeout', 'reset', 'throttled'}
+
+
+def _stop_on_contact_and_social(result: Dict, site_domain: str, idle_pages: int) -> bool:
+    """Un email de contact du site et au moins un réseau social ont été trouvés"""
+    return bool(result['social_media']) and any(
+        email_data['type'] in CONTACT_EMAIL_TYPES and is_site_email(email_data['email'], site_domain)
+        for email_data in result['emails']
+    )
+
+
+def _stop_on_no_new_results(result: Dict, site_domain: str, idle_pages: int) -> bool:
+    """Les SITE_STOP_IDLE_PAGES dernières pages n'ont apporté ni email ni réseau nouveau"""
+    return idle_pages >= SITE_STOP_IDLE_PAGES
+
+
+# Politiques d'arrêt anticipé (noms de stop_policies.STOP_POLICY_NAMES) :
+# nom -> test(résultat du site, domaine, pages sans nouveauté)
+STOP_POLICIES = {
+    'contact_and_social': _stop_on_contact_and_social,
+    'no_new_results': _stop_on_no_new_results,
+}
+
 
 class WebScraper:
     """Scraper web asynchrone pour emails et réseaux sociaux"""
     
-    def __init__(self):
-        """Initialise le scraper"""
+    def __init__(self, stop_policies: Optional[Union[str, List[str]]] = None):
+        """
+        Initialise le scraper
+        
+        Args:
+            stop_policies: Politiques d'arrêt anticipé des sites (voir parse_stop_policies)
+        """
+        self.stop_policies = parse_stop_policies(stop_policies)
         self.visited_urls: Set[str] = set()
         self.results: List[Dict] = []
         self.start_time = None
         
+        # Client HTTP partagé par tous les sites (créé à la première utilisation)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._extraction_pool: Optional[ExtractionPool] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Débit par hôte et par IP (seaux à jetons adaptés aux 429/503)
+        self.rate_limiter = RateLimiter()
+        
+        # Stratégie de sonde apprise par hôte : 'head' (HEAD fiable) ou 'get'
+        self._probe_modes: Dict[str, str] = {}
+        
+        # Statistiques du pool : hit = connexion réutilisée, miss = nouvelle connexion
+        self._known_streams = weakref.WeakSet()
+        self.pool_stats = {'hits': 0, 'misses': 0}
+        
+        # Rendement historique des chemins (ordre et élagage des pages candidates)
+        self.path_stats = PathStats()
+        
+        # Coupe-circuit par hôte (cache négatif des hôtes morts pour tout le job)
+        self.circuit_breaker = CircuitBreaker()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Retourne le client HTTP partagé (pool de connexions keep-alive)
+        
+        Le client est créé une seule fois et réutilisé pour tous les sites :
+        un seul contexte SSL, et les connexions restent ouvertes entre les pages.
+        Les noms d'hôtes sont résolus par le cache DNS du processus (DNS_CACHE).
+        
+        Returns:
+            Client HTTP asyncio
+        """
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+            # Transport explicite : les proxys de l'environnement (HTTP_PROXY...) ne sont pas utilisés
+            self._client = httpx.AsyncClient(
+                headers=HTTP_HEADERS, transport=CachedDNSTransport(DNS_CACHE, limits=limits)
+            )
+        return self._client
+    
+    def get_extraction_pool(self) -> Optional[ExtractionPool]:
+        """
+        Retourne le pool de processus d'extraction (créé à la première utilisation)
+        
+        Returns:
+            Pool d'extraction, ou None si EXTRACTION_WORKERS = 0 (extraction dans la boucle)
+        """
+        if self._extraction_pool is None and EXTRACTION_WORKERS > 0:
+            self._extraction_pool = ExtractionPool(EXTRACTION_WORKERS)
+            logger.info(f"Pool d'extraction démarré ({EXTRACTION_WORKERS} processus)")
+        return self._extraction_pool
+    
+    async def aclose(self):
+        """Ferme le client HTTP partagé, ses connexions et le pool d'extraction"""
+        if self._extraction_pool is not None:
+            self._extraction_pool.shutdown()
+            self._extraction_pool = None
+
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info(
+                f"Pool HTTP fermé ({self.pool_stats['hits']} réutilisations, "
+                f"{self.pool_stats['misses']} nouvelles connexions)"
+            )
+        self._client = None
+    
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """Retourne le sémaphore limitant les requêtes simultanées vers l'hôte de l'URL"""
+        host = self._host_key(url)
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)
+        return self._host_semaphores[host]
+    
+    async def _wait_politeness(self, url: str) -> bool:
+        """
+        Attend que le limiteur de débit autorise une requête vers l'hôte de l'URL
+        
+        L'attente se fait avant de prendre un emplacement de l'hôte : une requête
+        ralentie ne bloque ni les connexions ni les autres sites. Elle est
+        courte : au-delà de RATE_LIMIT_DEFER_WAIT secondes (hôte ralenti ou
+        bloqué par un Retry-After), la requête est abandonnée et la page
+        reportée à la passe de reprise, sans garder l'emplacement du site.
+        
+        Returns:
+            True si la requête peut partir, False si elle devait attendre plus
+            de RATE_LIMIT_DEFER_WAIT secondes
+        """
+        return await self.rate_limiter.acquire(self._host_key(url), RATE_LIMIT_DEFER_WAIT)
+    
+    def _record_connection(self, response: httpx.Response):
+        """
+        Comptabilise la réutilisation (ou non) des connexions pour une réponse
+        
+        L'adresse IP de chaque connexion est transmise au limiteur de débit
+        (seau par IP partagé par les sites d'un même serveur).
+        """
+        for resp in [*response.history, response]:
+            stream = resp.extensions.get('network_stream')
+            if stream is None:
+                continue
+            server_addr = stream.get_extra_info('server_addr')
+            if server_addr:
+                self.rate_limiter.set_address(self._host_key(str(resp.url)), server_addr[0])
+            if stream in self._known_streams:
+                self.pool_stats['hits'] += 1
+            else:
+                self._known_streams.add(stream)
+                self.pool_stats['misses'] += 1
+    
+    def get_pool_stats(self) -> Dict:
+        """
+        Retourne les statistiques de réutilisation du pool de connexions
+        
+        Returns:
+            Dictionnaire {hits, misses, reuse_rate}
+        """
+        total = self.pool_stats['hits'] + self.pool_stats['misses']
+        return {
+            'hits': self.pool_stats['hits'],
+            'misses': self.pool_stats['misses'],
+            'reuse_rate': round(self.pool_stats['hits'] / total * 100, 1) if total > 0 else 0
+        }
+        
     def get_random_user_agent(self) -> str:
         """Retourne un User-Agent aléatoire"""
         return random.choice(USER_AGENTS)
@@ -57,100 +242,449 @@ class WebScraper:
         headers['User-Agent'] = self.get_random_user_agent()
         return headers
     
-    async def check_page_exists(self, client: httpx.AsyncClient, url: str) -> bool:
+    def _host_key(self, url: str) -> str:
+        """Retourne l'hôte d'une URL (clé des caches par hôte)"""
+        return urlparse(url).netloc.lower()
+    
+    async def _head_status(self, client: httpx.AsyncClient, url: str) -> Optional[int]:
         """
-        Vérifie rapidement si une page existe avec une requête HEAD
+        Sonde rapidement une page avec une requête HEAD
+        
+        Seuls les statuts HEAD_UNRELIABLE_STATUSES (HEAD non géré, réponse
+        sans ambiguïté) font passer l'hôte en mode 'get' ; une limitation de
+        débit, une erreur serveur ou réseau ne disent rien de HEAD.
         
         Args:
             client: Client HTTP asyncio
             url: URL à vérifier
             
         Returns:
-            True si page existe (200), False sinon
+            Statut HEAD, None si la réponse ne permet pas de conclure (le GET tranche)
         """
+        host = self._host_key(url)
         try:
-            response = await client.head(url, timeout=5, follow_redirects=True)
-            return response.status_code == 200
-        except Exception:
-            # En cas d'erreur HEAD, on considère que la page existe (pour être sûr)
-            return True
+            # Hôte bloqué (Retry-After) : le GET qui suit abandonne la page
+            if not await self._wait_politeness(url):
+                return None
+            async with self._host_slot(url):
+                response = await client.head(
+                    url, headers=self.get_headers(), timeout=5, follow_redirects=True
+                )
+            self._record_connection(response)
+            self.circuit_breaker.record_success(url)
+            
+            if response.status_code in THROTTLE_STATUSES:
+                self.rate_limiter.throttle(host, parse_retry_after(response.headers.get('retry-after')))
+                return None
+            self.rate_limiter.success(host)
+            
+            if response.status_code in HEAD_UNRELIABLE_STATUSES:
+                logger.debug(f"HEAD non géré sur {host} ({response.status_code}), passage en GET")
+                self._probe_modes[host] = 'get'
+                return None
+            if response.status_code >= 500:
+                return None
+            return response.status_code
+        except Exception as e:
+            # En cas d'erreur HEAD, le GET tranche (il échoue aussitôt si l'hôte
+            # est déclaré mort)
+            self.circuit_breaker.record_failure(url, e)
+            return None
+    
+    def _is_html_response(self, response: httpx.Response) -> bool:
+        """Vérifie via Content-Type qu'une réponse est du HTML (absent = accepté)"""
+        content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+        return not content_type or content_type in HTML_CONTENT_TYPES
+    
+    async def _discard_body(self, response: httpx.Response):
+        """
+        Abandonne le corps d'une réponse non exploitée
+        
+        Un petit corps (page 404...) est lu pour que la connexion retourne au
+        pool ; un gros corps est abandonné (la connexion est alors fermée).
+        """
+        content_length = response.headers.get('content-length', '')
+        if content_length.isdigit() and int(content_length) <= PROBE_DRAIN_BYTES:
+            try:
+                await response.aread()
+            except httpx.HTTPError:
+                pass
     
-    async def fetch_page(self, client: httpx.AsyncClient, url: str, retry: int = 0) -> Optional[str]:
+    async def _read_body(self, response: httpx.Response) -> Tuple[bytes, bool]:
+        """
+        Lit le corps d'une réponse en streaming, limité à MAX_PAGE_BYTES
+        
+        Args:
+            response: Réponse HTTP ouverte en streaming
+            
+        Returns:
+            Tuple (octets lus, True si le corps a été tronqué)
+        """
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_PAGE_BYTES:
+                return b''.join(chunks)[:MAX_PAGE_BYTES], True
+        return b''.join(chunks), False
+    
+    async def fetch_page(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
         """
         Récupère le contenu d'une page
         
         Args:
             client: Client HTTP asyncio
             url: URL à récupérer
-            retry: Nombre de tentatives effectuées
             
         Returns:
             Contenu HTML ou None si erreur
         """
+        fetch = await self._get_page(client, url)
+        return fetch['html']
+    
+    async def _get_page(self, client: httpx.AsyncClient, url: str, timeout: float = TIMEOUT,
+                        retry: bool = False) -> Dict:
+        """
+        Récupère une page et son code HTTP
+        
+        La requête GET est lue en streaming : le statut et le Content-Type sont
+        vérifiés avant de télécharger le corps (ce qui permet de l'utiliser
+        directement comme sonde), et le corps est plafonné à MAX_PAGE_BYTES.
+        Aucune requête vers un hôte dont le circuit est ouvert (sauf, à la
+        reprise, un circuit ouvert pour délais dépassés). Une réponse 429/503
+        ralentit l'hôte (Retry-After respecté). Un seul essai : les échecs
+        passagers sont réessayés plus tard par la passe de reprise.
+        
+        Args:
+            client: Client HTTP asyncio
+            url: URL à récupérer
+            timeout: Délai de la requête en secondes
+            retry: Passe de reprise (délai plus long pour les hôtes lents)
+            
+        Returns:
+            Dictionnaire {status_code (None si erreur réseau), html (None si
+            erreur), body (octets bruts), encoding, truncated, skipped (raison
+            si la page a été ignorée), failure (type d'erreur réseau, voir
+            classify_failure)}
+        """
+        fetch = {
+            'status_code': None, 'html': None, 'body': None, 'encoding': None,
+            'truncated': False, 'skipped': None, 'failure': None
+        }
+        dead_reason = self.circuit_breaker.dead_reason(url)
+        if dead_reason and (not retry or dead_reason in FATAL_FAILURES):
+            logger.debug(f"Hôte injoignable ({dead_reason}), page ignorée: {url}")
+            fetch['failure'] = dead_reason
+            return fetch
+        
+        host = self._host_key(url)
+        retry_after = None
         try:
+            if not await self._wait_politeness(url):
+                logger.warning(f"Hôte limité (Retry-After), page reportée: {url}")
+                fetch['failure'] = 'throttled'
+                return fetch
+            
             logger.info(f"Récupération de {url}")
-            response = await client.get(url, timeout=TIMEOUT, follow_redirects=True)
-            
-            if response.status_code == 200:
-                return response.text
-            elif response.status_code == 429:  # Rate limiting
-                if retry < MAX_RETRIES:
-                    wait_time = BACKOFF_FACTOR ** retry
-                    logger.warning(f"Rate limited sur {url}, attente de {wait_time}s")
-                    await asyncio.sleep(wait_time)
-                    return await self.fetch_page(client, url, retry + 1)
+            async with self._host_slot(url):
+                async with client.stream(
+                    'GET', url, headers=self.get_headers(), timeout=timeout, follow_redirects=True
+                ) as response:
+                    self._record_connection(response)
+                    self.circuit_breaker.record_success(url)
+                    fetch['status_code'] = response.status_code
+                    if response.status_code in THROTTLE_STATUSES:
+                        retry_after = parse_retry_after(response.headers.get('retry-after'))
+                    else:
+                        self.rate_limiter.success(host)
+                    
+                    if response.status_code == 200:
+                        if not self._is_html_response(response):
+                            content_type = response.headers.get('content-type', '')
+                            logger.debug(f"Contenu non HTML ignoré ({content_type}): {url}")
+                            fetch['skipped'] = f"content-type: {content_type}"
+                            return fetch
+                        
+                        body, fetch['truncated'] = await self._read_body(response)
+                        if fetch['truncated']:
+                            logger.warning(f"Page tronquée à {MAX_PAGE_BYTES} octets: {url}")
+                        fetch['body'] = body
+                        fetch['html'], fetch['encoding'] = decode_html(
+                            body, response.headers.get('content-type', ''), fetch['truncated']
+                        )
+                        return fetch
+                    
+                    await self._discard_body(response)
+            
+            if fetch['status_code'] in THROTTLE_STATUSES:  # Rate limiting
+                wait_time = self.rate_limiter.throttle(host, retry_after)
+                logger.warning(f"Rate limited ({fetch['status_code']}) sur {url}, hôte ralenti ({wait_time:.1f}s)")
+                fetch['failure'] = 'throttled'
             else:
-                logger.warning(f"Status code {response.status_code} pour {url}")
-                return None
+                logger.warning(f"Status code {fetch['status_code']} pour {url}")
+            return fetch
                 
-        except httpx.TimeoutException:
+        except httpx.TimeoutException as e:
             logger.error(f"Timeout sur {url}")
-            if retry < MAX_RETRIES:
-                return await self.fetch_page(client, url, retry + 1)
-            return None
+            fetch['failure'] = self.circuit_breaker.record_failure(url, e)
+            return fetch
         except Exception as e:
             logger.error(f"Erreur lors de la récupération de {url}: {e}")
-            if retry < MAX_RETRIES:
-                await asyncio.sleep(1)
-                return await self.fetch_page(client, url, retry + 1)
+            fetch['failure'] = self.circuit_breaker.record_failure(url, e)
+            return fetch
+    
+    def _is_transient(self, fetch: Dict) -> bool:
+        """Vérifie si une page a échoué pour une raison passagère (délai, coupure, 5xx, 429/503)"""
+        if fetch['status_code'] is not None:
+            return fetch['status_code'] >= 500 or fetch['status_code'] in THROTTLE_STATUSES
+        return fetch['failure'] in TRANSIENT_FAILURES
+    
+    async def _fetch_resource(self, client: httpx.AsyncClient, url: str, max_bytes: int) -> Optional[bytes]:
+        """
+        Télécharge un petit fichier (robots.txt, sitemap), plafonné à max_bytes
+        
+        Args:
+            client: Client HTTP asyncio
+            url: URL du fichier
+            max_bytes: Octets lus au maximum (le reste est abandonné)
+        
+        Returns:
+            Contenu (éventuellement tronqué), None si absent ou en erreur
+        """
+        if self.circuit_breaker.dead_reason(url):
+            return None
+        
+        host = self._host_key(url)
+        try:
+            if not await self._wait_politeness(url):
+                return None
+            async with self._host_slot(url):
+                async with client.stream(
+                    'GET', url, headers=self.get_headers(), timeout=5, follow_redirects=True
+                ) as response:
+                    self._record_connection(response)
+                    self.circuit_breaker.record_success(url)
+                    if response.status_code in THROTTLE_STATUSES:
+                        self.rate_limiter.throttle(host, parse_retry_after(response.headers.get('retry-after')))
+                    else:
+                        self.rate_limiter.success(host)
+                    if response.status_code != 200:
+                        await self._discard_body(response)
+                        return None
+                    
+                    chunks = []
+                    size = 0
+                    async for chunk in response.aiter_bytes():
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= max_bytes:
+                            break
+                    return b''.join(chunks)[:max_bytes]
+        except Exception as e:
+            logger.debug(f"Fichier indisponible {url}: {e}")
+            self.circuit_breaker.record_failure(url, e)
             return None
     
-    def find_important_links(self, html: str, base_url: str) -> List[str]:
+    async def _discover_pages(self, client: httpx.AsyncClient, base_url: str) -> List[str]:
+        """
+        Cherche les pages importantes dans robots.txt et les sitemaps du site
+        
+        Les sitemaps déclarés dans robots.txt (sinon SITEMAP_PATHS) sont lus,
+        index compris, dans la limite de SITEMAP_MAX_FILES fichiers et de
+        SITEMAP_MAX_BYTES octets au total.
+        
+        Args:
+            client: Client HTTP asyncio
+            base_url: URL de base du site
+        
+        Returns:
+            Pages importantes trouvées (vide si pas de sitemap exploitable)
+        """
+        budget = SITEMAP_MAX_BYTES
+        
+        robots = await self._fetch_resource(client, urljoin(base_url, '/robots.txt'), budget)
+        sitemaps = []
+        if robots:
+            budget -= len(robots)
+            sitemaps = sitemaps_from_robots(robots, base_url)
+        to_read = sitemaps or [urljoin(base_url, path) for path in SITEMAP_PATHS]
+        
+        read = set()
+        page_urls = []
+        while to_read and len(read) < SITEMAP_MAX_FILES and budget > 0:
+            sitemap_url = to_read.pop(0)
+            if sitemap_url in read:
+                continue
+            read.add(sitemap_url)
+            
+            data = await self._fetch_resource(client, sitemap_url, budget)
+            if not data:
+                continue
+            data = decompress_sitemap(data, budget)
+            budget -= len(data)
+            
+            is_index, locs = parse_sitemap(data)
+            if is_index:
+                # Sitemaps de pages d'abord, articles et produits ensuite
+                to_read = sorted(to_read + locs, key=child_sitemap_priority)
+            else:
+                page_urls.extend(locs)
+        
+        important_urls = select_important_urls(page_urls, base_url)
+        logger.info(
+            f"Sitemap: {len(page_urls)} pages lues dans {len(read)} fichier(s), "
+            f"{len(important_urls)} page(s) importante(s) sur {base_url}"
+        )
+        return important_urls
+    
+    def find_important_links(self, html: Union[str, ParsedPage], base_url: str) -> List[str]:
         """
         Trouve les liens importants dans le HTML (contact, mentions légales, etc.)
         
         Args:
-            html: Contenu HTML
+            html: Contenu HTML, ou page déjà parsée (ParsedPage)
             base_url: URL de base du site
             
         Returns:
             Liste des URLs importantes trouvées
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        important_links = []
+        return LinkExtractor().find_important_links(html, base_url)
+    
+    async def _fetch_candidate(self, client: httpx.AsyncClient, url: str,
+                               speculative: bool = False) -> Optional[Dict]:
+        """
+        Sonde puis récupère une page candidate (exécuté en parallèle par site)
         
-        # Chercher tous les liens
-        all_links = soup.find_all('a', href=True)
+        Stratégie de sonde par hôte (mémorisée pour tout le job) :
+        - page connue (accueil, lien trouvé) : GET direct, sans HEAD
+        - page devinée (PAGES_TO_SCRAPE) : HEAD tant que l'hôte y répond
+          correctement, sinon un seul GET en streaming interrompu si erreur
         
-        for link in all_links:
-            href = link.get('href', '')
+        Args:
+            client: Client HTTP asyncio
+            url: URL à récupérer
+            speculative: True si l'URL est devinée (chemin de PAGES_TO_SCRAPE)
             
-            # Normaliser l'URL
-            full_url = normalize_url(href, base_url)
+        Returns:
+            Résultat du téléchargement (voir _get_page), None si la page n'existe pas
+        """
+        host = self._host_key(url)
+        mode = self._probe_modes.get(host)
+        head_status = None
+        
+        # Vérifier d'abord si la page existe (HEAD request) : 404/410 suffisent,
+        # les autres refus ne sont crus qu'une fois HEAD confirmé sur l'hôte
+        if speculative and mode != 'get':
+            head_status = await self._head_status(client, url)
+            if head_status in (404, 410) or (mode == 'head' and head_status not in (None, 200)):
+                return None
+        
+        fetch = await self._get_page(client, url)
+        status_code = fetch['status_code']
+        
+        # Le GET confirme (ou non) la réponse HEAD ; une limitation de débit ou
+        # une erreur serveur ne prouve rien, l'apprentissage attend une autre page
+        if (head_status is not None and status_code is not None
+                and status_code not in THROTTLE_STATUSES and status_code < 500
+                and self._probe_modes.get(host) is None):
+            self._probe_modes[host] = 'head' if status_code == head_status else 'get'
+        
+        # Sonde GET d'une page devinée : 404/410 = page inexistante, pas un échec
+        if speculative and status_code in (404, 410):
+            return None
+        
+        return fetch
+    
+    async def _extract_page(self, html: str, url: str, site_url: str,
+                            raw_html: Optional[bytes] = None,
+                            base_url: Optional[str] = None) -> Dict:
+        """
+        Parse une page et lance les extracteurs (dans le pool de processus si actif)
+        
+        Les petites pages (< EXTRACTION_MIN_CHARS) restent traitées dans la
+        boucle : l'envoi au processus coûterait plus cher que l'extraction.
+        
+        Args:
+            html: Contenu HTML de la page
+            url: URL de la page
+            site_url: URL du site (filtrage des emails par domaine)
+            raw_html: Corps brut de la page (octets), scanné tel quel si SCAN_RAW_BYTES
+            base_url: URL de base du site si les liens importants sont à chercher
             
-            # Vérifier si c'est du même domaine
-            if not is_same_domain(full_url, base_url):
-                continue
+        Returns:
+            Dictionnaire {emails, social_media, important_links (tuples (URL, score))}
+        """
+        pool = self.get_extraction_pool()
+        if pool is not None and len(html) >= EXTRACTION_MIN_CHARS:
+            # Le texte décodé suffit au processus : inutile d'envoyer aussi les octets
+            return await pool.extract({
+                'html': html, 'url': url, 'site_url': site_url, 'base_url': base_url
+            })
+        
+        return extract_page(
+            html, url, site_url, raw_html if SCAN_RAW_BYTES else None, base_url
+        )
+    
+    def _stop_reason(self, result: Dict, site_domain: str, idle_pages: int) -> Optional[str]:
+        """
+        Évalue les politiques d'arrêt après une page
+        
+        Args:
+            result: Résultat du site (emails non dédupliqués)
+            site_domain: Domaine du site
+            idle_pages: Pages consécutives sans nouvel email ni réseau social
+        
+        Returns:
+            Nom de la première politique satisfaite, None pour continuer
+        """
+        for name in self.stop_policies:
+            if STOP_POLICIES[name](result, site_domain, idle_pages):
+                return name
+        return None
+    
+    def _process_page(self, url: str, extraction: Dict, result: Dict) -> Dict:
+        """
+        Ajoute les emails et réseaux sociaux extraits d'une page au résultat du site
+        
+        Args:
+            url: URL de la page
+            extraction: Résultat de l'extraction de la page (voir _extract_page)
+            result: Résultat du site (complété en place)
             
-            # Vérifier si c'est un lien important
-            for pattern in IMPORTANT_LINK_PATTERNS:
-                import re
-                if re.search(pattern, full_url, re.I) or re.search(pattern, link.get_text(), re.I):
-                    if full_url not in important_links:
-                        important_links.append(full_url)
-                        break
+        Returns:
+            Résultat de la page (pour pages_visited)
+        """
+        page_type = detect_page_type(url)
         
-        return important_links
+        page_result = {
+            'url': url,
+            'type': page_type,
+            'status': 'success',
+            'emails_found': 0,
+            'social_found': 0
+        }
+        
+        # Emails
+        emails = extraction['emails']
+        if emails:
+            result['emails'].extend(emails)
+            page_result['emails_found'] = len(emails)
+            logger.info(f"  ✓ {len(emails)} email(s) trouvé(s) sur {url}")
+        
+        # Réseaux sociaux
+        social_media = extraction['social_media']
+        if social_media:
+            for platform, urls_list in social_media.items():
+                if platform not in result['social_media']:
+                    result['social_media'][platform] = []
+                for social_url in urls_list:
+                    if social_url not in result['social_media'][platform]:
+                        result['social_media'][platform].append(social_url)
+            page_result['social_found'] = sum(len(v) for v in social_media.values())
+            logger.info(f"  ✓ Réseaux sociaux trouvés: {', '.join(social_media.keys())}")
+        
+        return page_result
     
     async def scrape_site(self, site_data: Dict) -> Dict:
         """
@@ -180,7 +714,10 @@ class WebScraper:
             'pages_visited': [],
             'emails': [],
             'social_media': {},
-            'error': None
+            'error': None,
+            'stop_reason': None,
+            'cms': None,
+            'retry_urls': []  # pages en échec passager (retirées par la passe de reprise)
         }
         
         try:
@@ -188,108 +725,257 @@ class WebScraper:
             if not is_valid_url(site_url):
                 result['status'] = 'error'
                 result['error'] = 'URL invalide'
+                result['stop_reason'] = 'invalid_url'
                 return result
             
             base_url = get_base_url(site_url)
+            site_domain = extract_domain(site_url)
             
-            # Initialiser les extracteurs
-            email_extractor = EmailExtractor(site_url)
-            social_extractor = SocialMediaExtractor()
-            
-            # Liste des URLs à visiter
-            urls_to_visit = [site_url]
+            # Hôte déjà déclaré mort dans ce job (site en double, même hôte...)
+            dead_reason = self.circuit_breaker.dead_reason(site_url)
+            if dead_reason:
+                logger.warning(f"Hôte injoignable ({dead_reason}), site ignoré: {site_url}")
+                result['status'] = 'error'
+                result['error'] = f'Hôte injoignable ({dead_reason})'
+                result['stop_reason'] = 'dead_host'
+                return result
             
-            # Ajouter les pages communes à tester
+            # Pages communes à tester (URLs devinées, à sonder)
+            speculative_urls = []
             for page in PAGES_TO_SCRAPE:
                 url = urljoin(base_url, page)
-                if url not in urls_to_visit:
-                    urls_to_visit.append(url)
+                if url != site_url and url not in speculative_urls:
+                    speculative_urls.append(url)
+            speculative = set(speculative_urls)
+            
+            client = self.get_client()
+            scopes = site_scopes(site_url)
+            
+            # Frontière : la page candidate la mieux notée est récupérée en premier
+            # (bonus selon le rendement historique du chemin, CMS inconnu avant l'accueil)
+            frontier = CrawlFrontier(
+                lambda url: self.path_stats.bonus(url, scopes, prunable=url in speculative)
+            )
+            frontier.push(site_url, float('inf'))
+            
+            def push_speculative():
+                for url in speculative_urls:
+                    frontier.push(url, LinkExtractor.score_link(url) - SPECULATIVE_SCORE_PENALTY)
+            
+            def push_known(url: str, score: float):
+                # Page connue (lien, sitemap) : plus besoin de la sonder
+                speculative.discard(url)
+                frontier.push(url, score)
+            
+            # Sitemap lu pendant le téléchargement de l'accueil : les sondes
+            # n'attendent son résultat que s'il ne donne aucune page importante
+            discovery: Optional[asyncio.Task] = None
+            if SITEMAP_DISCOVERY:
+                discovery = asyncio.create_task(self._discover_pages(client, base_url))
+            else:
+                push_speculative()
             
             visited_count = 0
+            pending: Dict[asyncio.Task, str] = {}
             
-            async with httpx.AsyncClient(headers=self.get_headers()) as client:
-                # Timeout global pour le site
-                try:
-                    async with asyncio.timeout(SITE_TIMEOUT):
-                        for url in urls_to_visit:
-                            if visited_count >= MAX_PAGES_PER_SITE:
-                                logger.info(f"Limite de {MAX_PAGES_PER_SITE} pages atteinte")
+            # Nouveautés des dernières pages, pour les politiques d'arrêt
+            seen_emails: Set[str] = set()
+            seen_social: Set[str] = set()
+            idle_pages = 0
+            
+            # Empreintes des pages extraites, pour écarter doublons et fausses 404
+            fingerprints: List[Tuple[PageFingerprint, str]] = []
+            
+            # Timeout global pour le site
+            try:
+                async with asyncio.timeout(SITE_TIMEOUT):
+                    while True:
+                        # Lancer de nouvelles pages tant qu'il reste des emplacements
+                        # (le budget compte les pages déjà récupérées + celles en vol)
+                        while (len(pending) < PAGES_IN_FLIGHT_PER_SITE
+                               and visited_count + len(pending) < MAX_PAGES_PER_SITE):
+                            url = frontier.pop()
+                            if url is None:
                                 break
                             
                             if url in self.visited_urls:
                                 continue
                             
-                            # Vérifier d'abord si la page existe (HEAD request)
-                            if not await self.check_page_exists(client, url):
-                                logger.debug(f"Page inexistante (HEAD), skip: {url}")
-                                continue
+                            task = asyncio.create_task(self._fetch_candidate(
+                                client, url, speculative=url in speculative
+                            ))
+                            pending[task] = url
+                        
+                        if not pending and discovery is None:
+                            if visited_count >= MAX_PAGES_PER_SITE:
+                                logger.info(f"Limite de {MAX_PAGES_PER_SITE} pages atteinte")
+                                result['stop_reason'] = 'max_pages'
+                            else:
+                                result['stop_reason'] = 'no_more_pages'
+                            break
+                        
+                        waiting = [*pending, discovery] if discovery is not None else list(pending)
+                        done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                        
+                        if discovery in done:
+                            done.discard(discovery)
+                            try:
+                                discovered = discovery.result()
+                            except Exception as e:
+                                # Découverte opportuniste : en échec, le site est traité comme sans sitemap
+                                logger.warning(f"Sitemap ignoré pour {base_url}: {type(e).__name__}: {e}")
+                                discovered = []
+                            discovery = None
                             
-                            # Récupérer la page
-                            html = await self.fetch_page(client, url)
+                            # Pages du sitemap (connues, sans sonde), sinon sondes de PAGES_TO_SCRAPE
+                            for url, score in discovered:
+                                push_known(url, score)
+                            if not discovered:
+                                push_speculative()
+                        
+                        for task in done:
+                            url = pending.pop(task)
+                            fetch = task.result()
                             
+                            if fetch is None:
+                                logger.debug(f"Page inexistante (sonde), skip: {url}")
+                                self.path_stats.record(url, scopes, found=False, productive=False)
+                                continue
+                            
+                            html = fetch['html']
                             if html:
                                 self.visited_urls.add(url)
-                                visited_count += 1
-                                
-                                page_type = detect_page_type(url, html)
-                                
-                                page_result = {
-                                    'url': url,
-                                    'type': page_type,
-                                    'status': 'success',
-                                    'emails_found': 0,
-                                    'social_found': 0
-                                }
                                 
-                                # Extraire les emails
-                                emails = email_extractor.extract_emails_from_html(html, url)
-                                if emails:
-                                    result['emails'].extend(emails)
-                                    page_result['emails_found'] = len(emails)
-                                    logger.info(f"  ✓ {len(emails)} email(s) trouvé(s) sur {url}")
+                                # Doublon (accueil servi pour un chemin deviné...) ou fausse 404 :
+                                # ni extraction, ni page comptée dans le budget
+                                fingerprint = PageFingerprint(html)
+                                duplicate_of = next((
+                                    seen_url for seen, seen_url in fingerprints
+                                    if fingerprint.is_duplicate_of(seen, NEAR_DUPLICATE_THRESHOLD)
+                                ), None)
+                                if duplicate_of or (url != site_url and is_soft_404(html, fingerprint.emails)):
+                                    logger.debug(f"Page en double ou introuvable, ignorée: {url}")
+                                    self.path_stats.record(url, scopes, found=False, productive=False)
+                                    duplicate = {
+                                        'url': url,
+                                        'type': detect_page_type(url),
+                                        'status': 'duplicate',
+                                        'reason': 'duplicate' if duplicate_of else 'soft_404',
+                                        'emails_found': 0,
+                                        'social_found': 0
+                                    }
+                                    if duplicate_of:
+                                        duplicate['duplicate_of'] = duplicate_of
+                                    result['pages_visited'].append(duplicate)
+                                    continue
                                 
-                                # Extraire les réseaux sociaux
-                                social_media = social_extractor.extract_social_media(html, url)
-                                if social_media:
-                                    for platform, urls_list in social_media.items():
-                                        if platform not in result['social_media']:
-                                            result['social_media'][platform] = []
-                                        for social_url in urls_list:
-                                            if social_url not in result['social_media'][platform]:
-                                                result['social_media'][platform].append(social_url)
-                                    page_result['social_found'] = sum(len(v) for v in social_media.values())
-                                    logger.info(f"  ✓ Réseaux sociaux trouvés: {', '.join(social_media.keys())}")
+                                fingerprints.append((fingerprint, url))
+                                visited_count += 1
                                 
+                                # Parser la page une seule fois pour tous les extracteurs
+                                # (liens importants cherchés sur chaque page)
+                                extraction = await self._extract_page(
+                                    html, url, site_url, fetch['body'], base_url=base_url
+                                )
+                                page_result = self._process_page(url, extraction, result)
+                                if fetch['truncated']:
+                                    page_result['truncated'] = True
                                 result['pages_visited'].append(page_result)
                                 
-                                # Si c'est la page d'accueil, chercher d'autres liens importants
+                                # Liens importants de la page : dans la frontière, avec leur score
+                                for link, score in extraction['important_links']:
+                                    push_known(link, score)
+                                
+                                # Page d'accueil : CMS connu, scores recalculés avec ses statistiques
                                 if visited_count == 1:
-                                    important_links = self.find_important_links(html, base_url)
-                                    for link in important_links[:5]:  # Limiter à 5 liens supplémentaires
-                                        if link not in urls_to_visit:
-                                            urls_to_visit.append(link)
+                                    result['cms'] = detect_cms(html)
+                                    scopes = site_scopes(site_url, result['cms'])
+                                    frontier.rescore()
                                 
-                                # Délai entre les requêtes
-                                await asyncio.sleep(DELAY_BETWEEN_REQUESTS)
+                                # Politiques d'arrêt : la page a-t-elle apporté du nouveau ?
+                                new_emails = {e['email'] for e in extraction['emails']} - seen_emails
+                                new_social = {u for urls in extraction['social_media'].values() for u in urls} - seen_social
+                                seen_emails |= new_emails
+                                seen_social |= new_social
+                                idle_pages = 0 if new_emails or new_social else idle_pages + 1
+                                self.path_stats.record(
+                                    url, scopes, found=True, productive=bool(new_emails or new_social)
+                                )
+                                
+                                result['stop_reason'] = self._stop_reason(result, site_domain, idle_pages)
+                                if result['stop_reason']:
+                                    logger.info(f"Arrêt anticipé ({result['stop_reason']}) après {visited_count} page(s)")
+                                    break
+                            elif fetch['skipped']:
+                                self.path_stats.record(url, scopes, found=False, productive=False)
+                                result['pages_visited'].append({
+                                    'url': url,
+                                    'type': detect_page_type(url),
+                                    'status': 'skipped',
+                                    'reason': fetch['skipped'],
+                                    'emails_found': 0,
+                                    'social_found': 0
+                                })
                             else:
+                                # Une erreur réseau dit peu du chemin : seuls les codes HTTP comptent
+                                if fetch['status_code'] is not None:
+                                    self.path_stats.record(url, scopes, found=False, productive=False)
+                                if self._is_transient(fetch):
+                                    result['retry_urls'].append(url)
                                 result['pages_visited'].append({
                                     'url': url,
                                     'type': detect_page_type(url),
                                     'status': 'failed',
+                                    'failure': fetch['failure'],
                                     'emails_found': 0,
                                     'social_found': 0
                                 })
-                
-                except asyncio.TimeoutError:
-                    logger.warning(f"Timeout global atteint pour {site_name}")
-                    result['error'] = 'Timeout global'
+                        
+                        # Circuit de l'hôte ouvert (DNS inexistant, connexion refusée...) :
+                        # les autres pages échoueraient de la même façon
+                        if not result['stop_reason'] and self.circuit_breaker.dead_reason(site_url):
+                            logger.warning(f"Hôte injoignable, abandon du site après {visited_count} page(s)")
+                            result['stop_reason'] = 'dead_host'
+            
+                        # Hôte bloqué longtemps (Retry-After) : le site cède sa place aux autres
+                        if (not result['stop_reason']
+                                and self.rate_limiter.delay(self._host_key(site_url)) > RATE_LIMIT_MAX_WAIT):
+                            logger.warning(f"Débit limité par le site, abandon après {visited_count} page(s)")
+                            result['stop_reason'] = 'throttled'
+                        
+                        if result['stop_reason']:
+                            break
+            
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout global atteint pour {site_name}")
+                result['error'] = 'Timeout global'
+                result['stop_reason'] = 'timeout'
+            finally:
+                for task in pending:
+                    task.cancel()
+                if discovery is not None:
+                    discovery.cancel()
+            
+            # Pages interrompues par le timeout du site ou sa limitation de débit : reprises plus tard
+            if result['stop_reason'] in ('timeout', 'throttled'):
+                result['retry_urls'].extend(url for url in pending.values() if url not in result['retry_urls'])
+            # Hôte mort pour de bon (DNS inexistant, refus, TLS) : rien à reprendre
+            if self.circuit_breaker.dead_reason(site_url) in FATAL_FAILURES:
+                result['retry_urls'] = []
             
             # Dédupliquer les emails
             result['emails'] = self._deduplicate_emails(result['emails'])
             
             # Calculer le temps de scraping
             result['scraping_time'] = round(time.time() - start_time, 2)
-            result['status'] = 'success'
+            if result['stop_reason'] == 'dead_host' and visited_count == 0:
+                result['status'] = 'error'
+                result['error'] = f'Hôte injoignable ({self.circuit_breaker.dead_reason(site_url)})'
+            elif result['stop_reason'] == 'throttled' and visited_count == 0:
+                result['status'] = 'error'
+                result['error'] = 'Débit limité par le site (429/503)'
+            else:
+                result['status'] = 'success'
             
             # Résumé
             logger.info(f"\n{'-'*80}")
@@ -298,16 +984,75 @@ class WebScraper:
             logger.info(f"  • Emails trouvés: {len(result['emails'])}")
             logger.info(f"  • Réseaux sociaux: {', '.join(result['social_media'].keys()) if result['social_media'] else 'Aucun'}")
             logger.info(f"  • Temps: {result['scraping_time']}s")
+            logger.info(f"  • Arrêt: {result['stop_reason']}")
             logger.info(f"{'-'*80}\n")
             
         except Exception as e:
             logger.error(f"Erreur lors du scraping de {site_name}: {e}")
             result['status'] = 'error'
             result['error'] = str(e)
+            result['stop_reason'] = 'error'
             result['scraping_time'] = round(time.time() - start_time, 2)
         
         return result
     
+    async def _retry_page(self, client: httpx.AsyncClient, result: Dict, url: str) -> bool:
+        """
+        Réessaie une page en échec passager (passe de reprise) et complète le résultat de son site
+        
+        Args:
+            client: Client HTTP asyncio
+            result: Résultat du site (complété en place)
+            url: URL de la page
+        
+        Returns:
+            True si la page est toujours en échec passager
+        """
+        site_url = result['url']
+        fetch = await self._get_page(client, url, timeout=RETRY_TIMEOUT, retry=True)
+        
+        if fetch['html']:
+            self.visited_urls.add(url)
+            extraction = await self._extract_page(
+                fetch['html'], url, site_url, fetch['body'], base_url=get_base_url(site_url)
+            )
+            page_result = self._process_page(url, extraction, result)
+            result['emails'] = self._deduplicate_emails(result['emails'])
+            if result['status'] == 'error':
+                result['status'] = 'success'
+                result['error'] = None
+            logger.info(f"Page récupérée à la reprise: {url}")
+        elif fetch['skipped']:
+            page_result = {
+                'url': url,
+                'type': detect_page_type(url),
+                'status': 'skipped',
+                'reason': fetch['skipped'],
+                'emails_found': 0,
+                'social_found': 0
+            }
+        else:
+            page_result = {
+                'url': url,
+                'type': detect_page_type(url),
+                'status': 'failed',
+                'failure': fetch['failure'],
+                'emails_found': 0,
+                'social_found': 0
+            }
+        page_result['retried'] = True
+        
+        # Remplace l'échec de la passe principale (absent si la page a été interrompue)
+        pages = result['pages_visited']
+        for i, page in enumerate(pages):
+            if page['url'] == url and page['status'] == 'failed':
+                pages[i] = page_result
+                break
+        else:
+            pages.append(page_result)
+        
+        return self._is_transient(fetch)
+    
     def _deduplicate_emails(self, emails: List[Dict]) -> List[Dict]:
         """Déduplique les emails en gardant la première occurrence"""
         seen = set()
@@ -321,33 +1066,294 @@ class WebScraper:
         
         return deduplicated
     
+    async def _prefetch_site(self, client: httpx.AsyncClient, site_url: str):
+        """
+        Prépare un site de la file pendant que les sites en cours travaillent
+        
+        L'hôte est résolu (cache DNS) puis, avec PRECONNECT, une requête HEAD
+        sur l'accueil ouvre la connexion (TCP + TLS, redirections comprises) qui
+        reste dans le pool keep-alive pour le premier GET du site. Un nom
+        inexistant ou une connexion refusée ouvre le circuit de l'hôte : le site
+        sera ignoré dès son lancement.
+        
+        Args:
+            client: Client HTTP asyncio
+            site_url: URL du site
+        """
+        if not is_valid_url(site_url) or self.circuit_breaker.dead_reason(site_url):
+            return
+        
+        parsed = urlparse(site_url)
+        try:
+            await DNS_CACHE.resolve(parsed.hostname, parsed.port or (443 if parsed.scheme == 'https' else 80))
+        except OSError as e:
+            self.circuit_breaker.record_failure(site_url, e)
+            return
+        
+        if not PRECONNECT:
+            return
+        try:
+            if not await self._wait_politeness(site_url):
+                return
+            async with self._host_slot(site_url):
+                response = await client.head(
+                    site_url, headers=self.get_headers(), timeout=5, follow_redirects=True
+                )
+            self._record_connection(response)
+            self.circuit_breaker.record_success(site_url)
+        except Exception as e:
+            logger.debug(f"Préconnexion impossible {site_url}: {e}")
+            self.circuit_breaker.record_failure(site_url, e)
+    
+    async def _scrape_queue(self, next_site: Callable[[], Awaitable[Optional[Tuple[int, Dict]]]],
+                            deliver: Callable[[int, Dict], None], workers: int = MAX_CONCURRENT_SITES):
+        """
+        Scrape des sites avec une fenêtre glissante, puis une passe de reprise
+        
+        Les pages d'un site en échec passager (délai dépassé, connexion coupée,
+        5xx, 429/503) sont mises de côté plutôt que réessayées sur place : le
+        site libère aussitôt son emplacement. RETRY_CONCURRENCY workers de
+        reprise les réessaient (RETRY_TIMEOUT, MAX_RETRIES essais, à la suite
+        des autres reprises) dès qu'un worker principal n'a plus de site à
+        lancer ; une page d'un hôte bloqué (Retry-After) attend la fin du
+        blocage. Un site est livré une fois toutes ses reprises terminées.
+        
+        Les PREFETCH_SITES sites suivants de la file sont préparés à l'avance
+        (DNS, connexion : voir _prefetch_site) : la résolution et la poignée de
+        main se font pendant le travail des sites en cours.
+        
+        Args:
+            next_site: Coroutine retournant le prochain tuple (index, site), None s'il n'y en a plus
+                (plus appelée après le premier None)
+            deliver: Fonction appelée avec (index, résultat) pour chaque site terminé
+            workers: Nombre de sites scrapés en parallèle
+        """
+        client = self.get_client()
+        retry_queue: asyncio.Queue = asyncio.Queue()
+        # Sites en attente de leurs reprises : index -> [résultat, reprises restantes]
+        waiting: Dict[int, list] = {}
+        slots_idle = asyncio.Event()
+        
+        # Sites sortis de la file, déjà en préparation (None = plus de site)
+        upcoming: asyncio.Queue = asyncio.Queue(maxsize=max(PREFETCH_SITES, 1))
+        prefetches: Set[asyncio.Task] = set()
+        
+        async def prefetcher():
+            while True:
+                item = await next_site()
+                if item is None:
+                    for _ in range(workers):
+                        await upcoming.put(None)
+                    return
+                if PREFETCH_SITES > 0:
+                    task = asyncio.create_task(self._prefetch_site(client, item[1].get('url', '')))
+                    prefetches.add(task)
+                    task.add_done_callback(prefetches.discard)
+                await upcoming.put(item)
+        
+        async def worker():
+            while True:
+                item = await upcoming.get()
+                if item is None:
+                    # Plus de site à lancer : les emplacements libres passent aux reprises
+                    slots_idle.set()
+                    return
+                
+                idx, site = item
+                result = await self.scrape_site(site)
+                retry_urls = result.pop('retry_urls', [])
+                if not retry_urls or MAX_RETRIES < 1:
+                    deliver(idx, result)
+                    continue
+                
+                logger.info(f"{len(retry_urls)} page(s) en échec passager, reprise différée: {result['url']}")
+                waiting[idx] = [result, len(retry_urls)]
+                for url in retry_urls:
+                    retry_queue.put_nowait((idx, url, 1))
+        
+        async def retry_worker():
+            await slots_idle.wait()
+            while True:
+                idx, url, attempt = await retry_queue.get()
+                entry = waiting[idx]
+                
+                # Hôte encore bloqué (Retry-After) : la page revient à la fin du blocage,
+                # sans consommer d'essai ni garder le worker (au-delà de RETRY_MAX_WAIT, elle échoue)
+                delay = self.rate_limiter.delay(self._host_key(url))
+                if RATE_LIMIT_DEFER_WAIT < delay <= RETRY_MAX_WAIT:
+                    loop.call_later(delay, requeue, (idx, url, attempt))
+                    continue
+                
+                try:
+                    transient = await self._retry_page(client, entry[0], url)
+                except Exception as e:
+                    logger.error(f"Erreur lors de la reprise de {url}: {e}")
+                    transient = False
+                
+                if transient and attempt < MAX_RETRIES:
+                    retry_queue.put_nowait((idx, url, attempt + 1))
+                else:
+                    entry[1] -= 1
+                    if entry[1] == 0:
+                        del waiting[idx]
+                        deliver(idx, entry[0])
+                retry_queue.task_done()
+        
+        def requeue(item: Tuple[int, str, int]):
+            # Remise en file puis fin de l'élément repoussé : join() ne voit jamais la file vide
+            retry_queue.put_nowait(item)
+            retry_queue.task_done()
+        
+        loop = asyncio.get_running_loop()
+        retry_workers = [asyncio.create_task(retry_worker()) for _ in range(RETRY_CONCURRENCY)]
+        try:
+            await asyncio.gather(prefetcher(), *[worker() for _ in range(workers)])
+            slots_idle.set()
+            await retry_queue.join()
+        finally:
+            for task in [*retry_workers, *prefetches]:
+                task.cancel()
+        logger.info(f"Cache DNS: {DNS_CACHE.get_stats()}")
+    
     async def scrape_multiple_sites(self, sites: List[Dict]) -> List[Dict]:
         """
         Scrape plusieurs sites en parallèle (limité)
         
+        Fenêtre glissante : MAX_CONCURRENT_SITES workers piochent dans une file
+        commune, un nouveau site démarre dès qu'un emplacement se libère (un site
+        lent ne bloque plus les autres comme avec des batches). Les pages en
+        échec passager sont réessayées ensuite (voir _scrape_queue).
+        
         Args:
             sites: Liste des sites à scraper
             
         Returns:
-            Liste des résultats
+            Liste des résultats (dans l'ordre des sites fournis)
         """
         self.start_time = time.time()
-        results = []
+        results: List[Optional[Dict]] = [None] * len(sites)
+        completed = 0
         
-        # Créer des batches de sites à scraper en parallèle
-        for i in range(0, len(sites), MAX_CONCURRENT_SITES):
-            batch = sites[i:i+MAX_CONCURRENT_SITES]
-            logger.info(f"\n{'#'*80}")
-            logger.info(f"Traitement du batch {i//MAX_CONCURRENT_SITES + 1} ({len(batch)} sites)")
-            logger.info(f"{'#'*80}")
-            
-            tasks = [self.scrape_site(site) for site in batch]
-            batch_results = await asyncio.gather(*tasks)
-            results.extend(batch_results)
-            
+        queue: asyncio.Queue = asyncio.Queue()
+        for idx, site in enumerate(sites):
+            queue.put_nowait((idx, site))
+        
+        async def next_site():
+            try:
+                return queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+        
+        def deliver(idx: int, result: Dict):
+            nonlocal completed
+            results[idx] = result
+            completed += 1
+                
             # Sauvegarder progressivement
-            self._save_progress(results)
+            if completed % MAX_CONCURRENT_SITES == 0 or completed == len(sites):
+                logger.info(f"Progression: {completed}/{len(sites)} sites terminés")
+                self._save_progress([r for r in results if r is not None])
+                
+        await self._scrape_queue(next_site, deliver, min(MAX_CONCURRENT_SITES, len(sites)))
         
+        self.path_stats.save()
+        logger.info(f"Pool HTTP: {self.get_pool_stats()}")
+        return results
+    
+    async def scrape_multiple_sites_in_processes(self, sites: List[Dict],
+                                                 processes: int = WORKER_PROCESSES) -> List[Dict]:
+        """
+        Scrape plusieurs sites répartis sur plusieurs processus
+        
+        Chaque processus fait tourner sa propre boucle asyncio et son propre
+        WebScraper (MAX_CONCURRENT_SITES sites chacun) et pioche dans une file
+        de sites partagée. Cette méthode joue le rôle de coordinateur : elle
+        reçoit les résultats au fil de l'eau et les range dans l'ordre d'entrée.
+        
+        Args:
+            sites: Liste des sites à scraper
+            processes: Nombre de processus de scraping
+        
+        Returns:
+            Liste des résultats (dans l'ordre des sites fournis)
+        """
+        self.start_time = time.time()
+        results: List[Optional[Dict]] = [None] * len(sites)
+        completed = 0
+        
+        # 'spawn' : chaque processus démarre avec une boucle et un client HTTP neufs
+        context = multiprocessing.get_context('spawn')
+        site_queue = context.Queue()
+        result_queue = context.Queue()
+        
+        for item in enumerate(sites):
+            site_queue.put(item)
+        for _ in range(processes):
+            site_queue.put(None)
+        
+        # Pas de daemon : un processus daemon ne peut pas créer son propre pool d'extraction
+        workers = [
+            context.Process(target=_site_process_main,
+                            args=(site_queue, result_queue, self.stop_policies))
+            for _ in range(processes)
+        ]
+        for process in workers:
+            process.start()
+        
+        logger.info(f"Scraping de {len(sites)} sites sur {processes} processus")
+        
+        loop = asyncio.get_running_loop()
+        finished = 0
+        
+        try:
+            while finished < processes:
+                try:
+                    idx, payload = await loop.run_in_executor(None, result_queue.get, True, 1.0)
+                except queue.Empty:
+                    if not any(process.is_alive() for process in workers):
+                        logger.error("Tous les processus de scraping se sont arrêtés avant la fin")
+                        break
+                    continue
+                
+                # Fin d'un processus : il envoie ses statistiques (pool HTTP, chemins)
+                if idx is None:
+                    finished += 1
+                    self.pool_stats['hits'] += payload['pool']['hits']
+                    self.pool_stats['misses'] += payload['pool']['misses']
+                    self.path_stats.merge(payload['path_stats'])
+                    continue
+                
+                results[idx] = payload
+                completed += 1
+                
+                # Sauvegarder progressivement
+                if completed % MAX_CONCURRENT_SITES == 0 or completed == len(sites):
+                    logger.info(f"Progression: {completed}/{len(sites)} sites terminés")
+                    self._save_progress([r for r in results if r is not None])
+        finally:
+            for process in workers:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        
+        # Sites perdus avec un processus arrêté brutalement
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = {
+                    'url': sites[idx].get('url', ''),
+                    'name': sites[idx].get('name', 'Unknown'),
+                    'status': 'error',
+                    'scraping_time': 0,
+                    'pages_visited': [],
+                    'emails': [],
+                    'social_media': {},
+                    'error': 'Processus de scraping interrompu',
+                    'stop_reason': 'error',
+                    'cms': None
+                }
+        
+        self.path_stats.save()
+        logger.info(f"Pool HTTP: {self.get_pool_stats()}")
         return results
     
     def _save_progress(self, results: List[Dict]):
@@ -388,6 +1394,12 @@ class WebScraper:
             for platform, urls in result.get('social_media', {}).items():
                 social_stats[platform] = social_stats.get(platform, 0) + len(urls)
         
+        # Raisons d'arrêt des sites
+        stop_reasons = {}
+        for result in results:
+            reason = result.get('stop_reason')
+            stop_reasons[reason] = stop_reasons.get(reason, 0) + 1
+        
         total_time = round(time.time() - self.start_time, 2) if self.start_time else 0
         avg_time = round(total_time / total_sites, 2) if total_sites > 0 else 0
         
@@ -400,8 +1412,10 @@ class WebScraper:
             'total_emails': total_emails,
             'total_pages_visited': total_pages,
             'social_media_stats': social_stats,
+            'stop_reasons': stop_reasons,
             'total_time_seconds': total_time,
             'average_time_per_site': avg_time,
+            'connection_pool': self.get_pool_stats(),
         }
         
         return report
@@ -435,12 +1449,66 @@ class WebScraper:
         logger.info(f"Total emails: {report['total_emails']}")
         logger.info(f"Total pages visitées: {report['total_pages_visited']}")
         logger.info(f"Réseaux sociaux: {report['social_media_stats']}")
+        logger.info(f"Raisons d'arrêt: {report['stop_reasons']}")
         logger.info(f"Temps total: {report['total_time_seconds']}s")
         logger.info(f"Temps moyen par site: {report['average_time_per_site']}s")
+        logger.info(f"Pool HTTP: {report['connection_pool']}")
         logger.info(f"\nRésultats sauvegardés dans: {json_file}")
         logger.info(f"{'='*80}\n")
 
 
+def _site_process_main(site_queue, result_queue, stop_policies: List[str]):
+    """
+    Point d'entrée d'un processus de scraping (voir scrape_multiple_sites_in_processes)
+    
+    Args:
+        site_queue: File partagée de tuples (index, site), None = plus de site
+        result_queue: File des résultats (index, résultat), puis (None, statistiques du
+            pool HTTP et des chemins)
+        stop_policies: Politiques d'arrêt anticipé du job
+    """
+    asyncio.run(_scrape_from_queue(site_queue, result_queue, stop_policies))
+
+
+async def _scrape_from_queue(site_queue, result_queue, stop_policies: List[str]):
+    """Scrape les sites de la file partagée avec MAX_CONCURRENT_SITES workers (et leur passe de reprise)"""
+    loop = asyncio.get_running_loop()
+    scraper = WebScraper(stop_policies)
+    
+    # Une seule place : un site n'est retiré de la file partagée que lorsque
+    # _scrape_queue en demande un. Chaque processus réserve ainsi, en plus de ses
+    # sites en cours, jusqu'à PREFETCH_SITES sites en préparation (et celui-ci) ;
+    # les autres processus gardent le reste
+    local_queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    stop = asyncio.Event()
+    
+    async def feeder():
+        # Attente bornée de la file partagée : le thread qui attend rend la main
+        # régulièrement et le feeder s'arrête si _scrape_queue a échoué
+        while not stop.is_set():
+            try:
+                item = await loop.run_in_executor(None, site_queue.get, True, 1.0)
+            except queue.Empty:
+                continue
+            # Un seul None : _scrape_queue arrête de demander des sites au premier
+            await local_queue.put(item)
+            if item is None:
+                return
+    
+    def deliver(idx: int, result: Dict):
+        result_queue.put((idx, result))
+    
+    try:
+        await asyncio.gather(feeder(), scraper._scrape_queue(local_queue.get, deliver))
+    finally:
+        stop.set()
+        await scraper.aclose()
+        result_queue.put((None, {
+            'pool': dict(scraper.pool_stats),
+            'path_stats': scraper.path_stats.delta
+        }))
+
+
 async def main():
     """Fonction principale"""
     # Exemple d'utilisation
@@ -462,7 +1530,10 @@ async def main():
     logger.info(f"Démarrage du scraping de {len(sites)} sites...")
     
     # Scraper tous les sites
-    results = await scraper.scrape_multiple_sites(sites)
+    try:
+        results = await scraper.scrape_multiple_sites(sites)
+    finally:
+        await scraper.aclose()
     
     # Générer le rapport
     report = scraper.generate_report(results)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Lecture de robots.txt et des sitemaps pour trouver les pages importantes d'un site
+
+Le téléchargement est fait par le scraper (client HTTP partagé, politesse par
+hôte) ; ce module ne contient que l'analyse des fichiers et le choix des pages.
+"""
+
+import html
+import re
+import zlib
+from typing import List, Tuple
+from urllib.parse import urljoin, urlparse
+
+from config import SITEMAP_MAX_PAGES
+from extractors import LinkExtractor
+from utils import is_same_domain
+
+# Déclarations 'Sitemap: https://...' de robots.txt
+ROBOTS_SITEMAP_RE = re.compile(rb'^[ \t]*sitemap[ \t]*:[ \t]*(\S+)', re.I | re.M)
+
+# Adresses d'un sitemap (<loc>, éventuellement en CDATA) ; tolère un fichier tronqué
+LOC_RE = re.compile(rb'<(?:\w+:)?loc>\s*(?:<!\[CDATA\[)?\s*(.*?)\s*(?:\]\]>)?\s*</(?:\w+:)?loc>', re.I | re.S)
+SITEMAP_INDEX_RE = re.compile(rb'<(?:\w+:)?sitemapindex[\s>]', re.I)
+
+# Fichiers qui ne sont pas des pages HTML
+NON_HTML_EXTENSIONS = (
+    '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg',
+    '.zip', '.doc', '.docx', '.xls', '.xlsx', '.mp4', '.mp3', '.xml'
+)
+
+# Sitemaps d'un index lus en priorité : pages avant articles, produits et médias
+CHILD_SITEMAP_HINTS = [('page', 0), ('post', 2), ('product', 2), ('image', 3), ('video', 3)]
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def sitemaps_from_robots(robots: bytes, base_url: str) -> List[str]:
+    """
+    Sitemaps déclarés dans robots.txt
+    
+    Args:
+        robots: Contenu de robots.txt
+        base_url: URL de base du site (pour les déclarations relatives)
+    
+    Returns:
+        URLs des sitemaps, dans l'ordre du fichier (déclarations malformées ignorées)
+    """
+    sitemaps = []
+    for match in ROBOTS_SITEMAP_RE.finditer(robots):
+        try:
+            url = urljoin(base_url, match.group(1).decode('utf-8', 'replace'))
+        except ValueError:  # ex. 'http://[bad/' (IPv6 invalide)
+            continue
+        if url not in sitemaps:
+            sitemaps.append(url)
+    return sitemaps
+
+
+def decompress_sitemap(data: bytes, max_bytes: int) -> bytes:
+    """
+    Décompresse un sitemap .gz (au plus max_bytes octets décompressés)
+    
+    Args:
+        data: Contenu téléchargé
+        max_bytes: Taille maximale après décompression
+    
+    Returns:
+        Contenu XML (data tel quel s'il n'est pas compressé, vide si illisible)
+    """
+    if not data.startswith(GZIP_MAGIC):
+        return data
+    try:
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(data, max_bytes)
+    except zlib.error:
+        return b''
+
+
+def parse_sitemap(data: bytes) -> Tuple[bool, List[str]]:
+    """
+    Analyse un sitemap XML (ou un index de sitemaps)
+    
+    Args:
+        data: Contenu XML (éventuellement tronqué)
+    
+    Returns:
+        Tuple (True si c'est un index de sitemaps, adresses <loc>)
+    """
+    is_index = SITEMAP_INDEX_RE.search(data, 0, 2048) is not None
+    locs = [
+        html.unescape(match.group(1).decode('utf-8', 'replace'))
+        for match in LOC_RE.finditer(data)
+    ]
+    return is_index, [loc for loc in locs if loc]
+
+
+def child_sitemap_priority(url: str) -> int:
+    """Rang de lecture d'un sitemap listé dans un index (0 = en premier, URL malformée en dernier)"""
+    try:
+        name = urlparse(url).path.lower().rsplit('/', 1)[-1]
+    except ValueError:
+        return len(CHILD_SITEMAP_HINTS)
+    for hint, rank in CHILD_SITEMAP_HINTS:
+        if hint in name:
+            return rank
+    return 1
+
+
+def select_important_urls(urls: List[str], base_url: str,
+                          limit: int = SITEMAP_MAX_PAGES) -> List[Tuple[str, float]]:
+    """
+    Choisit les pages importantes (contact, mentions légales...) parmi celles d'un sitemap
+    
+    Les pages sont notées sur leur URL comme les liens d'une page
+    (LinkExtractor.score_link), à score égal la plus courte d'abord :
+    '/contact' passe avant '/blog/2021/comment-nous-contacter'.
+    
+    Args:
+        urls: Pages listées dans les sitemaps
+        base_url: URL de base du site
+        limit: Nombre maximal de pages retenues
+    
+    Returns:
+        Liste de tuples (URL, score), par ordre d'intérêt (URLs malformées ignorées)
+    """
+    candidates = {}
+    for url in urls:
+        try:
+            path = urlparse(url).path
+            if path.lower().endswith(NON_HTML_EXTENSIONS) or url in candidates:
+                continue
+            
+            score = LinkExtractor.score_link(url)
+            if score > 0 and is_same_domain(url, base_url):
+                candidates[url] = score
+        except ValueError:  # ex. 'http://[bad/' (IPv6 invalide)
+            continue
+    
+    ranked = sorted(candidates.items(), key=lambda item: (-item[1], len(item[0])))
+    return ranked[:limit]
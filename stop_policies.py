@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Noms et validation des politiques d'arrêt anticipé des sites
+
+Module léger (config seulement) : add_job.py et l'API valident les politiques
+d'un job à la soumission sans importer le scraper ni ses dépendances. Les
+tests de chaque politique sont dans scraper.py (STOP_POLICIES).
+"""
+
+from typing import List, Optional, Union
+
+from config import SITE_STOP_POLICIES
+
+# Politiques disponibles (voir SITE_STOP_POLICIES)
+STOP_POLICY_NAMES = ['contact_and_social', 'no_new_results']
+
+
+def parse_stop_policies(stop_policies: Optional[Union[str, List[str]]]) -> List[str]:
+    """
+    Valide les politiques d'arrêt d'un job
+    
+    Args:
+        stop_policies: Noms des politiques (liste, ou chaîne séparée par des virgules) ;
+            None = SITE_STOP_POLICIES, liste vide = exploration complète
+    
+    Returns:
+        Liste des noms de politiques
+    
+    Raises:
+        ValueError: Si une politique est inconnue (ou si ce n'est pas une liste de noms)
+    """
+    if stop_policies is None:
+        return list(SITE_STOP_POLICIES)
+    if isinstance(stop_policies, str):
+        stop_policies = [name.strip() for name in stop_policies.split(',') if name.strip()]
+    if not isinstance(stop_policies, (list, tuple)) or not all(isinstance(name, str) for name in stop_policies):
+        raise ValueError(
+            f"Politiques d'arrêt invalides: liste de noms attendue "
+            f"(disponibles: {', '.join(STOP_POLICY_NAMES)})"
+        )
+    
+    unknown = [name for name in stop_policies if name not in STOP_POLICY_NAMES]
+    if unknown:
+        raise ValueError(
+            f"Politique d'arrêt inconnue: {', '.join(unknown)} "
+            f"(disponibles: {', '.join(STOP_POLICY_NAMES)})"
+        )
+    return list(stop_policies)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Fixtures communes des tests : sites servis en local (le bac à sable n'a pas de réseau)
+"""
+
+import http.server
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+class SiteHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Sert les pages du dictionnaire `pages` du serveur (chemin -> contenu), 404 sinon
+    
+    Une page peut aussi être une liste de réponses successives (statut, en-têtes,
+    contenu) : chaque requête consomme la première, la dernière est répétée.
+    """
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def _response(self):
+        page = self.server.pages.get(self.path.split('?', 1)[0])
+        if page is None:
+            return 404, {}, 'Not found'
+        if isinstance(page, list):
+            return page.pop(0) if len(page) > 1 else page[0]
+        return 200, {}, page
+    
+    def do_GET(self):
+        status, headers, body = self._response()
+        body = body.encode('utf-8')
+        self.send_response(status)
+        content_type = 'application/xml' if self.path.endswith('.xml') else 'text/html; charset=utf-8'
+        self.send_header('Content-Type', content_type)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_HEAD(self):
+        status, headers, _ = self._response()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def serve_site():
+    """
+    Démarre un site local par appel
+    
+    Returns:
+        Fonction pages -> URL de base ('http://127.0.0.1:<port>/')
+    """
+    servers = []
+    
+    def start(pages):
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+        server.daemon_threads = True
+        server.pages = pages
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}/"
+    
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_dir(tmp_path, monkeypatch):
+    """Fichiers écrits par les tests (progression, résultats) dans un dossier temporaire"""
+    monkeypatch.chdir(tmp_path)
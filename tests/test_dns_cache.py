@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du cache DNS branché sur le client HTTP du scraper
+"""
+
+import asyncio
+
+import httpcore
+import httpx
+import pytest
+
+from dns_cache import DNS_CACHE, CachedDNSTransport, CachedResolverBackend, DNSCache
+from scraper import WebScraper
+
+HOME = "<html><body>Accueil</body></html>"
+
+
+def test_transport_resolves_through_cache(serve_site):
+    url = serve_site({'/': HOME}).replace('127.0.0.1', 'localhost')
+    cache = DNSCache()
+    
+    async def run():
+        # Connection: close : chaque requête ouvre une connexion, donc une résolution
+        async with httpx.AsyncClient(transport=CachedDNSTransport(cache)) as client:
+            for _ in range(2):
+                response = await client.get(url, headers={'Connection': 'close'})
+                assert response.status_code == 200
+    asyncio.run(run())
+    
+    assert cache.get_stats() == {'hits': 1, 'misses': 1, 'entries': 1}
+
+
+def test_scraper_client_uses_shared_cache(serve_site):
+    url = serve_site({'/': HOME}).replace('127.0.0.1', 'localhost')
+    before = dict(DNS_CACHE.stats)
+    scraper = WebScraper()
+    
+    async def run():
+        try:
+            client = scraper.get_client()
+            for _ in range(2):
+                response = await client.get(url, headers={'Connection': 'close'})
+                assert response.status_code == 200
+        finally:
+            await scraper.aclose()
+    asyncio.run(run())
+    
+    lookups = (DNS_CACHE.stats['hits'] - before['hits']) + (DNS_CACHE.stats['misses'] - before['misses'])
+    assert lookups == 2
+    assert DNS_CACHE.stats['hits'] > before['hits']
+
+
+class FakeBackend(httpcore.AsyncNetworkBackend):
+    """Backend de test : adresses IPv6 muettes (jusqu'au délai), IPv4 selon `refused`"""
+    
+    def __init__(self, refused: bool = False):
+        self.refused = refused
+        self.tried = []
+    
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.tried.append(host)
+        if ':' in host:
+            await asyncio.sleep(timeout)
+            raise httpcore.ConnectTimeout(host)
+        if self.refused:
+            raise httpcore.ConnectError(host)
+        return httpcore.AsyncMockStream([])
+
+
+def _connect(backend, addresses, timeout):
+    cache = DNSCache()
+    cache._store('example.fr', addresses, 60)
+    return asyncio.run(CachedResolverBackend(cache, backend).connect_tcp('example.fr', 80, timeout=timeout))
+
+
+def test_silent_ipv6_falls_back_to_ipv4():
+    backend = FakeBackend()
+    
+    stream = _connect(backend, ['2001:db8::1', '2001:db8::2', '192.0.2.1'], timeout=5)
+    
+    assert isinstance(stream, httpcore.AsyncMockStream)
+    # IPv4 essayée en deuxième, sans attendre l'expiration de la première IPv6
+    assert backend.tried == ['2001:db8::1', '192.0.2.1']
+
+
+def test_refusal_is_reported_over_timeout():
+    with pytest.raises(httpcore.ConnectError):
+        _connect(FakeBackend(refused=True), ['2001:db8::1', '192.0.2.1'], timeout=0.5)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la détection des fausses 404
+"""
+
+from fingerprint import PageFingerprint, is_soft_404
+
+
+def test_error_pages_are_soft_404():
+    for html in (
+        "<title>Page introuvable - Garage</title>",
+        "<title>Garage</title><h1>404</h1>",
+        "<h1>Désolé, cette page n’existe pas</h1>",
+        "<title>Erreur 404</title>",
+    ):
+        assert is_soft_404(html), html
+
+
+def test_real_pages_are_kept():
+    for html in (
+        "<title>Garage Peugeot 404 – Contact</title>",
+        "<title>Ce modèle n'existe pas en diesel</title>",
+    ):
+        assert not is_soft_404(html), html
+    
+    # Gabarit d'erreur qui montre une adresse : extrait quand même
+    html = "<title>Page introuvable</title><p>Écrivez-nous : contact@garage-test.fr</p>"
+    assert not is_soft_404(html, PageFingerprint(html).emails)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du scraping réparti sur plusieurs processus
+"""
+
+import asyncio
+import queue
+import threading
+
+from scraper import WebScraper, _scrape_from_queue
+
+HOME = "<html><body><h1>Accueil</h1><a href='/contact'>Contact</a></body></html>"
+CONTACT = "<html><body><p>Contact : 01 23 45 67 89</p></body></html>"
+
+
+def test_scrape_multiple_sites_in_processes(serve_site):
+    sites = [
+        {'url': serve_site({'/': HOME, '/contact': CONTACT}), 'name': 'Site 1'},
+        {'url': serve_site({'/': HOME, '/contact': CONTACT}), 'name': 'Site 2'},
+    ]
+    scraper = WebScraper(stop_policies=[])
+    
+    # Délai de garde : un processus qui ne se termine pas fait échouer le test au lieu de le bloquer
+    results = asyncio.run(asyncio.wait_for(
+        scraper.scrape_multiple_sites_in_processes(sites, processes=2), timeout=60
+    ))
+    
+    assert [result['url'] for result in results] == [site['url'] for site in sites]
+    assert [result['status'] for result in results] == ['success', 'success']
+
+
+def test_process_exits_when_scraping_fails(monkeypatch):
+    async def broken_scrape_queue(self, next_site, deliver, workers=1):
+        await next_site()
+        await asyncio.sleep(0.2)  # le feeder attend déjà le site suivant
+        raise RuntimeError("échec")
+    monkeypatch.setattr(WebScraper, '_scrape_queue', broken_scrape_queue)
+    # File partagée jamais terminée par None : le feeder doit s'arrêter de lui-même
+    site_queue, result_queue = queue.Queue(), queue.Queue()
+    site_queue.put((0, {'url': 'http://127.0.0.1:9/', 'name': 'Site'}))
+    errors = []
+    
+    def run():
+        try:
+            asyncio.run(_scrape_from_queue(site_queue, result_queue, []))
+        except RuntimeError as e:
+            errors.append(e)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=15)
+    
+    assert not thread.is_alive()
+    assert errors
+    assert result_queue.get_nowait()[0] is None
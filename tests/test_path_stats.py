@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du rendement historique des chemins
+"""
+
+import json
+
+from path_stats import PathStats
+
+URL = 'https://garage-test.fr/legal-notice'
+
+
+def _stats(productive: int, tries: int, **kwargs) -> PathStats:
+    stats = PathStats(None, min_tries=20, prune_below=0.02, **kwargs)
+    stats.stats = {'global': {'/legal-notice': {'tries': tries, 'found': tries, 'productive': productive}}}
+    return stats
+
+
+def test_pruned_path_is_still_explored():
+    assert _stats(0, 100, explore_rate=0.0).bonus(URL, ['global'], prunable=True) is None
+    assert _stats(0, 100, explore_rate=1.0).bonus(URL, ['global'], prunable=True) == 0.0
+
+
+def test_old_counts_decay_on_save(tmp_path):
+    stats_file = tmp_path / 'path_stats.json'
+    stats_file.write_text(json.dumps(
+        {'global': {'/legal-notice': {'tries': 1000, 'found': 1000, 'productive': 0}}}
+    ), encoding='utf-8')
+    stats = PathStats(str(stats_file), max_tries=1000)
+    
+    stats.record(URL, ['global'], found=True, productive=True)
+    stats.save()
+    
+    counts = json.loads(stats_file.read_text(encoding='utf-8'))['global']['/legal-notice']
+    assert counts == {'tries': 501, 'found': 501, 'productive': 1}
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Tests des sondes HEAD des pages devinées
+"""
+
+import asyncio
+
+from scraper import WebScraper
+
+CONTACT = "<html><body><p>Écrivez-nous : equipe.test@gmail.com</p></body></html>"
+
+
+def _probe(scraper, urls):
+    async def run():
+        try:
+            client = scraper.get_client()
+            return [await scraper._fetch_candidate(client, url, speculative=True) for url in urls]
+        finally:
+            await scraper.aclose()
+    return asyncio.run(run())
+
+
+def test_throttled_probe_keeps_head_mode(serve_site):
+    # HEAD puis GET limités (429) : rien n'est appris, la page suivante confirme HEAD
+    base_url = serve_site({
+        '/contact': [(429, {}, ''), (429, {}, ''), (200, {}, CONTACT)],
+        '/a-propos': CONTACT,
+    })
+    scraper = WebScraper(stop_policies=[])
+    
+    _probe(scraper, [base_url + 'contact', base_url + 'a-propos'])
+    
+    assert scraper._probe_modes[scraper._host_key(base_url)] == 'head'
+
+
+def test_head_get_mismatch_switches_to_get(serve_site):
+    # HEAD refusé (403) mais GET servi : HEAD n'est pas fiable sur cet hôte
+    base_url = serve_site({'/contact': [(403, {}, ''), (200, {}, CONTACT)]})
+    scraper = WebScraper(stop_policies=[])
+    
+    fetches = _probe(scraper, [base_url + 'contact'])
+    
+    assert fetches[0]['status_code'] == 200
+    assert scraper._probe_modes[scraper._host_key(base_url)] == 'get'
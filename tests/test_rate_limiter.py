@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du limiteur de débit partagé
+"""
+
+from rate_limiter import RateLimiter
+
+
+def test_shared_ip_is_unlimited_until_throttled():
+    limiter = RateLimiter(host_rate=10, host_burst=1, ip_rate=20, ip_burst=5)
+    hosts = [f"site{i}.fr" for i in range(40)]
+    for host in hosts:
+        limiter.set_address(host, '192.0.2.1')
+    
+    # 40 hôtes sur une même IP : aucune attente tant que l'IP n'a pas répondu 429/503
+    assert all(limiter.delay(host) == 0 for host in hosts)
+    
+    limiter.throttle(hosts[0])
+    
+    # IP limitée (sans blocage) et débit réduit de moitié, puis remonté par les réponses normales
+    ip_bucket = limiter._ips['192.0.2.1']
+    assert ip_bucket.rate == 10
+    assert ip_bucket.blocked_until == 0
+    assert limiter.delay(hosts[1]) == 0
+    for _ in range(10):
+        limiter.success(hosts[1])
+    assert ip_bucket.rate == 20
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la passe de reprise et du coupe-circuit
+"""
+
+import asyncio
+import time
+
+import httpx
+
+import scraper as scraper_module
+from scraper import WebScraper
+
+CONTACT = "<html><body><p>Écrivez-nous : equipe.test@gmail.com</p></body></html>"
+
+
+def _failure(cause: BaseException, timeout: bool = False) -> httpx.TransportError:
+    error = (httpx.ConnectTimeout if timeout else httpx.ConnectError)('échec')
+    error.__cause__ = cause
+    return error
+
+
+def _retry(scraper, result, url):
+    async def run():
+        try:
+            return await scraper._retry_page(scraper.get_client(), result, url)
+        finally:
+            await scraper.aclose()
+    return asyncio.run(run())
+
+
+def test_retry_pass_bypasses_timeout_circuit(serve_site):
+    base_url = serve_site({'/contact': CONTACT})
+    url = base_url + 'contact'
+    scraper = WebScraper(stop_policies=[])
+    for _ in range(2):
+        scraper.circuit_breaker.record_failure(url, _failure(TimeoutError(), timeout=True))
+    assert scraper.circuit_breaker.dead_reason(url) == 'timeout'
+    result = {'url': base_url, 'status': 'success', 'error': None, 'pages_visited': [],
+              'emails': [], 'social_media': {}}
+    
+    transient = _retry(scraper, result, url)
+    
+    assert transient is False
+    assert result['pages_visited'][0]['status'] != 'failed'
+    # L'hôte a répondu : son circuit est refermé
+    assert scraper.circuit_breaker.dead_reason(url) is None
+
+
+def test_retry_pass_skips_fatally_dead_host(serve_site):
+    base_url = serve_site({'/contact': CONTACT})
+    url = base_url + 'contact'
+    scraper = WebScraper(stop_policies=[])
+    scraper.circuit_breaker.record_failure(url, _failure(ConnectionRefusedError()))
+    result = {'url': base_url, 'status': 'success', 'error': None, 'pages_visited': [],
+              'emails': [], 'social_media': {}}
+    
+    transient = _retry(scraper, result, url)
+    
+    assert transient is False
+    assert result['pages_visited'][0]['failure'] == 'refused'
+
+
+def test_retry_pass_waits_for_retry_after(serve_site, monkeypatch):
+    # Blocage plus long que ce qu'un site attend (RATE_LIMIT_MAX_WAIT) : la page est reprise à la fin du blocage
+    monkeypatch.setattr(scraper_module, 'RATE_LIMIT_MAX_WAIT', 1)
+    home = "<html><body><a href='/contact'>Contact</a></body></html>"
+    base_url = serve_site({
+        '/': home,
+        '/contact': [(429, {'Retry-After': '2'}, ''), (200, {}, CONTACT)],
+    })
+    scraper = WebScraper(stop_policies=[])
+    
+    async def run():
+        try:
+            return await scraper.scrape_multiple_sites([{'url': base_url, 'name': 'Test'}])
+        finally:
+            await scraper.aclose()
+    started = time.monotonic()
+    result = asyncio.run(run())[0]
+    
+    contact = [page for page in result['pages_visited'] if page['url'].endswith('/contact')]
+    assert contact and contact[0]['status'] == 'success' and contact[0]['retried']
+    assert time.monotonic() - started >= 2
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la découverte des pages par robots.txt et sitemap.xml
+"""
+
+import asyncio
+from urllib.parse import urlparse
+
+import pytest
+
+import scraper as scraper_module
+import sitemap
+from scraper import WebScraper
+from sitemap import child_sitemap_priority, parse_sitemap, select_important_urls, sitemaps_from_robots
+
+BASE_URL = 'http://example.fr/'
+
+ROBOTS = b"User-agent: *\nSitemap: http://[bad/sitemap.xml\nSitemap: /sitemap.xml\n"
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>http://[bad/contact</loc></url>
+  <url><loc>http://example.fr/infos/contact-equipe</loc></url>
+  <url><loc>http://example.fr/blog/article</loc></url>
+</urlset>
+"""
+
+HOME = "<html><body><h1>Accueil</h1><a href='/blog/article'>Blog</a></body></html>"
+CONTACT = "<html><body><p>Écrivez-nous : equipe.test@gmail.com</p></body></html>"
+
+
+def test_malformed_robots_sitemap_is_skipped():
+    assert sitemaps_from_robots(ROBOTS, BASE_URL) == ['http://example.fr/sitemap.xml']
+
+
+def test_malformed_loc_is_skipped():
+    _, locs = parse_sitemap(SITEMAP)
+    assert 'http://[bad/contact' in locs
+    
+    urls = [url for url, _ in select_important_urls(locs, BASE_URL)]
+    assert urls == ['http://example.fr/infos/contact-equipe']
+    assert child_sitemap_priority('http://[bad/page-sitemap.xml') > child_sitemap_priority(
+        'http://example.fr/page-sitemap.xml'
+    )
+
+
+@pytest.fixture
+def sitemap_discovery(monkeypatch):
+    """Découverte par sitemap activée (désactivée par défaut), pour un site local"""
+    monkeypatch.setattr(scraper_module, 'SITEMAP_DISCOVERY', True)
+    # 127.0.0.1 n'a pas de domaine enregistrable : même site = même hôte
+    monkeypatch.setattr(sitemap, 'is_same_domain', lambda url1, url2: urlparse(url1).netloc == urlparse(url2).netloc)
+
+
+def _scrape(base_url, scraper):
+    async def run():
+        try:
+            return await scraper.scrape_site({'url': base_url, 'name': 'Test'})
+        finally:
+            await scraper.aclose()
+    return asyncio.run(run())
+
+
+def test_scrape_site_with_malformed_sitemap_urls(serve_site, sitemap_discovery):
+    pages = {'/': HOME, '/robots.txt': ROBOTS.decode(), '/infos/contact-equipe': CONTACT}
+    base_url = serve_site(pages)
+    # <loc> absolus vers le site local, une fois son port connu
+    pages['/sitemap.xml'] = SITEMAP.decode().replace('http://example.fr/', base_url)
+    
+    result = _scrape(base_url, WebScraper(stop_policies=[]))
+    
+    assert result['status'] == 'success'
+    assert any(page['url'].endswith('/infos/contact-equipe') for page in result['pages_visited'])
+
+
+def test_failed_discovery_falls_back_to_probes(serve_site, sitemap_discovery, monkeypatch):
+    async def broken_discovery(self, client, base_url):
+        raise ValueError("Invalid IPv6 URL")
+    monkeypatch.setattr(WebScraper, '_discover_pages', broken_discovery)
+    base_url = serve_site({'/': HOME, '/contact': CONTACT})
+    
+    result = _scrape(base_url, WebScraper(stop_policies=[]))
+    
+    assert result['status'] == 'success'
+    assert any(page['url'].endswith('/contact') for page in result['pages_visited'])
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Tests de la validation des politiques d'arrêt à la soumission d'un job
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from stop_policies import STOP_POLICY_NAMES, parse_stop_policies
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_parse_stop_policies():
+    assert parse_stop_policies('contact_and_social, no_new_results') == ['contact_and_social', 'no_new_results']
+    assert parse_stop_policies([]) == []
+    for invalid in (['contact_and_socail'], 5, [1]):
+        with pytest.raises(ValueError):
+            parse_stop_policies(invalid)
+
+
+def test_names_match_scraper_registry():
+    from scraper import STOP_POLICIES
+    assert list(STOP_POLICIES) == STOP_POLICY_NAMES
+
+
+def test_add_job_rejects_unknown_policy(tmp_path):
+    json_file = tmp_path / 'sites.json'
+    json_file.write_text('[]', encoding='utf-8')
+    
+    # Sans importer le scraper (ni créer scraper.log dans le dossier courant)
+    process = subprocess.run(
+        [sys.executable, os.path.join(ROOT, 'add_job.py'), str(json_file),
+         '--stop-policies', 'contact_and_socail'],
+        cwd=tmp_path, capture_output=True, text=True
+    )
+    
+    assert process.returncode == 1
+    assert 'contact_and_socail' in process.stdout
+    assert not (tmp_path / 'scraper.log').exists()
+    assert not (tmp_path / 'queue').exists()
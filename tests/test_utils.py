@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du décodage des pages
+"""
+
+from utils import decode_html
+
+
+def test_truncated_utf8_body_is_not_mojibake():
+    body = "<html><body>Société générale, équipe</body></html>".encode('utf-8')
+    # Coupé au milieu du 'é' d'« équipe » (2 octets en UTF-8)
+    cut = body[:body.index('équipe'.encode('utf-8')) + 1]
+    
+    html, encoding = decode_html(cut, truncated=True)
+    
+    assert encoding == 'utf-8'
+    assert html.endswith('Société générale, ')
+
+
+def test_invalid_utf8_still_falls_back():
+    html, encoding = decode_html("<p>Société</p>".encode('windows-1252'), truncated=True)
+    assert html == "<p>Société</p>"
+    assert encoding != 'utf-8'
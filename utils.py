@@ -4,13 +4,40 @@ Fonctions utilitaires pour le scraper
 """
 
 import re
+import codecs
 from urllib.parse import urlparse, urljoin
 import tldextract
-from typing import Optional, Set
+from tldextract.remote import lenient_netloc
+from functools import lru_cache
+from typing import Optional, Set, Tuple
 import logging
 
+from config import CHARSET_SNIFF_BYTES, FALLBACK_ENCODINGS, DOMAIN_CACHE_SIZE, CMS_SIGNATURES
+
 logger = logging.getLogger(__name__)
 
+# Charset annoncé dans le Content-Type et dans une balise <meta> (début du HTML)
+HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+# Comme les navigateurs : latin-1/ascii annoncés sont traités en windows-1252
+CHARSET_ALIASES = {'iso8859-1': 'cp1252', 'ascii': 'cp1252'}
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Liste des suffixes publics embarquée dans tldextract : jamais téléchargée,
+# pas de cache disque (mise à jour avec le paquet tldextract)
+TLD_EXTRACTOR = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def _domain_of_host(hostname: str) -> Optional[str]:
+    """Domaine principal d'un nom d'hôte (mémoïsé : un calcul par hôte)"""
+    extracted = TLD_EXTRACTOR(hostname)
+    if extracted.domain and extracted.suffix:
+        return f"{extracted.domain}.{extracted.suffix}"
+    return None
+
 
 def extract_domain(url: str) -> Optional[str]:
     """
@@ -23,15 +50,78 @@ def extract_domain(url: str) -> Optional[str]:
         Domaine principal (ex: "example.com") ou None si invalide
     """
     try:
-        extracted = tldextract.extract(url)
-        if extracted.domain and extracted.suffix:
-            return f"{extracted.domain}.{extracted.suffix}"
-        return None
+        return _domain_of_host(lenient_netloc(url))
     except Exception as e:
         logger.error(f"Erreur lors de l'extraction du domaine de {url}: {e}")
         return None
 
 
+def _known_encoding(name: Optional[str]) -> Optional[str]:
+    """Retourne le nom normalisé d'un encodage, ou None s'il est inconnu"""
+    if not name:
+        return None
+    try:
+        encoding = codecs.lookup(name.strip().lower()).name
+    except LookupError:
+        return None
+    return CHARSET_ALIASES.get(encoding, encoding)
+
+
+def _decode(body: bytes, encoding: str, errors: str = 'strict', truncated: bool = False) -> str:
+    """Décode des octets ; corps tronqué : un caractère multi-octets coupé à la fin est ignoré"""
+    if truncated:
+        return codecs.getincrementaldecoder(encoding)(errors).decode(body, final=False)
+    return body.decode(encoding, errors)
+
+
+def decode_html(body: bytes, content_type: str = "", truncated: bool = False) -> Tuple[str, str]:
+    """
+    Décode le corps d'une page HTML, du moins coûteux au plus coûteux :
+    BOM, charset du header, <meta charset> dans les premiers octets,
+    UTF-8 strict, puis essai des FALLBACK_ENCODINGS en dernier recours
+    
+    Args:
+        body: Corps de la réponse (octets)
+        content_type: Header Content-Type de la réponse
+        truncated: Corps coupé à MAX_PAGE_BYTES (peut-être au milieu d'un caractère)
+        
+    Returns:
+        Tuple (texte décodé, encodage utilisé)
+    """
+    if body.startswith(codecs.BOM_UTF8):
+        return _decode(body[len(codecs.BOM_UTF8):], 'utf-8', 'replace', truncated), 'utf-8'
+    
+    # 1. Charset annoncé par le serveur
+    match = HEADER_CHARSET_RE.search(content_type)
+    encoding = _known_encoding(match.group(1)) if match else None
+    
+    # 2. Balise <meta charset> / http-equiv dans le début du document
+    if not encoding:
+        match = META_CHARSET_RE.search(body[:CHARSET_SNIFF_BYTES])
+        encoding = _known_encoding(match.group(1).decode('ascii', errors='ignore')) if match else None
+    
+    if encoding:
+        return _decode(body, encoding, 'replace', truncated), encoding
+    
+    # 3. UTF-8 (cas le plus courant sans déclaration)
+    try:
+        return _decode(body, 'utf-8', truncated=truncated), 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    # 4. Encodages de repli (sites francophones : windows-1252 en tête)
+    for name in FALLBACK_ENCODINGS:
+        encoding = _known_encoding(name)
+        if not encoding:
+            continue
+        try:
+            return _decode(body, encoding, truncated=truncated), encoding
+        except UnicodeDecodeError:
+            continue
+    
+    return body.decode('utf-8', errors='replace'), 'utf-8'
+
+
 def get_base_url(url: str) -> str:
     """
     Obtient l'URL de base (protocole + domaine)
@@ -133,6 +223,25 @@ def email_belongs_to_domain(email: str, site_domain: str, known_providers: Set[s
     return False
 
 
+def is_site_email(email: str, site_domain: str) -> bool:
+    """
+    Vérifie si un email est au domaine du site (ou d'un de ses sous-domaines)
+    
+    Args:
+        email: Adresse email (nettoyée)
+        site_domain: Domaine du site scrapé
+    
+    Returns:
+        True si l'email appartient au site
+    """
+    site_domain = (site_domain or '').lower()
+    if not site_domain:
+        return False
+    
+    email_domain = email.rsplit('@', 1)[-1].lower()
+    return email_domain == site_domain or email_domain.endswith('.' + site_domain)
+
+
 def is_valid_email(email: str) -> bool:
     """
     Validation basique d'une adresse email
@@ -232,6 +341,23 @@ def detect_page_type(url: str, content: str = "") -> str:
     return 'other'
 
 
+def detect_cms(html: str) -> Optional[str]:
+    """
+    Détecte le CMS d'un site à partir du HTML d'une page (voir CMS_SIGNATURES)
+    
+    Args:
+        html: Contenu HTML (page d'accueil de préférence)
+    
+    Returns:
+        Nom du CMS, None si non reconnu
+    """
+    html_lower = html.lower()
+    for cms, signatures in CMS_SIGNATURES.items():
+        if any(signature in html_lower for signature in signatures):
+            return cms
+    return None
+
+
 def get_context_around_email(text: str, email: str, context_length: int = 50) -> str:
     """
     Obtient le contexte textuel autour d'un email
@@ -249,18 +375,29 @@ def get_context_around_email(text: str, email: str, context_length: int = 50) ->
         if index == -1:
             return ""
         
-        start = max(0, index - context_length)
-        end = min(len(text), index + len(email) + context_length)
-        
-        context = text[start:end]
-        # Nettoyer les retours à la ligne multiples
-        context = re.sub(r'\s+', ' ', context).strip()
-        
-        return context
+        return get_context_at(text, index, index + len(email), context_length)
     except Exception:
         return ""
 
 
+def get_context_at(text: str, start: int, end: int, context_length: int = 50) -> str:
+    """
+    Obtient le contexte textuel autour d'une position connue (sans recherche)
+    
+    Args:
+        text: Texte complet
+        start: Début de l'email dans le texte
+        end: Fin de l'email dans le texte
+        context_length: Nombre de caractères de contexte de chaque côté
+    
+    Returns:
+        Contexte autour de l'email
+    """
+    context = text[max(0, start - context_length):min(len(text), end + context_length)]
+    # Nettoyer les retours à la ligne multiples
+    return WHITESPACE_RE.sub(' ', context).strip()
+
+
 def classify_email_type(email: str, context: str = "") -> str:
     """
     Classifie le type d'email selon son préfixe et son contexte
@@ -10,15 +10,18 @@ import os
 import time
 from datetime import datetime
 from pathlib import Path
+from config import WORKER_PROCESSES
 from scraper import WebScraper
 
 
 class JobWorker:
     """Worker qui traite les jobs de la queue"""
     
-    def __init__(self):
+    def __init__(self, processes: int = WORKER_PROCESSES):
         self.running = True
         self.current_job = None
+        # Processus de scraping par job (1 = une seule boucle asyncio)
+        self.processes = processes
         
     def get_next_job(self):
         """Récupère le prochain job de la queue (par priorité puis date)"""
@@ -116,8 +119,14 @@ class JobWorker:
             print(f"Scraping de {len(sites)} sites...\n")
             
             # Créer et lancer le scraper
-            scraper = WebScraper()
-            results = await scraper.scrape_multiple_sites(sites)
+            scraper = WebScraper(stop_policies=job.get('stop_policies'))
+            try:
+                if self.processes > 1:
+                    results = await scraper.scrape_multiple_sites_in_processes(sites, self.processes)
+                else:
+                    results = await scraper.scrape_multiple_sites(sites)
+            finally:
+                await scraper.aclose()
             
             # Créer la version simplifiée avec ID original
             simplified_results = []